@@ -6,10 +6,17 @@ Fetches category information for papers from arXiv API.
 
 import requests
 import xml.etree.ElementTree as ET
+import json
 import logging
+import os
+import queue
 import re
+import threading
+import time
 from typing import Optional
 
+from circuit_breaker import CircuitBreaker
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,12 +31,42 @@ class ArxivCategoryClient:
         'arxiv': 'http://arxiv.org/schemas/atom'
     }
     
-    def get_categories(self, arxiv_ids: list[str]) -> dict[str, list[str]]:
+    # arXiv asks clients to leave 3 seconds between requests; hedges never fire sooner
+    MIN_HEDGE_DELAY = 3.0
+    
+    # Hedge delay used until enough latencies have been observed
+    DEFAULT_HEDGE_DELAY = 5.0
+    
+    # Number of recent latencies kept for the p95 estimate
+    LATENCY_WINDOW = 50
+    
+    def __init__(
+        self,
+        state_path: Optional[str] = None,
+        hedge: bool = True,
+        circuit_breaker: Optional[CircuitBreaker] = None
+    ) -> None:
+        """
+        Initialize ArxivCategoryClient.
+        
+        Args:
+            state_path: JSON file persisting latencies and circuit state (None keeps them in memory)
+            hedge: Send a duplicate request when the first one is slower than p95
+            circuit_breaker: Breaker guarding the API (default: 3 failures, 30 min cool-down)
+        """
+        self.state_path = state_path
+        self.hedge = hedge
+        self.circuit_breaker = circuit_breaker or CircuitBreaker("arXiv")
+        self.latencies: list[float] = []
+        self.load()
+    
+    def get_categories(self, arxiv_ids: list[str], timeout: float = 30) -> dict[str, list[str]]:
         """
         Fetch categories for multiple arXiv papers.
         
         Args:
             arxiv_ids: List of arXiv paper IDs (e.g., ["2501.12345", "2501.67890"])
+            timeout: Request timeout in seconds (default: 30)
             
         Returns:
             Dict mapping paper ID to list of categories
@@ -44,6 +81,10 @@ class ArxivCategoryClient:
         if not clean_ids:
             return {}
         
+        if not self.circuit_breaker.allow():
+            logger.warning("Skipping arXiv lookup: circuit open")
+            return {}
+        
         try:
             # Build query with id_list parameter
             id_list = ",".join(clean_ids)
@@ -52,15 +93,155 @@ class ArxivCategoryClient:
                 "max_results": len(clean_ids)
             }
             
-            response = requests.get(self.API_URL, params=params, timeout=30)
-            response.raise_for_status()
+            response = self._hedged_get(params, timeout)
+            self.circuit_breaker.record_success()
             
             return self._parse_categories(response.text)
             
         except requests.RequestException as e:
             logger.error(f"Failed to fetch arXiv categories: {e}")
+            self.circuit_breaker.record_failure()
             return {}
     
+    def list_recent(self, categories: list[str], max_results: int = 100, timeout: float = 30) -> list[dict]:
+        """
+        List the newest submissions in a set of categories.
+        
+        Args:
+            categories: arXiv categories (e.g., ["cs.AI", "cs.CL"])
+            max_results: Maximum number of submissions
+            timeout: Request timeout in seconds (default: 30)
+        
+        Returns:
+            Entries from parse_entries, newest first (empty while the circuit is open)
+        
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        if not self.circuit_breaker.allow():
+            logger.warning("Skipping arXiv listing: circuit open")
+            return []
+        
+        params = {
+            "search_query": " OR ".join(f"cat:{c}" for c in categories),
+            "sortBy": "submittedDate",
+            "sortOrder": "descending",
+            "max_results": max_results
+        }
+        try:
+            response = self._hedged_get(params, timeout)
+            self.circuit_breaker.record_success()
+            return self.parse_entries(response.text)
+        except requests.RequestException:
+            self.circuit_breaker.record_failure()
+            raise
+    
+    def hedge_delay(self) -> float:
+        """
+        Delay after which a duplicate request is sent.
+        
+        Returns:
+            Observed p95 latency, but never less than MIN_HEDGE_DELAY
+        """
+        if len(self.latencies) < 5:
+            return self.DEFAULT_HEDGE_DELAY
+        ordered = sorted(self.latencies)
+        p95 = ordered[int(0.95 * (len(ordered) - 1))]
+        return max(p95, self.MIN_HEDGE_DELAY)
+    
+    def _hedged_get(self, params: dict, timeout: float) -> requests.Response:
+        """
+        GET the API, hedging with one duplicate request if the first is slow.
+        
+        Attempts run on daemon threads so a losing request never delays
+        process exit. The first successful response wins.
+        
+        Args:
+            params: Query parameters
+            timeout: Overall timeout in seconds
+            
+        Returns:
+            The first successful response
+            
+        Raises:
+            requests.RequestException: If every attempt fails or times out
+        """
+        results: queue.Queue = queue.Queue()
+        start = time.monotonic()
+        
+        def attempt(attempt_timeout: float) -> None:
+            began = time.monotonic()
+            try:
+                response = requests.get(self.API_URL, params=params, timeout=attempt_timeout)
+                # A fast 429/503 is a failed attempt, not a winner
+                response.raise_for_status()
+                results.put((response, None, time.monotonic() - began))
+            except requests.RequestException as e:
+                results.put((None, e, time.monotonic() - began))
+        
+        threading.Thread(target=attempt, args=(timeout,), daemon=True).start()
+        pending = 1
+        hedged = False
+        last_error: Optional[requests.RequestException] = None
+        
+        while pending:
+            elapsed = time.monotonic() - start
+            if not hedged and self.hedge:
+                wait = min(self.hedge_delay(), timeout) - elapsed
+            else:
+                wait = timeout - elapsed
+            
+            try:
+                response, error, latency = results.get(timeout=max(wait, 0))
+            except queue.Empty:
+                if hedged or not self.hedge or time.monotonic() - start >= timeout:
+                    break
+                hedged = True
+                remaining = timeout - (time.monotonic() - start)
+                if remaining < 1:
+                    continue
+                logger.info(f"arXiv request slower than {self.hedge_delay():.1f}s, sending hedge")
+                threading.Thread(target=attempt, args=(remaining,), daemon=True).start()
+                pending += 1
+                continue
+            
+            pending -= 1
+            if error is None:
+                self._record_latency(latency)
+                return response
+            last_error = error
+        
+        if last_error is not None and not pending:
+            raise last_error
+        raise requests.Timeout(f"arXiv request timed out after {timeout:.1f}s")
+    
+    def _record_latency(self, latency: float) -> None:
+        """Keep a bounded window of successful request latencies."""
+        self.latencies.append(round(latency, 3))
+        del self.latencies[:-self.LATENCY_WINDOW]
+    
+    def load(self) -> None:
+        """Load latencies and circuit state from the state file."""
+        if not self.state_path or not os.path.exists(self.state_path):
+            return
+        
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.latencies = [float(x) for x in data.get("latencies", [])][-self.LATENCY_WINDOW:]
+            self.circuit_breaker.load_dict(data.get("circuit", {}))
+        except (json.JSONDecodeError, IOError, ValueError) as e:
+            logger.warning(f"Failed to load arXiv client state: {e}")
+    
+    def save(self) -> None:
+        """Save latencies and circuit state to the state file (once per run)."""
+        if not self.state_path:
+            return
+        
+        data = {"latencies": self.latencies, "circuit": self.circuit_breaker.to_dict()}
+        with open(self.state_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+    
     def _clean_arxiv_id(self, arxiv_id: str) -> Optional[str]:
         """
         Clean arXiv ID by removing version suffix.
@@ -96,7 +277,23 @@ class ArxivCategoryClient:
         Returns:
             Dict mapping paper ID to list of categories
         """
-        result = {}
+        return {
+            entry["arxiv_id"]: entry["categories"]
+            for entry in self.parse_entries(xml_content)
+            if entry["categories"]
+        }
+    
+    def parse_entries(self, xml_content: str) -> list[dict]:
+        """
+        Parse entries from an arXiv API Atom feed.
+        
+        Args:
+            xml_content: XML response string
+            
+        Returns:
+            List of dicts with arxiv_id, title, abstract, published_at and categories
+        """
+        result = []
         
         try:
             root = ET.fromstring(xml_content)
@@ -128,14 +325,26 @@ class ArxivCategoryClient:
                     if term and term not in categories:
                         categories.append(term)
                 
-                if categories:
-                    result[arxiv_id] = categories
+                result.append({
+                    "arxiv_id": arxiv_id,
+                    "title": self._entry_text(entry, 'atom:title'),
+                    "abstract": self._entry_text(entry, 'atom:summary'),
+                    "published_at": self._entry_text(entry, 'atom:published'),
+                    "categories": categories
+                })
             
         except ET.ParseError as e:
             logger.error(f"Failed to parse arXiv XML: {e}")
         
         return result
     
+    def _entry_text(self, entry: ET.Element, path: str) -> str:
+        """Whitespace-normalized text of a child element (empty if missing)."""
+        elem = entry.find(path, self.NAMESPACES)
+        if elem is None or elem.text is None:
+            return ""
+        return " ".join(elem.text.split())
+    
     def _extract_id_from_url(self, url: str) -> Optional[str]:
         """
         Extract arXiv ID from URL.
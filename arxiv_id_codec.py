@@ -0,0 +1,141 @@
+"""
+arXiv ID Codec
+
+Packs new-style arXiv IDs into 64-bit integers and keeps ID sets as a sorted
+integer array, with a string fallback for old-style IDs.
+"""
+
+from typing import Iterable, Optional
+
+import numpy as np
+
+# Sequence numbers have five digits from 1501 (January 2015) on, four before
+FIVE_DIGIT_FROM = 1501
+
+SEQUENCE_BASE = 100000
+
+
+def encode_arxiv_id(arxiv_id: Optional[str]) -> Optional[int]:
+    """
+    Pack a new-style arXiv ID as YYMM * 100000 + sequence.
+
+    Only IDs that decode back to the same string are packed, so "2501.1234"
+    (a 4-digit sequence after 2015) or versioned IDs fall back to strings.
+
+    Args:
+        arxiv_id: ID such as "2501.12345" or "0704.0001"
+
+    Returns:
+        Packed integer, or None for old-style or non-canonical IDs
+    """
+    if not arxiv_id or len(arxiv_id) not in (9, 10) or arxiv_id[4] != ".":
+        return None
+    head, sequence = arxiv_id[:4], arxiv_id[5:]
+    if not (head.isdigit() and sequence.isdigit() and arxiv_id.isascii()):
+        return None
+    yymm = int(head)
+    if not 1 <= yymm % 100 <= 12:
+        return None
+    if len(sequence) != (5 if yymm >= FIVE_DIGIT_FROM else 4):
+        return None
+    return yymm * SEQUENCE_BASE + int(sequence)
+
+
+def decode_arxiv_id(code: int) -> str:
+    """
+    Unpack an integer produced by encode_arxiv_id.
+
+    Args:
+        code: Packed ID
+
+    Returns:
+        arXiv ID string
+    """
+    yymm, sequence = divmod(code, SEQUENCE_BASE)
+    width = 5 if yymm >= FIVE_DIGIT_FROM else 4
+    return f"{yymm:04d}.{sequence:0{width}d}"
+
+
+class PackedIdSet:
+    """Set of arXiv IDs stored as a sorted np.int64 array plus a set of old-style IDs."""
+
+    def __init__(self, arxiv_ids: Iterable[str] = ()):
+        """
+        Initialize PackedIdSet.
+
+        Args:
+            arxiv_ids: Initial IDs (duplicates are dropped)
+        """
+        self.codes = np.empty(0, dtype=np.int64)
+        self.others: set[str] = set()
+        self.add_many(arxiv_ids)
+
+    def __len__(self) -> int:
+        return len(self.codes) + len(self.others)
+
+    def __contains__(self, arxiv_id: object) -> bool:
+        return self.contains_many([arxiv_id])[0]
+
+    def __iter__(self):
+        for code in self.codes.tolist():
+            yield decode_arxiv_id(code)
+        yield from self.others
+
+    def contains_many(self, arxiv_ids: list[Optional[str]]) -> list[bool]:
+        """
+        Test a batch of IDs for membership with one searchsorted call.
+
+        Args:
+            arxiv_ids: IDs to test (None is never a member)
+
+        Returns:
+            One flag per ID, in input order
+        """
+        found = [False] * len(arxiv_ids)
+        positions: list[int] = []
+        codes: list[int] = []
+        for i, arxiv_id in enumerate(arxiv_ids):
+            if not isinstance(arxiv_id, str):
+                continue
+            code = encode_arxiv_id(arxiv_id)
+            if code is None:
+                found[i] = arxiv_id in self.others
+            else:
+                positions.append(i)
+                codes.append(code)
+
+        if codes and len(self.codes):
+            query = np.array(codes, dtype=np.int64)
+            at = np.searchsorted(self.codes, query)
+            hits = self.codes[np.minimum(at, len(self.codes) - 1)] == query
+            for i, hit in zip(positions, hits.tolist()):
+                found[i] = hit
+        return found
+
+    def add_many(self, arxiv_ids: Iterable[str]) -> None:
+        """
+        Add IDs.
+
+        Args:
+            arxiv_ids: IDs to add
+        """
+        new_codes: list[int] = []
+        for arxiv_id in arxiv_ids:
+            code = encode_arxiv_id(arxiv_id)
+            if code is None:
+                if arxiv_id:
+                    self.others.add(arxiv_id)
+            else:
+                new_codes.append(code)
+        self.add_codes(new_codes)
+
+    def add_codes(self, new_codes: Iterable[int]) -> None:
+        """
+        Add IDs already packed by encode_arxiv_id, merging with np.union1d.
+
+        Args:
+            new_codes: Packed IDs to add
+        """
+        new_codes = np.asarray(new_codes, dtype=np.int64)
+        if len(new_codes):
+            self.codes = np.union1d(self.codes, new_codes)
@@ -0,0 +1,185 @@
+"""
+Historical Backfill
+
+Loads past Daily Papers over a date range into the search archive and history.
+"""
+
+import json
+import os
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, timedelta
+from typing import Optional
+
+from huggingface_client import HuggingFaceClient
+from arxiv_category_client import ArxivCategoryClient
+from history_manager import HistoryManager
+from search_index import SearchIndex
+from rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+def date_range(start: date, end: date) -> list[str]:
+    """
+    List every day between two dates (inclusive).
+
+    Args:
+        start: First day
+        end: Last day
+
+    Returns:
+        Days in YYYY-MM-DD format
+    """
+    days = []
+    current = start
+    while current <= end:
+        days.append(current.isoformat())
+        current += timedelta(days=1)
+    return days
+
+
+class Backfiller:
+    """Fetches past days concurrently and checkpoints completed days."""
+
+    def __init__(
+        self,
+        hf_client: HuggingFaceClient,
+        arxiv_client: ArxivCategoryClient,
+        search_index: SearchIndex,
+        history_manager: Optional[HistoryManager] = None,
+        checkpoint_path: str = "backfill_checkpoint.json",
+        workers: int = 8,
+        category_batch_size: int = 100,
+        rate_limiter: Optional[RateLimiter] = None
+    ):
+        """
+        Initialize Backfiller.
+
+        Args:
+            hf_client: Client used to fetch each day
+            arxiv_client: Client used to resolve categories
+            search_index: Archive receiving the backfilled papers
+            history_manager: If given, backfilled papers are marked as sent
+            checkpoint_path: Path to the file listing completed days
+            workers: Number of concurrent day fetches
+            category_batch_size: Number of arXiv IDs per category request
+            rate_limiter: Limiter spacing arXiv requests (default: 3 s interval)
+        """
+        self.hf_client = hf_client
+        self.arxiv_client = arxiv_client
+        self.search_index = search_index
+        self.history_manager = history_manager
+        self.checkpoint_path = checkpoint_path
+        self.workers = workers
+        self.category_batch_size = category_batch_size
+        self.rate_limiter = rate_limiter or RateLimiter(min_interval=3.0)
+        self.completed: set[str] = set()
+        self.load_checkpoint()
+
+    def load_checkpoint(self) -> set[str]:
+        """
+        Load completed days from the checkpoint file.
+
+        Returns:
+            Set of completed days
+        """
+        if not os.path.exists(self.checkpoint_path):
+            self.completed = set()
+            return self.completed
+
+        try:
+            with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+                self.completed = set(json.load(f).get("completed_days", []))
+            logger.info(f"Resuming backfill with {len(self.completed)} completed days")
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Failed to load backfill checkpoint: {e}. Starting from scratch.")
+            self.completed = set()
+        return self.completed
+
+    def save_checkpoint(self) -> None:
+        """Save completed days to the checkpoint file."""
+        with open(self.checkpoint_path, 'w', encoding='utf-8') as f:
+            json.dump({"completed_days": sorted(self.completed)}, f, indent=2)
+
+    def run(self, start: date, end: date) -> dict:
+        """
+        Backfill every day in the range that is not yet checkpointed.
+
+        Days are fetched on a thread pool. Results are enriched with arXiv
+        categories in rate-limited batches, persisted, and only then marked
+        complete, so an interrupted run resumes at the first unsaved day.
+
+        Args:
+            start: First day (inclusive)
+            end: Last day (inclusive)
+
+        Returns:
+            Summary with counts of days, papers and failed days
+        """
+        days = [d for d in date_range(start, end) if d not in self.completed]
+        summary = {"days": 0, "papers": 0, "failed_days": []}
+        if not days:
+            logger.info("Nothing to backfill: all days already completed")
+            return summary
+
+        logger.info(f"Backfilling {len(days)} days with {self.workers} workers")
+        pending_days: list[str] = []
+        pending_papers: list[dict] = []
+
+        executor = ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            futures = {executor.submit(self.hf_client.fetch_papers_for_date, day): day for day in days}
+            for future in as_completed(futures):
+                day = futures[future]
+                try:
+                    papers = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to fetch {day}: {e}")
+                    summary["failed_days"].append(day)
+                    continue
+
+                pending_days.append(day)
+                pending_papers.extend(papers)
+                if len(pending_papers) >= self.category_batch_size:
+                    self._flush(pending_days, pending_papers, summary)
+                    pending_days, pending_papers = [], []
+        except BaseException:
+            # Ctrl-C or an error: drop queued days instead of fetching them all;
+            # unsaved days are fetched again on resume
+            executor.shutdown(wait=False, cancel_futures=True)
+            self.save_checkpoint()
+            logger.warning(f"Backfill interrupted after {summary['days']} days; checkpoint saved")
+            raise
+        executor.shutdown()
+
+        if pending_days:
+            self._flush(pending_days, pending_papers, summary)
+
+        summary["failed_days"].sort()
+        logger.info(
+            f"Backfill finished: {summary['days']} days, {summary['papers']} papers, "
+            f"{len(summary['failed_days'])} failed days"
+        )
+        return summary
+
+    def _flush(self, days: list[str], papers: list[dict], summary: dict) -> None:
+        """Enrich, persist and checkpoint a group of completed days."""
+        self.search_index.add(papers)
+
+        arxiv_ids = list(dict.fromkeys(p["arxiv_id"] for p in papers if p.get("arxiv_id")))
+        for i in range(0, len(arxiv_ids), self.category_batch_size):
+            self.rate_limiter.wait()
+            batch = arxiv_ids[i:i + self.category_batch_size]
+            self.search_index.set_categories(self.arxiv_client.get_categories(batch))
+
+        if self.history_manager is not None:
+            self.history_manager.add(arxiv_ids)
+            self.history_manager.save()
+
+        self.search_index.save()
+        self.completed.update(days)
+        self.save_checkpoint()
+
+        summary["days"] += len(days)
+        summary["papers"] += len(papers)
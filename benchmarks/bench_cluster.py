@@ -0,0 +1,92 @@
+"""
+Clustering Benchmark
+
+Times TopicClusterer on a synthetic batch of papers with realistic abstract
+lengths and fails if clustering exceeds the budget.
+
+Usage:
+    python benchmarks/bench_cluster.py [--papers 300] [--budget-ms 500] [--runs 5]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from topic_clusterer import TopicClusterer  # noqa: E402
+
+# Default budget for clustering the default batch
+DEFAULT_BUDGET_MS = 500.0
+
+TOPIC_WORDS = [
+    "agent tool planning multi-agent environment reward reasoning".split(),
+    "diffusion image generation denoising video latent sampling".split(),
+    "speech audio recognition acoustic speaker waveform synthesis".split(),
+    "robot manipulation grasping policy embodied navigation control".split(),
+    "retrieval augmented generation documents ranking dense index".split(),
+]
+
+
+def synthetic_papers(count: int, seed: int = 0) -> list[dict]:
+    """
+    Build papers mixing topic words with a large shared vocabulary.
+
+    Args:
+        count: Number of papers
+        seed: Random seed
+
+    Returns:
+        Papers with title, abstract and upvotes, in rank order
+    """
+    rng = random.Random(seed)
+    vocabulary = [f"term{i}" for i in range(5000)]
+    papers = []
+    for i in range(count):
+        words = rng.choice(TOPIC_WORDS)
+        papers.append({
+            "title": " ".join(rng.choices(words, k=8)),
+            "abstract": " ".join(rng.choices(words, k=30) + rng.choices(vocabulary, k=150)),
+            "upvotes": count - i,
+        })
+    return papers
+
+
+def measure_cluster_time(count: int = 300) -> float:
+    """
+    Cluster one synthetic batch.
+
+    Args:
+        count: Number of papers
+
+    Returns:
+        Elapsed time in ms
+    """
+    papers = synthetic_papers(count)
+    start = time.perf_counter()
+    TopicClusterer().cluster(papers)
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure topic clustering time")
+    parser.add_argument("--papers", type=int, default=300)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    timings = sorted(measure_cluster_time(args.papers) for _ in range(args.runs))
+    best = timings[0]
+    print(f"cluster {args.papers} papers: best {best:.1f} ms, median {timings[len(timings) // 2]:.1f} ms "
+          f"(budget {args.budget_ms:.0f} ms)")
+    if best > args.budget_ms:
+        print("FAIL: clustering time over budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
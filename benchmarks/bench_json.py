@@ -0,0 +1,89 @@
+"""
+JSON Codec Benchmark
+
+Compares the installed json_codec backends on a large history file, a
+Daily Papers-sized payload and a Slack digest payload.
+
+Usage:
+    python benchmarks/bench_json.py [--history 200000] [--papers 20000] [--runs 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from json_codec import JsonCodec, available_backends  # noqa: E402
+
+
+def history_data(count: int) -> dict:
+    """History file contents with count records."""
+    return {"sent_papers": [{"id": f"25{i % 12 + 1:02d}.{i % 100000:05d}", "sent_at": "2026-01-05"} for i in range(count)]}
+
+
+def papers_payload(count: int) -> list[dict]:
+    """Daily Papers API items with authors and long summaries."""
+    return [
+        {
+            "publishedAt": "2026-01-05T10:00:00.000Z",
+            "title": f"Paper {i}",
+            "paper": {
+                "id": f"2601.{i:05d}",
+                "title": f"Paper {i}: learning agents with tools — ünïcode",
+                "summary": "We study large language model agents. " * 30,
+                "upvotes": i % 500,
+                "authors": [{"name": f"Author {j}", "hidden": False} for j in range(8)],
+            },
+        }
+        for i in range(count)
+    ]
+
+
+def best_ms(func, runs: int) -> float:
+    """Best wall time of func over runs, in ms."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare JSON codec backends")
+    parser.add_argument("--history", type=int, default=200000)
+    parser.add_argument("--papers", type=int, default=20000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    history = history_data(args.history)
+    papers = papers_payload(args.papers)
+    digest = {"text": "\n".join(f"*{i}. {p['paper']['title']}*\n> {p['paper']['summary'][:200]}" for i, p in enumerate(papers[:50]))}
+
+    reference = JsonCodec("json")
+    history_bytes = reference.dumps(history, indent=True)
+    papers_bytes = reference.dumps(papers)
+    print(f"history {len(history_bytes) / 2**20:.1f} MiB, papers {len(papers_bytes) / 2**20:.1f} MiB")
+
+    results = {}
+    for name in available_backends():
+        codec = JsonCodec(name)
+        results[name] = {
+            "history load": best_ms(lambda: codec.loads(history_bytes), args.runs),
+            "history save": best_ms(lambda: codec.dumps(history, indent=True), args.runs),
+            "papers load": best_ms(lambda: codec.loads(papers_bytes), args.runs),
+            "slack dumps": best_ms(lambda: codec.dumps(digest), args.runs * 20),
+        }
+
+    print(f"{'backend':<10}" + "".join(f"{case:>22}" for case in results["json"]))
+    for name, cases in results.items():
+        cells = [f"{ms:.2f} ms ({results['json'][case] / max(ms, 1e-9):.1f}x)" for case, ms in cases.items()]
+        print(f"{name:<10}" + "".join(f"{cell:>22}" for cell in cells))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""
+Startup Benchmark
+
+Measures CLI import time with `python -X importtime main.py --help` and
+fails if startup exceeds the budget or pulls in heavy modules.
+
+Usage:
+    python benchmarks/bench_startup.py [--budget-ms 60] [--runs 5]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must only be imported by the stages that use them
+HEAVY_MODULES = ("requests", "urllib3", "dotenv", "xml.etree.ElementTree")
+
+# Default budget for application imports (interpreter startup excluded)
+DEFAULT_BUDGET_MS = 60.0
+
+
+def measure_import_time(args: list[str] = None) -> tuple[float, set[str]]:
+    """
+    Run the CLI once under -X importtime.
+
+    Args:
+        args: CLI arguments (default: ["--help"])
+
+    Returns:
+        (application import time in ms, set of imported module names)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "main.py", *(args or ["--help"])],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    total_us = 0
+    modules = set()
+    after_site = False
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if not cumulative.strip().isdigit():
+            continue  # header line
+        module = name.strip()
+        modules.add(module)
+        is_top_level = name.startswith(" ") and not name.startswith("  ")
+        if is_top_level and after_site:
+            total_us += int(cumulative)
+        if is_top_level and module == "site":
+            after_site = True
+
+    return total_us / 1000, modules
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure CLI startup import time")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    timings = []
+    heavy = set()
+    for _ in range(args.runs):
+        elapsed_ms, modules = measure_import_time()
+        timings.append(elapsed_ms)
+        heavy |= {m for m in HEAVY_MODULES if m in modules}
+
+    best = min(timings)
+    print(f"startup imports: best {best:.1f} ms, median {sorted(timings)[len(timings) // 2]:.1f} ms "
+          f"(budget {args.budget_ms:.0f} ms)")
+    if heavy:
+        print(f"FAIL: heavy modules imported at startup: {', '.join(sorted(heavy))}")
+        return 1
+    if best > args.budget_ms:
+        print("FAIL: startup import time over budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
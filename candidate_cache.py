@@ -0,0 +1,192 @@
+"""
+Candidate Cache
+
+Persists parsed candidates, their arXiv categories and a watermark cursor between runs.
+"""
+
+import json
+import os
+import logging
+import time
+import zlib
+from typing import Callable, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CandidateCache:
+    """Incrementally merges the Daily Papers window into a cached candidate set."""
+
+    def __init__(self, filepath: str = "candidate_cache.json"):
+        """
+        Initialize CandidateCache.
+
+        Args:
+            filepath: Path to the cache JSON file
+        """
+        self.filepath = filepath
+        self.watermark: Optional[str] = None
+        self.fetched_at: Optional[float] = None
+        self.entries: dict[str, dict] = {}
+        self.categories: dict[str, list[str]] = {}
+        self.load()
+
+    def load(self) -> int:
+        """
+        Load cached candidates from the JSON file.
+
+        Returns:
+            Number of cached candidates
+        """
+        self.watermark = None
+        self.fetched_at = None
+        self.entries = {}
+        self.categories = {}
+
+        if not os.path.exists(self.filepath):
+            logger.info(f"Candidate cache not found, creating new: {self.filepath}")
+            return 0
+
+        try:
+            with open(self.filepath, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.watermark = data.get("watermark")
+            self.fetched_at = data.get("fetched_at")
+            self.entries = data.get("entries", {})
+            self.categories = data.get("categories", {})
+            logger.info(f"Loaded {len(self.entries)} cached candidates (watermark: {self.watermark})")
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Failed to load candidate cache: {e}. Starting with empty cache.")
+            self.entries = {}
+            self.categories = {}
+
+        return len(self.entries)
+
+    def save(self) -> None:
+        """Save cached candidates to the JSON file."""
+        data = {
+            "watermark": self.watermark,
+            "fetched_at": self.fetched_at,
+            "entries": self.entries,
+            "categories": self.categories,
+        }
+        with open(self.filepath, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        logger.info(f"Saved {len(self.entries)} candidates to {self.filepath}")
+
+    @staticmethod
+    def content_hash(item: dict) -> int:
+        """
+        Hash the fields of a raw item that affect parsing and ranking.
+
+        Args:
+            item: Raw Daily Papers API item
+
+        Returns:
+            CRC32 of upvotes, title and summary
+        """
+        info = item.get("paper", {})
+        key = f"{info.get('upvotes', 0)}|{info.get('title', item.get('title', ''))}|{info.get('summary', '')}"
+        return zlib.crc32(key.encode('utf-8'))
+
+    def merge(self, raw_items: Iterable[dict], parse_item: Callable[[dict], dict]) -> tuple[list[dict], list[dict]]:
+        """
+        Merge the current window into the cache, parsing only new or changed items.
+
+        Items no longer in the window are evicted. Their categories are kept
+        until retain_categories is called, since other sources may still
+        report those papers. raw_items may be a stream; the cache is only
+        updated once it is fully consumed, so a failed stream leaves the
+        previous window intact.
+
+        Args:
+            raw_items: Raw Daily Papers API items
+            parse_item: Function converting a raw item into a paper
+
+        Returns:
+            (all candidates in the window, candidates that were new or changed)
+        """
+        entries: dict[str, dict] = {}
+        candidates = []
+        changed = []
+        watermark = self.watermark
+
+        for item in raw_items:
+            key = item.get("paper", {}).get("id") or item.get("id") or item.get("title")
+            if not key:
+                continue
+
+            published = item.get("publishedAt") or ""
+            digest = self.content_hash(item)
+            cached = self.entries.get(key)
+            is_new = self.watermark is None or published > self.watermark
+            if cached is not None and not is_new and cached["hash"] == digest:
+                paper = cached["paper"]
+            else:
+                paper = parse_item(item)
+                changed.append(paper)
+
+            entries[key] = {"hash": digest, "paper": paper}
+            candidates.append(paper)
+            if published and (watermark is None or published > watermark):
+                watermark = published
+
+        self.entries = entries
+        self.watermark = watermark
+        self.fetched_at = time.time()
+
+        logger.info(f"Candidate cache: {len(changed)} new or changed of {len(candidates)} items")
+        return candidates, changed
+
+    def age(self) -> Optional[float]:
+        """
+        Seconds since the cached window was last fetched.
+
+        Returns:
+            Age in seconds, or None if the cache was never filled
+        """
+        if self.fetched_at is None:
+            return None
+        return max(0.0, time.time() - self.fetched_at)
+
+    def papers(self) -> list[dict]:
+        """
+        Cached candidates from the last merged window.
+
+        Returns:
+            List of cached papers
+        """
+        return [entry["paper"] for entry in self.entries.values()]
+
+    def get_categories(self, arxiv_ids: list[str]) -> dict[str, list[str]]:
+        """
+        Look up cached categories.
+
+        Args:
+            arxiv_ids: arXiv IDs to look up
+
+        Returns:
+            Dict mapping cached arXiv IDs to categories
+        """
+        return {aid: self.categories[aid] for aid in arxiv_ids if aid in self.categories}
+
+    def retain_categories(self, arxiv_ids: Iterable[str]) -> None:
+        """
+        Drop cached categories of papers that are no longer candidates.
+
+        Args:
+            arxiv_ids: IDs of every live candidate, from all sources
+        """
+        live_ids = set(arxiv_ids)
+        self.categories = {aid: cats for aid, cats in self.categories.items() if aid in live_ids}
+
+    def set_categories(self, paper_categories: dict[str, list[str]]) -> None:
+        """
+        Store resolved categories.
+
+        Args:
+            paper_categories: Dict mapping arXiv ID to categories
+        """
+        for arxiv_id, categories in paper_categories.items():
+            if categories:
+                self.categories[arxiv_id] = list(categories)
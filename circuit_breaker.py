@@ -0,0 +1,88 @@
+"""
+Circuit Breaker
+
+Skips calls to a failing upstream for a cool-down period after repeated failures.
+"""
+
+import logging
+import time
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """Counts consecutive failures and opens for a cool-down period."""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 3,
+        cooldown_seconds: float = 1800.0,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Initialize CircuitBreaker.
+
+        Args:
+            name: Upstream name used in log messages
+            failure_threshold: Consecutive failures that open the circuit
+            cooldown_seconds: Seconds to skip calls once open
+            clock: Wall-clock function (state is persisted across runs)
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self._clock = clock
+        self.failures = 0
+        self.opened_at: float = 0.0
+
+    def allow(self) -> bool:
+        """
+        Check whether a call may be attempted.
+
+        After the cool-down the circuit is half-open: one trial call is
+        allowed, and its outcome closes or re-opens the circuit.
+
+        Returns:
+            True if the circuit is closed or the cool-down has elapsed
+        """
+        if self.failures < self.failure_threshold:
+            return True
+        return self._clock() - self.opened_at >= self.cooldown_seconds
+
+    def record_success(self) -> None:
+        """Close the circuit."""
+        if self.failures >= self.failure_threshold:
+            logger.info(f"Circuit for {self.name} closed")
+        self.failures = 0
+        self.opened_at = 0.0
+
+    def record_failure(self) -> None:
+        """Count a failure and (re-)open the circuit at the threshold."""
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            self.opened_at = self._clock()
+            logger.warning(
+                f"Circuit for {self.name} open after {self.failures} failures; "
+                f"skipping calls for {self.cooldown_seconds:.0f}s"
+            )
+
+    def to_dict(self) -> dict:
+        """
+        Serialize the breaker state.
+
+        Returns:
+            Dict with failures and opened_at
+        """
+        return {"failures": self.failures, "opened_at": self.opened_at}
+
+    def load_dict(self, data: dict) -> None:
+        """
+        Restore breaker state from to_dict output.
+
+        Args:
+            data: Serialized state
+        """
+        self.failures = int(data.get("failures", 0))
+        self.opened_at = float(data.get("opened_at", 0.0))
@@ -0,0 +1,303 @@
+"""
+Subscription Coordinator
+
+Runs many subscriptions against one shared candidate set: the coordinator
+fetches and enriches candidates once, publishes them as a snapshot file
+that each worker process decodes once, and shards subscriptions across
+the pool whose workers filter, check history and render. Delivery and
+history updates happen back in the coordinator.
+"""
+
+import os
+import logging
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+
+import json_codec
+from arxiv_id_codec import PackedIdSet
+from filter_expr import compile_filter
+
+logger = logging.getLogger(__name__)
+
+# Concurrent webhook posts during delivery
+DELIVERY_WORKERS = 8
+
+# Shards per worker process, so uneven subscriptions still balance
+SHARDS_PER_WORKER = 4
+
+# Snapshot loaded once per worker process by the pool initializer
+_worker_state: dict = {}
+
+
+def write_snapshot(path: str, papers: list[dict], paper_categories: dict[str, list[str]]) -> None:
+    """
+    Write the shared candidate set.
+
+    Args:
+        path: Snapshot file path
+        papers: Ranked candidate papers
+        paper_categories: Dict mapping arXiv ID to categories
+    """
+    data = {"papers": papers, "categories": paper_categories}
+    with open(path, 'wb') as f:
+        f.write(json_codec.dumps(data))
+
+
+def read_snapshot(path: str) -> tuple[list[dict], dict[str, list[str]]]:
+    """
+    Read and decode a snapshot file.
+
+    Each worker process holds its own decoded copy; the file is read once
+    per worker by the pool initializer, not once per shard.
+
+    Args:
+        path: Snapshot file path
+
+    Returns:
+        (papers, paper_categories)
+    """
+    with open(path, 'rb') as f:
+        data = json_codec.loads(f.read())
+    return data["papers"], data["categories"]
+
+
+def history_path(history_dir: str, subscription: dict) -> str:
+    """
+    History file of a subscription.
+
+    Args:
+        history_dir: Directory holding per-subscription history files
+        subscription: Subscription dict
+
+    Returns:
+        Path to the subscription's history JSON file
+    """
+    return os.path.join(history_dir, f"{subscription['name']}.json")
+
+
+def process_subscription(
+    subscription: dict,
+    papers: list[dict],
+    paper_categories: dict[str, list[str]],
+    history_dir: Optional[str],
+    filters: Optional[dict] = None
+) -> dict:
+    """
+    Select and render one subscription's digest.
+
+    Args:
+        subscription: Subscription dict from load_subscriptions
+        papers: Shared ranked candidates
+        paper_categories: Shared category map (papers without categories pass)
+        history_dir: Directory of per-subscription history (None to skip history)
+        filters: Cache of compiled filters shared across subscriptions
+
+    Returns:
+        Result dict with name, papers, arxiv_ids and digest
+    """
+    from history_manager import HistoryManager
+    from slack_client import SlackClient
+
+    key = (subscription["filter"], tuple(subscription["categories"]))
+    if filters is None:
+        filters = {}
+    if key not in filters:
+        filters[key] = compile_filter(*key)
+    predicate = filters[key]
+
+    sent_index = PackedIdSet()
+    if history_dir:
+        sent_index = HistoryManager(history_path(history_dir, subscription)).sent_index()
+
+    selected = []
+    for paper in papers:
+        arxiv_id = paper.get("arxiv_id")
+        if arxiv_id in sent_index:
+            continue
+        if predicate is not None and not predicate.matches(paper, paper_categories.get(arxiv_id)):
+            continue
+        selected.append(paper)
+        if len(selected) >= subscription["top_n"]:
+            break
+
+    return {
+        "name": subscription["name"],
+        "papers": selected,
+        "arxiv_ids": [p["arxiv_id"] for p in selected if p.get("arxiv_id")],
+        "digest": SlackClient("").create_digest(selected) if selected else None,
+    }
+
+
+def _init_worker(snapshot_path: str, history_dir: Optional[str]) -> None:
+    """Load the shared snapshot once per worker process."""
+    logging.getLogger("history_manager").setLevel(logging.WARNING)
+    papers, paper_categories = read_snapshot(snapshot_path)
+    _worker_state.update(papers=papers, categories=paper_categories, history_dir=history_dir, filters={})
+
+
+def _process_shard(shard: list[dict]) -> list[dict]:
+    """Process a shard of subscriptions inside a worker process."""
+    return [
+        process_subscription(
+            subscription, _worker_state["papers"], _worker_state["categories"],
+            _worker_state["history_dir"], _worker_state["filters"]
+        )
+        for subscription in shard
+    ]
+
+
+class Coordinator:
+    """Shards subscriptions across worker processes and delivers their digests."""
+
+    def __init__(
+        self,
+        subscriptions: list[dict],
+        history_dir: Optional[str] = "history",
+        workers: Optional[int] = None,
+        snapshot_dir: Optional[str] = None
+    ):
+        """
+        Initialize Coordinator.
+
+        Args:
+            subscriptions: Subscriptions from load_subscriptions
+            history_dir: Directory of per-subscription history (None to disable history)
+            workers: Worker processes (default: CPU count; 1 runs in-process)
+            snapshot_dir: Directory for the snapshot file (default: system temp dir)
+        """
+        self.subscriptions = subscriptions
+        self.history_dir = history_dir
+        self.workers = workers or os.cpu_count() or 1
+        self.snapshot_dir = snapshot_dir
+
+    def shards(self) -> list[list[dict]]:
+        """
+        Split subscriptions into contiguous shards.
+
+        Returns:
+            List of subscription lists
+        """
+        count = max(1, min(len(self.subscriptions), self.workers * SHARDS_PER_WORKER))
+        size = -(-len(self.subscriptions) // count)
+        return [self.subscriptions[i:i + size] for i in range(0, len(self.subscriptions), size)]
+
+    def run(self, papers: list[dict], paper_categories: dict[str, list[str]]) -> list[dict]:
+        """
+        Select and render every subscription's digest.
+
+        Args:
+            papers: Shared ranked candidates
+            paper_categories: Shared category map
+
+        Returns:
+            One result per subscription, in subscription order
+        """
+        if self.workers <= 1 or len(self.subscriptions) <= 1:
+            filters: dict = {}
+            return [
+                process_subscription(s, papers, paper_categories, self.history_dir, filters)
+                for s in self.subscriptions
+            ]
+
+        fd, snapshot_path = tempfile.mkstemp(prefix="candidates-", suffix=".json", dir=self.snapshot_dir)
+        os.close(fd)
+        try:
+            write_snapshot(snapshot_path, papers, paper_categories)
+            shards = self.shards()
+            with ProcessPoolExecutor(
+                max_workers=min(self.workers, len(shards)),
+                initializer=_init_worker,
+                initargs=(snapshot_path, self.history_dir)
+            ) as executor:
+                results = [r for shard_results in executor.map(_process_shard, shards) for r in shard_results]
+        finally:
+            os.remove(snapshot_path)
+
+        logger.info(f"Processed {len(results)} subscriptions in {len(shards)} shards")
+        return results
+
+    def enrich(self, results: list[dict], enricher, timeout: float = 10, deadline=None) -> list[dict]:
+        """
+        Add per-paper details to every digest in one pass.
+
+        Papers selected by several subscriptions are fetched once; digests
+        are re-rendered with the details.
+
+        Args:
+            results: Output of run()
+            enricher: PaperEnricher
+            timeout: Per-request timeout in seconds
+            deadline: Deadline for the whole pass (see PaperEnricher.enrich)
+
+        Returns:
+            Results with enriched papers and digests
+        """
+        from slack_client import SlackClient
+
+        selected = {}
+        for result in results:
+            for paper in result["papers"]:
+                if paper.get("arxiv_id"):
+                    selected.setdefault(paper["arxiv_id"], paper)
+        if not selected:
+            return results
+
+        details = {p["arxiv_id"]: p for p in enricher.enrich(list(selected.values()), timeout=timeout, deadline=deadline)}
+        enriched = []
+        for result in results:
+            papers = [details.get(p.get("arxiv_id"), p) for p in result["papers"]]
+            digest = SlackClient("").create_digest(papers) if papers else None
+            enriched.append({**result, "papers": papers, "digest": digest})
+        return enriched
+
+    def deliver(self, results: list[dict], timeout: float = 30) -> dict:
+        """
+        Post digests and record sent papers in each subscription's history.
+
+        History is only updated after a successful post.
+
+        Args:
+            results: Output of run()
+            timeout: Per-post request timeout in seconds
+
+        Returns:
+            Summary dict with delivered, empty and failed subscription names
+        """
+        from history_manager import HistoryManager
+        from slack_client import SlackClient
+
+        by_name = {s["name"]: s for s in self.subscriptions}
+        summary: dict[str, list[str]] = {"delivered": [], "empty": [], "failed": []}
+
+        def post(result: dict) -> Optional[str]:
+            subscription = by_name[result["name"]]
+            webhook_url = os.getenv(subscription["webhook_env"])
+            if not webhook_url:
+                return f"{subscription['webhook_env']} is not set"
+            try:
+                SlackClient(webhook_url).post_message(result["digest"], timeout=timeout)
+            except Exception as e:
+                return str(e)
+            return None
+
+        pending = [r for r in results if r["digest"]]
+        summary["empty"] = [r["name"] for r in results if not r["digest"]]
+        with ThreadPoolExecutor(max_workers=DELIVERY_WORKERS) as executor:
+            errors = list(executor.map(post, pending))
+
+        if self.history_dir:
+            os.makedirs(self.history_dir, exist_ok=True)
+        for result, error in zip(pending, errors):
+            if error:
+                logger.error(f"Delivery to {result['name']} failed: {error}")
+                summary["failed"].append(result["name"])
+                continue
+            summary["delivered"].append(result["name"])
+            if self.history_dir:
+                history = HistoryManager(history_path(self.history_dir, by_name[result["name"]]))
+                history.cleanup(days=30)
+                history.add(result["arxiv_ids"])
+                history.save()
+
+        return summary
@@ -0,0 +1,142 @@
+"""
+Run Deadline
+
+Tracks a run-level time budget and splits it across pipeline stages.
+"""
+
+import re
+import time
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
+
+# Per-request timeout used when no deadline is set (matches the clients' default)
+DEFAULT_TIMEOUT = 30.0
+
+# Stages with less budget than this are skipped instead of started
+MIN_STAGE_SECONDS = 1.0
+
+T = TypeVar("T")
+
+_DURATION_PATTERN = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*(ms|s|m|h)?\s*$')
+
+
+def parse_duration(value: str) -> float:
+    """
+    Parse a duration such as "20s", "1.5m", "500ms", "3h" or "20".
+
+    Args:
+        value: Duration string (bare numbers are seconds)
+
+    Returns:
+        Duration in seconds
+
+    Raises:
+        ValueError: If the string is not a valid duration
+    """
+    match = _DURATION_PATTERN.match(value)
+    if not match:
+        raise ValueError(f"Invalid duration: {value!r}")
+    amount = float(match.group(1))
+    unit = match.group(2) or "s"
+    return amount * {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}[unit]
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when work runs past its deadline."""
+
+
+class Deadline:
+    """Run-level time budget shared by all stages."""
+
+    def __init__(self, seconds: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize Deadline.
+
+        Args:
+            seconds: Total budget in seconds (None for no deadline)
+            clock: Monotonic clock function
+        """
+        self.seconds = seconds
+        self._clock = clock
+        self._start = clock()
+
+    def remaining(self) -> float:
+        """
+        Seconds left in the budget.
+
+        Returns:
+            Remaining seconds (infinity without a deadline, never negative)
+        """
+        if self.seconds is None:
+            return float("inf")
+        return max(0.0, self.seconds - (self._clock() - self._start))
+
+    def expired(self) -> bool:
+        """
+        Check whether the budget is used up.
+
+        Returns:
+            True if no time remains
+        """
+        return self.remaining() <= 0
+
+    def timeout(self, share: float = 1.0, cap: float = DEFAULT_TIMEOUT) -> float:
+        """
+        Request timeout for a stage that may use a share of the remaining budget.
+
+        Args:
+            share: Fraction of the remaining budget granted to the stage
+            cap: Upper bound on the timeout
+
+        Returns:
+            Timeout in seconds
+        """
+        return min(cap, self.remaining() * share)
+
+    def allows(self, share: float = 1.0, minimum: float = MIN_STAGE_SECONDS) -> bool:
+        """
+        Check whether a stage still has enough budget to start.
+
+        Args:
+            share: Fraction of the remaining budget granted to the stage
+            minimum: Minimum useful timeout for the stage
+
+        Returns:
+            True if the stage's timeout would be at least minimum
+        """
+        return self.timeout(share) >= minimum
+
+    def stage(self, share: float = 1.0) -> "Deadline":
+        """
+        Sub-deadline for a stage granted a share of the remaining budget.
+
+        Args:
+            share: Fraction of the remaining budget granted to the stage
+
+        Returns:
+            Deadline that expires when the stage's share is used up
+        """
+        if self.seconds is None:
+            return Deadline(None, clock=self._clock)
+        return Deadline(self.remaining() * share, clock=self._clock)
+
+    def limit(self, items: Iterable[T]) -> Iterator[T]:
+        """
+        Yield items until the deadline expires.
+
+        Socket timeouts only bound each read, so a stream that keeps
+        trickling in can outlive any timeout; checking between items
+        cancels it instead.
+
+        Args:
+            items: Items to pass through (e.g., response chunks)
+
+        Yields:
+            The items, unchanged
+
+        Raises:
+            DeadlineExceeded: If the deadline expires before the items run out
+        """
+        for item in items:
+            if self.expired():
+                raise DeadlineExceeded(f"Deadline of {self.seconds:.1f}s exceeded")
+            yield item
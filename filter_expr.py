@@ -0,0 +1,359 @@
+"""
+Filter Expressions
+
+Compiles declarative --filter expressions into a single fused predicate.
+
+Grammar:
+    expr       := or_expr
+    or_expr    := and_expr ("or" and_expr)*
+    and_expr   := not_expr ("and" not_expr)*
+    not_expr   := "not" not_expr | "(" expr ")" | comparison
+    comparison := FIELD OP VALUE | FIELD "in" "(" VALUE ("," VALUE)* ")"
+
+Fields and operators:
+    upvotes                      >= <= > < == !=   (number)
+    published                    >= <= > < == !=   (YYYY-MM-DD)
+    category                     == != in          (glob such as cs.*)
+    title / abstract / text      contains ~ == !=  (~ is a case-insensitive regex)
+
+Example:
+    upvotes >= 10 and published >= 2026-01-01 and category in (cs.AI, cs.CL)
+        and not title ~ "survey"
+
+Category checks need arXiv data, so predicates use three-valued logic:
+while categories are unknown a check yields None, and prefilter() only
+drops papers that are rejected regardless of their categories.
+"""
+
+import fnmatch
+import re
+from typing import Callable, Optional
+
+# Evaluation cost of each field; cheaper checks run first inside and/or
+FIELD_COSTS = {
+    "upvotes": 1,
+    "published": 1,
+    "title": 2,
+    "abstract": 3,
+    "text": 3,
+    "category": 10,
+}
+
+NUMERIC_FIELDS = {"upvotes"}
+DATE_FIELDS = {"published"}
+TEXT_FIELDS = {"title", "abstract", "text"}
+CATEGORY_FIELDS = {"category"}
+
+COMPARISONS = {
+    ">=": lambda a, b: a >= b,
+    "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b,
+    "<": lambda a, b: a < b,
+    "==": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+}
+
+_TOKEN_PATTERN = re.compile(r'''
+    \s*(?:
+        (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+      | (?P<op>>=|<=|==|!=|>|<|~|\(|\)|,)
+      | (?P<word>[^\s()"',<>=!~]+)
+    )''', re.VERBOSE)
+
+_DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+# A compiled node: (paper, categories or None) -> True / False / None (unknown)
+Node = Callable[[dict, Optional[list[str]]], Optional[bool]]
+
+
+class FilterError(ValueError):
+    """Raised when a filter expression cannot be parsed."""
+
+
+def _tokenize(source: str) -> list[tuple[str, str]]:
+    """Split an expression into (kind, value) tokens."""
+    tokens = []
+    pos = 0
+    source = source.rstrip()
+    while pos < len(source):
+        match = _TOKEN_PATTERN.match(source, pos)
+        if not match or match.end() == pos:
+            raise FilterError(f"Unexpected character at position {pos}: {source[pos:pos + 10]!r}")
+        pos = match.end()
+        if match.group("string") is not None:
+            # Only escaped quotes are unescaped, so regex escapes like \b reach ~ intact
+            raw = match.group("string")[1:-1]
+            tokens.append(("string", re.sub(r'\\(["\'])', r'\1', raw)))
+        elif match.group("op") is not None:
+            tokens.append(("op", match.group("op")))
+        else:
+            tokens.append(("word", match.group("word")))
+    return tokens
+
+
+class _Parser:
+    """Recursive-descent parser producing (node, cost, needs_categories) triples."""
+
+    def __init__(self, source: str):
+        self.tokens = _tokenize(source)
+        self.pos = 0
+
+    def parse(self) -> tuple[Node, int, bool]:
+        if not self.tokens:
+            raise FilterError("Empty filter expression")
+        result = self._or()
+        if self.pos != len(self.tokens):
+            raise FilterError(f"Unexpected token: {self.tokens[self.pos][1]!r}")
+        return result
+
+    def _peek_keyword(self, keyword: str) -> bool:
+        if self.pos < len(self.tokens):
+            kind, value = self.tokens[self.pos]
+            return kind == "word" and value.lower() == keyword
+        return False
+
+    def _peek_op(self, op: str) -> bool:
+        return self.pos < len(self.tokens) and self.tokens[self.pos] == ("op", op)
+
+    def _next(self) -> tuple[str, str]:
+        if self.pos >= len(self.tokens):
+            raise FilterError("Unexpected end of expression")
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def _expect_op(self, op: str) -> None:
+        token = self._next()
+        if token != ("op", op):
+            raise FilterError(f"Expected {op!r}, got {token[1]!r}")
+
+    def _or(self) -> tuple[Node, int, bool]:
+        parts = [self._and()]
+        while self._peek_keyword("or"):
+            self.pos += 1
+            parts.append(self._and())
+        return _combine(parts, is_and=False)
+
+    def _and(self) -> tuple[Node, int, bool]:
+        parts = [self._not()]
+        while self._peek_keyword("and"):
+            self.pos += 1
+            parts.append(self._not())
+        return _combine(parts, is_and=True)
+
+    def _not(self) -> tuple[Node, int, bool]:
+        if self._peek_keyword("not"):
+            self.pos += 1
+            node, cost, needs = self._not()
+
+            def negate(paper, categories, node=node):
+                result = node(paper, categories)
+                return None if result is None else not result
+            return negate, cost, needs
+
+        if self._peek_op("("):
+            self.pos += 1
+            result = self._or()
+            self._expect_op(")")
+            return result
+
+        return self._comparison()
+
+    def _value(self) -> str:
+        kind, value = self._next()
+        if kind == "op":
+            raise FilterError(f"Expected a value, got {value!r}")
+        return value
+
+    def _comparison(self) -> tuple[Node, int, bool]:
+        kind, field = self._next()
+        field = field.lower()
+        if kind != "word" or field not in FIELD_COSTS:
+            raise FilterError(f"Unknown field: {field!r} (expected one of {', '.join(FIELD_COSTS)})")
+
+        if self._peek_keyword("in"):
+            self.pos += 1
+            self._expect_op("(")
+            values = [self._value()]
+            while self._peek_op(","):
+                self.pos += 1
+                values.append(self._value())
+            self._expect_op(")")
+            op = "in"
+        elif self._peek_keyword("contains"):
+            self.pos += 1
+            op, values = "contains", [self._value()]
+        else:
+            op_kind, op = self._next()
+            if op_kind != "op" or op not in COMPARISONS and op != "~":
+                raise FilterError(f"Expected an operator after {field!r}, got {op!r}")
+            values = [self._value()]
+
+        node = _compile_comparison(field, op, values)
+        return node, FIELD_COSTS[field], field in CATEGORY_FIELDS
+
+
+def _combine(parts: list[tuple[Node, int, bool]], is_and: bool) -> tuple[Node, int, bool]:
+    """Fuse and/or operands, ordering them cheapest first."""
+    if len(parts) == 1:
+        return parts[0]
+
+    parts = sorted(parts, key=lambda part: part[1])
+    nodes = tuple(part[0] for part in parts)
+    cost = sum(part[1] for part in parts)
+    needs = any(part[2] for part in parts)
+
+    if is_and:
+        def conjunction(paper, categories):
+            unknown = False
+            for node in nodes:
+                result = node(paper, categories)
+                if result is False:
+                    return False
+                if result is None:
+                    unknown = True
+            return None if unknown else True
+        return conjunction, cost, needs
+
+    def disjunction(paper, categories):
+        unknown = False
+        for node in nodes:
+            result = node(paper, categories)
+            if result is True:
+                return True
+            if result is None:
+                unknown = True
+        return None if unknown else False
+    return disjunction, cost, needs
+
+
+def _compile_comparison(field: str, op: str, values: list[str]) -> Node:
+    """Compile a single field comparison into a node."""
+    if field in NUMERIC_FIELDS:
+        if op not in COMPARISONS:
+            raise FilterError(f"Operator {op!r} is not supported for {field}")
+        try:
+            number = float(values[0])
+        except ValueError:
+            raise FilterError(f"{field} needs a number, got {values[0]!r}")
+        compare = COMPARISONS[op]
+        return lambda paper, categories: compare(paper.get(field) or 0, number)
+
+    if field in DATE_FIELDS:
+        if op not in COMPARISONS or not _DATE_PATTERN.match(values[0]):
+            raise FilterError(f"{field} needs a comparison with a YYYY-MM-DD date")
+        day = values[0]
+        compare = COMPARISONS[op]
+
+        def date_check(paper, categories):
+            published = (paper.get("published_at") or "")[:10]
+            if not published:
+                return None
+            return compare(published, day)
+        return date_check
+
+    if field in CATEGORY_FIELDS:
+        if op not in ("==", "!=", "in"):
+            raise FilterError(f"Operator {op!r} is not supported for category")
+        patterns = tuple(values)
+        negated = op == "!="
+
+        def category_check(paper, categories):
+            if categories is None:
+                return None
+            found = any(fnmatch.fnmatchcase(c, p) for c in categories for p in patterns)
+            return not found if negated else found
+        return category_check
+
+    # Text fields
+    if op == "in":
+        raise FilterError(f"Operator 'in' is not supported for {field}")
+    getter = _text_getter(field)
+    if op == "~":
+        try:
+            regex = re.compile(values[0], re.IGNORECASE)
+        except re.error as e:
+            raise FilterError(f"Invalid regex {values[0]!r}: {e}")
+        return lambda paper, categories: regex.search(getter(paper)) is not None
+    if op == "contains":
+        needle = values[0].lower()
+        return lambda paper, categories: needle in getter(paper).lower()
+    if op in ("==", "!="):
+        target = values[0].lower()
+        equal = op == "=="
+        return lambda paper, categories: (getter(paper).lower() == target) == equal
+    raise FilterError(f"Operator {op!r} is not supported for {field}")
+
+
+def _text_getter(field: str) -> Callable[[dict], str]:
+    """Return a function extracting a text field from a paper."""
+    if field == "text":
+        return lambda paper: f"{paper.get('title') or ''}\n{paper.get('abstract') or ''}"
+    return lambda paper: paper.get(field) or ""
+
+
+class FilterExpression:
+    """A compiled filter expression."""
+
+    def __init__(self, source: str):
+        """
+        Parse and compile an expression.
+
+        Args:
+            source: Expression text
+
+        Raises:
+            FilterError: If the expression is invalid
+        """
+        self.source = source
+        self._node, self.cost, self.needs_categories = _Parser(source).parse()
+
+    def prefilter(self, paper: dict) -> bool:
+        """
+        Evaluate without arXiv data.
+
+        Args:
+            paper: Candidate paper
+
+        Returns:
+            False only if the paper is rejected whatever its categories are
+        """
+        return self._node(paper, None) is not False
+
+    def matches(self, paper: dict, categories: Optional[list[str]]) -> bool:
+        """
+        Evaluate with categories.
+
+        Args:
+            paper: Candidate paper
+            categories: Resolved categories, or None if unknown
+
+        Returns:
+            True if the paper passes; checks left unknown count as passing,
+            matching the uncategorized fallback
+        """
+        return self._node(paper, categories) is not False
+
+
+def compile_filter(expression: Optional[str], categories: Optional[list[str]]) -> Optional[FilterExpression]:
+    """
+    Combine a user expression and a category set into one compiled filter.
+
+    Args:
+        expression: --filter style expression (None or empty for none)
+        categories: Categories the paper must match (None or empty for any)
+
+    Returns:
+        Compiled expression, or None if nothing is filtered
+
+    Raises:
+        FilterError: If the expression is invalid
+    """
+    parts = []
+    if expression:
+        parts.append(f"({expression})")
+    if categories:
+        parts.append(f"category in ({', '.join(categories)})")
+    if not parts:
+        return None
+    return FilterExpression(" and ".join(parts))
@@ -4,14 +4,22 @@ History Manager
 Manages sent paper history to prevent duplicate notifications.
 """
 
-import json
 import os
 import logging
-from datetime import datetime, timedelta
+from array import array
+from datetime import date, datetime, timedelta
 from typing import Optional
 
+import numpy as np
+
+import json_codec
+from arxiv_id_codec import PackedIdSet, decode_arxiv_id, encode_arxiv_id
+
 logger = logging.getLogger(__name__)
 
+# Code column value of records kept as dicts
+UNPACKED = -1
+
 
 class HistoryManager:
     """Manages history of sent papers to prevent duplicates."""
@@ -20,12 +28,20 @@ class HistoryManager:
         """
         Initialize HistoryManager.
         
+        Records are held packed, in file order: new-style IDs as int64 codes
+        with a parallel array of sent dates (day ordinals). Records that
+        cannot be packed (old-style IDs, missing or unusual dates) hold the
+        UNPACKED code and are kept as dicts by position.
+        
         Args:
             filepath: Path to the history JSON file
         """
         self.filepath = filepath
-        self.sent_papers: list[dict] = []
-        self.load()
+        self._codes = array('q')
+        self._sent_days = array('i')
+        self._unpacked: dict[int, dict] = {}
+        self._index: Optional[PackedIdSet] = None
+        self._read()
     
     def load(self) -> list[dict]:
         """
@@ -34,21 +50,66 @@ class HistoryManager:
         Returns:
             List of sent paper records
         """
+        self._read()
+        return self.sent_papers
+    
+    def _read(self) -> None:
+        """Read the history file into the packed columns."""
+        self._index = None
+        self._codes = array('q')
+        self._sent_days = array('i')
+        self._unpacked = {}
         if not os.path.exists(self.filepath):
             logger.info(f"History file not found, creating new: {self.filepath}")
-            self.sent_papers = []
-            return self.sent_papers
+            return
         
         try:
-            with open(self.filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self.sent_papers = data.get("sent_papers", [])
-                logger.info(f"Loaded {len(self.sent_papers)} papers from history")
-        except (json.JSONDecodeError, IOError) as e:
+            with open(self.filepath, 'rb') as f:
+                data = json_codec.loads(f.read())
+            self._append(data.get("sent_papers", []))
+            logger.info(f"Loaded {len(self)} papers from history")
+        except (ValueError, IOError) as e:
             logger.warning(f"Failed to load history file: {e}. Starting with empty history.")
-            self.sent_papers = []
+            self._codes = array('q')
+            self._sent_days = array('i')
+            self._unpacked = {}
+    
+    def _append(self, records: list[dict]) -> None:
+        """Pack records into the code and date columns where possible."""
+        # Records share a handful of dates, so each is parsed once
+        days: dict[str, Optional[int]] = {}
+        for record in records:
+            if not isinstance(record, dict):
+                raise ValueError(f"Invalid history record: {record!r}")
+            code = encode_arxiv_id(record.get("id"))
+            sent_at = record.get("sent_at")
+            day = None
+            if isinstance(sent_at, str):
+                if sent_at not in days:
+                    days[sent_at] = _day_ordinal(sent_at)
+                day = days[sent_at]
+            if code is None or day is None:
+                self._unpacked[len(self._codes)] = record
+                code, day = UNPACKED, 0
+            self._codes.append(code)
+            self._sent_days.append(day)
+    
+    def __len__(self) -> int:
+        return len(self._codes)
+    
+    @property
+    def sent_papers(self) -> list[dict]:
+        """
+        History records as dicts, built on demand.
         
-        return self.sent_papers
+        Returns:
+            Records in insertion order
+        """
+        dates = {day: date.fromordinal(day).isoformat() for day in set(self._sent_days) if day}
+        return [
+            self._unpacked[i] if code == UNPACKED else {"id": decode_arxiv_id(code), "sent_at": dates[day]}
+            for i, (code, day) in enumerate(zip(self._codes, self._sent_days))
+        ]
     
     def is_sent(self, paper_id: str) -> bool:
         """
@@ -60,7 +121,7 @@ class HistoryManager:
         Returns:
             True if paper was already sent, False otherwise
         """
-        return any(p.get("id") == paper_id for p in self.sent_papers)
+        return paper_id in self.sent_index()
     
     def add(self, paper_ids: list[str]) -> None:
         """
@@ -70,12 +131,15 @@ class HistoryManager:
             paper_ids: List of paper IDs to add
         """
         today = datetime.now().strftime("%Y-%m-%d")
+        index = self.sent_index()
+        new_ids: list[str] = []
+        seen: set[str] = set()
         for paper_id in paper_ids:
-            if not self.is_sent(paper_id):
-                self.sent_papers.append({
-                    "id": paper_id,
-                    "sent_at": today
-                })
+            if paper_id not in index and paper_id not in seen:
+                seen.add(paper_id)
+                new_ids.append(paper_id)
+        self._append([{"id": paper_id, "sent_at": today} for paper_id in new_ids])
+        index.add_many(new_ids)
         logger.info(f"Added {len(paper_ids)} papers to history")
     
     def cleanup(self, days: int = 30) -> int:
@@ -90,15 +154,23 @@ class HistoryManager:
         """
         cutoff = datetime.now() - timedelta(days=days)
         cutoff_str = cutoff.strftime("%Y-%m-%d")
+        cutoff_day = cutoff.date().toordinal()
         
-        original_count = len(self.sent_papers)
-        self.sent_papers = [
-            p for p in self.sent_papers
-            if p.get("sent_at", "9999-99-99") >= cutoff_str
-        ]
-        removed = original_count - len(self.sent_papers)
+        original_count = len(self)
+        keep = np.array(self._sent_days, dtype=np.int64) >= cutoff_day
+        # Records without a usable date are kept, as before
+        for i, record in self._unpacked.items():
+            sent_at = record.get("sent_at")
+            keep[i] = not isinstance(sent_at, str) or sent_at >= cutoff_str
+        if not keep.all():
+            position = np.cumsum(keep) - 1
+            self._unpacked = {int(position[i]): record for i, record in self._unpacked.items() if keep[i]}
+            self._codes = array('q', np.array(self._codes, dtype=np.int64)[keep].tobytes())
+            self._sent_days = array('i', np.array(self._sent_days, dtype=np.int32)[keep].tobytes())
+        removed = original_count - len(self)
         
         if removed > 0:
+            self._index = None
             logger.info(f"Removed {removed} old entries from history")
         
         return removed
@@ -107,10 +179,10 @@ class HistoryManager:
         """Save history to JSON file."""
         data = {"sent_papers": self.sent_papers}
         
-        with open(self.filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(self.filepath, 'wb') as f:
+            f.write(json_codec.dumps(data, indent=True))
         
-        logger.info(f"Saved {len(self.sent_papers)} papers to {self.filepath}")
+        logger.info(f"Saved {len(data['sent_papers'])} papers to {self.filepath}")
     
     def get_sent_ids(self) -> set[str]:
         """
@@ -119,4 +191,34 @@ class HistoryManager:
         Returns:
             Set of paper IDs
         """
-        return {p.get("id") for p in self.sent_papers if p.get("id")}
+        return set(self.sent_index())
+    
+    def sent_index(self) -> PackedIdSet:
+        """
+        Get the compact membership index of sent paper IDs.
+        
+        The packed codes are sorted into an int64 array and tested with
+        binary search; the index is built once and kept up to date by add().
+        
+        Returns:
+            PackedIdSet of sent paper IDs
+        """
+        if self._index is None:
+            index = PackedIdSet(
+                p["id"] for p in self._unpacked.values() if isinstance(p.get("id"), str) and p["id"]
+            )
+            codes = np.array(self._codes, dtype=np.int64)
+            index.add_codes(codes[codes != UNPACKED])
+            self._index = index
+        return self._index
+
+
+def _day_ordinal(sent_at: str) -> Optional[int]:
+    """Day ordinal of a canonical "YYYY-MM-DD" date, or None."""
+    if len(sent_at) != 10:
+        return None
+    try:
+        day = date.fromisoformat(sent_at)
+    except ValueError:
+        return None
+    return day.toordinal() if day.isoformat() == sent_at else None
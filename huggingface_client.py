@@ -5,9 +5,14 @@ Fetches popular papers from Hugging Face Daily Papers API.
 """
 
 import re
+import heapq
 import requests
 from datetime import datetime, timedelta
-from typing import TypedDict, Optional
+from typing import Iterable, Iterator, TypedDict, Optional
+
+from deadline import Deadline
+from json_stream import iter_json_array
+from paper_sources import PaperSource
 
 
 class Paper(TypedDict):
@@ -20,17 +25,34 @@ class Paper(TypedDict):
     arxiv_id: Optional[str]
 
 
-class HuggingFaceClient:
+class HuggingFaceClient(PaperSource):
     """Client for fetching papers from Hugging Face Daily Papers API."""
     
     API_URL = "https://huggingface.co/api/daily_papers"
     
-    def fetch_papers(self, top_n: int = 5, days: int = 7) -> list[Paper]:
+    # Bytes read per chunk when streaming a response
+    CHUNK_SIZE = 64 * 1024
+    
+    name = "huggingface"
+    
+    def fetch(self, timeout: float = 30) -> list[Paper]:
+        """
+        Fetch every paper in the current Daily Papers list (PaperSource interface).
+        
+        Args:
+            timeout: Request timeout in seconds (default: 30)
+            
+        Returns:
+            List of Paper objects in API order
+        """
+        return [self.parse_item(item) for item in self.iter_raw(timeout=timeout)]
+    
+    def fetch_papers(self, top_n: Optional[int] = 5, days: int = 7) -> list[Paper]:
         """
         Fetch top papers from the past week sorted by upvotes.
         
         Args:
-            top_n: Number of top papers to return (default: 5)
+            top_n: Number of top papers to return (default: 5, None for all)
             days: Filter papers from the past N days (default: 7)
             
         Returns:
@@ -39,43 +61,132 @@ class HuggingFaceClient:
         Raises:
             requests.RequestException: If API request fails
         """
-        response = requests.get(self.API_URL, timeout=30)
-        response.raise_for_status()
+        papers = (self.parse_item(item) for item in self.iter_raw())
+        return self.select(papers, top_n=top_n, days=days)
+    
+    def fetch_raw(self, timeout: float = 30) -> list[dict]:
+        """
+        Fetch the raw Daily Papers list without parsing.
+        
+        Args:
+            timeout: Request timeout in seconds (default: 30)
+            
+        Returns:
+            List of raw API items
+            
+        Raises:
+            requests.RequestException: If API request fails
+            ValueError: If the response is not a JSON array
+        """
+        return list(self.iter_raw(timeout=timeout))
+    
+    def iter_raw(
+        self,
+        timeout: float = 30,
+        params: Optional[dict] = None,
+        deadline: Optional[Deadline] = None
+    ) -> Iterator[dict]:
+        """
+        Stream raw Daily Papers items, decoding each as soon as it arrives.
         
-        raw_papers = response.json()
+        The body is read in chunks with stream=True, so the full payload is
+        never buffered or decoded into one list.
         
+        Args:
+            timeout: Request timeout in seconds (default: 30)
+            params: Query parameters (e.g., {"date": "2026-01-05"})
+            deadline: Abort the stream once this expires (timeout only bounds each read)
+            
+        Yields:
+            Raw API items in response order
+            
+        Raises:
+            requests.RequestException: If API request fails
+            ValueError: If the response is not a JSON array
+            DeadlineExceeded: If the deadline expires mid-stream
+        """
+        response = requests.get(self.API_URL, params=params, timeout=timeout, stream=True)
+        try:
+            response.raise_for_status()
+            chunks = response.iter_content(chunk_size=self.CHUNK_SIZE)
+            if deadline is not None:
+                chunks = deadline.limit(chunks)
+            yield from iter_json_array(chunks)
+        finally:
+            response.close()
+    
+    def select(self, papers: Iterable[Paper], top_n: Optional[int] = 5, days: int = 7) -> list[Paper]:
+        """
+        Keep papers from the past N days and sort them by upvotes.
+        
+        With top_n set, papers are consumed one at a time into a bounded
+        heap, so a streamed input is never materialized.
+        
+        Args:
+            papers: Parsed papers (any iterable, e.g. a stream)
+            top_n: Number of top papers to return (None for all)
+            days: Filter papers from the past N days
+            
+        Returns:
+            List of Paper objects sorted by upvotes (descending)
+        """
         # Calculate date threshold for filtering
         cutoff_date = datetime.now() - timedelta(days=days)
         
-        papers: list[Paper] = []
-        for item in raw_papers:
+        def recent(paper: Paper) -> bool:
             # Parse published date
-            published_str = item.get("publishedAt", "")
+            published_str = paper.get("published_at", "")
             try:
                 published_dt = datetime.fromisoformat(published_str.replace("Z", "+00:00"))
-                if published_dt.replace(tzinfo=None) < cutoff_date:
-                    continue
-            except (ValueError, TypeError):
+                return published_dt.replace(tzinfo=None) >= cutoff_date
+            except (ValueError, TypeError, AttributeError):
                 # If date parsing fails, include the paper anyway
-                pass
+                return True
+        
+        selected = (paper for paper in papers if recent(paper))
+        
+        # Sort by upvotes descending and return top_n (both stable for ties)
+        if top_n is None:
+            return sorted(selected, key=lambda p: p["upvotes"], reverse=True)
+        return heapq.nlargest(top_n, selected, key=lambda p: p["upvotes"])
+    
+    def fetch_papers_for_date(self, date: str) -> list[Paper]:
+        """
+        Fetch all papers featured on a given day.
+        
+        Args:
+            date: Day in YYYY-MM-DD format
             
-            # Extract paper info
-            paper_info = item.get("paper", {})
-            paper_id = paper_info.get("id", "")  # arXiv ID is in paper.id
+        Returns:
+            List of Paper objects in API order
             
-            paper: Paper = {
-                "title": paper_info.get("title", item.get("title", "Untitled")),
-                "link": f"https://huggingface.co/papers/{paper_id}",
-                "upvotes": paper_info.get("upvotes", 0),
-                "abstract": paper_info.get("summary", ""),
-                "published_at": published_str,
-                "arxiv_id": self.extract_arxiv_id(paper_id)
-            }
-            papers.append(paper)
-        
-        # Sort by upvotes descending and return top_n
-        papers.sort(key=lambda p: p["upvotes"], reverse=True)
-        return papers[:top_n]
+        Raises:
+            requests.RequestException: If API request fails
+            ValueError: If the response is not a JSON array
+        """
+        return [self.parse_item(item) for item in self.iter_raw(params={"date": date})]
+    
+    def parse_item(self, item: dict) -> Paper:
+        """
+        Convert a raw Daily Papers API item into a Paper.
+        
+        Args:
+            item: Raw API item
+            
+        Returns:
+            Paper object
+        """
+        paper_info = item.get("paper", {})
+        paper_id = paper_info.get("id", "")  # arXiv ID is in paper.id
+        
+        return {
+            "title": paper_info.get("title", item.get("title", "Untitled")),
+            "link": f"https://huggingface.co/papers/{paper_id}",
+            "upvotes": paper_info.get("upvotes", 0),
+            "abstract": paper_info.get("summary", ""),
+            "published_at": item.get("publishedAt", ""),
+            "arxiv_id": self.extract_arxiv_id(paper_id)
+        }
     
     def extract_arxiv_id(self, paper_id: str) -> Optional[str]:
         """
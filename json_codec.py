@@ -0,0 +1,121 @@
+"""
+JSON Codec
+
+One encode/decode interface for the JSON hot paths. Uses msgspec or orjson
+when either is installed (pip install msgspec / orjson) and falls back to
+the standard library with identical output otherwise.
+"""
+
+import json
+from typing import Any, Optional, Union
+
+try:
+    import msgspec
+except ImportError:  # optional
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:  # optional
+    orjson = None
+
+# Backends in order of preference
+BACKENDS = ("msgspec", "orjson", "json")
+
+
+def available_backends() -> list[str]:
+    """
+    List the backends that can be used in this environment.
+
+    Returns:
+        Backend names in order of preference ("json" is always available)
+    """
+    installed = {"msgspec": msgspec is not None, "orjson": orjson is not None, "json": True}
+    return [name for name in BACKENDS if installed[name]]
+
+
+class JsonCodec:
+    """Encodes and decodes JSON with the fastest available backend."""
+
+    def __init__(self, backend: Optional[str] = None):
+        """
+        Initialize JsonCodec.
+
+        Args:
+            backend: "msgspec", "orjson" or "json" (default: fastest installed)
+
+        Raises:
+            ValueError: If the backend is unknown or not installed
+        """
+        available = available_backends()
+        self.backend = backend or available[0]
+        if self.backend not in available:
+            raise ValueError(f"JSON backend {self.backend!r} is not available (available: {', '.join(available)})")
+        if self.backend == "msgspec":
+            self._encoder = msgspec.json.Encoder()
+            self._decoder = msgspec.json.Decoder()
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Decode a JSON document.
+
+        Args:
+            data: UTF-8 bytes or text
+
+        Returns:
+            Decoded value
+
+        Raises:
+            ValueError: If the document is invalid
+        """
+        if self.backend == "msgspec":
+            try:
+                return self._decoder.decode(data)
+            except msgspec.DecodeError as e:
+                raise ValueError(f"Invalid JSON: {e}") from e
+        if self.backend == "orjson":
+            return orjson.loads(data)
+        return json.loads(data)
+
+    def dumps(self, obj: Any, indent: bool = False) -> bytes:
+        """
+        Encode a value as UTF-8 JSON without escaping non-ASCII text.
+
+        Args:
+            obj: Value made of dicts, lists, strings, numbers, bools and None
+            indent: Pretty-print with 2-space indentation (as json.dump(indent=2))
+
+        Returns:
+            Encoded bytes (compact separators unless indented)
+        """
+        if self.backend == "msgspec":
+            encoded = self._encoder.encode(obj)
+            return msgspec.json.format(encoded, indent=2) if indent else encoded
+        if self.backend == "orjson":
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+        if indent:
+            return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+_default = JsonCodec()
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode with the default codec (see JsonCodec.loads)."""
+    return _default.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Encode with the default codec (see JsonCodec.dumps)."""
+    return _default.dumps(obj, indent)
+
+
+def backend() -> str:
+    """
+    Name of the default codec's backend.
+
+    Returns:
+        "msgspec", "orjson" or "json"
+    """
+    return _default.backend
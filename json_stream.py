@@ -0,0 +1,97 @@
+"""
+Streaming JSON
+
+Incrementally decodes the elements of a top-level JSON array from chunks,
+so large responses are never held as one string or one decoded list.
+"""
+
+import codecs
+import json
+from typing import Any, Iterable, Iterator, Union
+
+_WHITESPACE = " \t\n\r"
+
+
+def iter_json_array(chunks: Iterable[Union[bytes, str]]) -> Iterator[Any]:
+    """
+    Yield the elements of a JSON array as soon as each one is complete.
+
+    Only the undecoded tail of the input is buffered, so memory is bounded
+    by the largest element plus one chunk rather than by the payload.
+
+    Args:
+        chunks: UTF-8 bytes or text chunks (e.g., response.iter_content())
+
+    Yields:
+        Decoded array elements in order
+
+    Raises:
+        ValueError: If the input is not a well-formed JSON array
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    chunk_iter = iter(chunks)
+    buffer = ""
+    pos = 0
+    exhausted = False
+    state = "start"  # start -> value -> separator -> ... -> done
+
+    def read_more() -> bool:
+        nonlocal buffer, pos, exhausted
+        if exhausted:
+            return False
+        for chunk in chunk_iter:
+            text = utf8.decode(chunk) if isinstance(chunk, bytes) else chunk
+            if text:
+                buffer = buffer[pos:] + text
+                pos = 0
+                return True
+        buffer = buffer[pos:] + utf8.decode(b"", final=True)
+        pos = 0
+        exhausted = True
+        return False
+
+    while True:
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        if pos >= len(buffer):
+            if read_more():
+                continue
+            if state == "done":
+                return
+            raise ValueError("Unexpected end of JSON array")
+
+        char = buffer[pos]
+        if state == "done":
+            raise ValueError(f"Extra data after JSON array at {char!r}")
+        if state == "start":
+            if char != "[":
+                raise ValueError(f"Expected a JSON array, got {char!r}")
+            pos += 1
+            state = "first"
+        elif state == "first" and char == "]":
+            pos += 1
+            state = "done"
+        elif state == "separator":
+            if char == "]":
+                pos += 1
+                state = "done"
+            elif char == ",":
+                pos += 1
+                state = "value"
+            else:
+                raise ValueError(f"Expected ',' or ']' in JSON array, got {char!r}")
+        else:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if read_more():
+                    continue
+                raise
+            is_number = isinstance(value, (int, float)) and not isinstance(value, bool)
+            if is_number and end == len(buffer) and read_more():
+                # A number at the end of the buffer may continue in the next chunk
+                continue
+            pos = end
+            state = "separator"
+            yield value
@@ -9,13 +9,24 @@ import os
 import sys
 import argparse
 import logging
+from datetime import date
+from typing import TYPE_CHECKING, Optional, Union
 
-from dotenv import load_dotenv
+# Only lightweight modules are imported at startup. Clients (and with them
+# requests and xml.etree) are imported inside the stage that needs them, so
+# --help, argument errors and a missing webhook fail fast.
+from deadline import Deadline, DeadlineExceeded, parse_duration, DEFAULT_TIMEOUT
 
-from huggingface_client import HuggingFaceClient
-from slack_client import SlackClient
-from arxiv_category_client import ArxivCategoryClient
-from history_manager import HistoryManager
+if TYPE_CHECKING:
+    from huggingface_client import HuggingFaceClient
+    from arxiv_category_client import ArxivCategoryClient
+    from search_index import SearchIndex
+    from candidate_cache import CandidateCache
+    from paper_sources import PaperSource
+    from upvote_tracker import UpvoteTracker
+    from filter_expr import FilterExpression
+    from profiling import StageProfiler, NullProfiler
+    from coordinator import Coordinator
 
 
 # Configure logging
@@ -28,6 +39,15 @@ logger = logging.getLogger(__name__)
 # Default categories (Agent-related)
 DEFAULT_CATEGORIES = "cs.AI,cs.MA,cs.CL"
 
+# Slack always gets at least this long, so a late run still delivers its digest
+MIN_POST_TIMEOUT = 2.0
+
+# Hugging Face timeout when a fresh prefetch snapshot can stand in for the fetch
+REVALIDATE_TIMEOUT = 5.0
+
+# Candidate sources selectable with --sources (Hugging Face is always fetched)
+SOURCE_NAMES = ("huggingface", "arxiv")
+
 
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments."""
@@ -57,6 +77,13 @@ def parse_args() -> argparse.Namespace:
         default=DEFAULT_CATEGORIES,
         help=f"Comma-separated arXiv categories to filter (default: {DEFAULT_CATEGORIES})"
     )
+    parser.add_argument(
+        "--filter",
+        type=str,
+        default=None,
+        help='Filter expression, e.g. \'upvotes >= 10 and title ~ "agent" and '
+             'published >= 2026-01-01\' (combined with --categories)'
+    )
     parser.add_argument(
         "--no-category-filter",
         action="store_true",
@@ -67,113 +94,900 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Disable history tracking (allow duplicates)"
     )
+    parser.add_argument(
+        "--no-near-dup",
+        action="store_true",
+        help="Disable near-duplicate detection against recently sent papers"
+    )
+    parser.add_argument(
+        "--rank",
+        choices=["upvotes", "trending"],
+        default="upvotes",
+        help="Ranking mode: total upvotes or smoothed upvote velocity (default: upvotes)"
+    )
+    parser.add_argument(
+        "--profiles",
+        type=str,
+        default=None,
+        help="JSON file of keyword/seed-abstract profiles for relevance filtering"
+    )
+    parser.add_argument(
+        "--min-relevance",
+        type=float,
+        default=0.1,
+        help="Minimum TF-IDF cosine score against any profile (default: 0.1)"
+    )
+    parser.add_argument(
+        "--deadline",
+        type=parse_duration,
+        default=None,
+        help="Run-level time budget, e.g. 20s or 1.5m (default: none)"
+    )
+    parser.add_argument(
+        "--output",
+        choices=["text", "ndjson"],
+        default="text",
+        help="Stdout format: text digest, or NDJSON records of each stage's "
+             "surviving papers streamed as they are produced (default: text)"
+    )
+    parser.add_argument(
+        "--sources",
+        type=str,
+        default="huggingface",
+        help=f"Comma-separated candidate sources, fetched concurrently: {', '.join(SOURCE_NAMES)} "
+             "(default: huggingface)"
+    )
+    parser.add_argument(
+        "--max-prefetch-age",
+        type=parse_duration,
+        default=3 * 3600.0,
+        help="Snapshot age (e.g. 90m) within which a slow Hugging Face fetch "
+             "falls back to the prefetched snapshot (default: 3h)"
+    )
+    parser.add_argument(
+        "--no-enrich",
+        action="store_true",
+        help="Skip fetching authors, code links and comment counts for the selected papers"
+    )
+    parser.add_argument(
+        "--cluster",
+        action="store_true",
+        help="Group the digest under topic headings (TF-IDF spherical k-means)"
+    )
+    parser.add_argument(
+        "--profile-run",
+        choices=["cpu", "mem"],
+        default=None,
+        help="Profile each pipeline stage with cProfile (cpu) or tracemalloc (mem) "
+             "(default: $NOTIFICATOR_PROFILE, or off)"
+    )
+    parser.add_argument(
+        "--profile-dir",
+        type=str,
+        default=None,
+        help="Directory for profile reports (default: $NOTIFICATOR_PROFILE_DIR, or profiles)"
+    )
+    
+    subparsers = parser.add_subparsers(dest="command")
+    search_parser = subparsers.add_parser(
+        "search",
+        help="Search titles and abstracts of archived papers"
+    )
+    search_parser.add_argument("query", nargs="+", help="Search terms")
+    search_parser.add_argument(
+        "--limit",
+        type=int,
+        default=10,
+        help="Maximum number of results (default: 10)"
+    )
+    search_parser.add_argument(
+        "--from",
+        dest="date_from",
+        type=str,
+        default=None,
+        help="Earliest publication date (YYYY-MM-DD)"
+    )
+    search_parser.add_argument(
+        "--to",
+        dest="date_to",
+        type=str,
+        default=None,
+        help="Latest publication date (YYYY-MM-DD)"
+    )
+    search_parser.add_argument(
+        "--categories",
+        dest="search_categories",
+        type=str,
+        default=None,
+        help="Comma-separated arXiv categories to restrict results"
+    )
+    search_parser.add_argument(
+        "--sent-only",
+        action="store_true",
+        help="Only show papers that were posted to Slack"
+    )
+    
+    backfill_parser = subparsers.add_parser(
+        "backfill",
+        help="Load past Daily Papers over a date range into the archive"
+    )
+    backfill_parser.add_argument(
+        "--from",
+        dest="date_from",
+        type=date.fromisoformat,
+        required=True,
+        help="First day to backfill (YYYY-MM-DD)"
+    )
+    backfill_parser.add_argument(
+        "--to",
+        dest="date_to",
+        type=date.fromisoformat,
+        default=date.today(),
+        help="Last day to backfill (YYYY-MM-DD, default: today)"
+    )
+    backfill_parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Number of days fetched concurrently (default: 8)"
+    )
+    backfill_parser.add_argument(
+        "--mark-sent",
+        action="store_true",
+        help="Also add backfilled papers to history so they are never posted"
+    )
+    backfill_parser.add_argument(
+        "--checkpoint",
+        type=str,
+        default="backfill_checkpoint.json",
+        help="Checkpoint file for resuming (default: backfill_checkpoint.json)"
+    )
+    
+    subparsers.add_parser(
+        "prefetch",
+        help="Fetch the window and resolve categories ahead of the notify run "
+             "(uses the top-level --top-n, --days, --rank and --deadline)"
+    )
+    
+    coordinate_parser = subparsers.add_parser(
+        "coordinate",
+        help="Fetch and enrich candidates once, then build and deliver every "
+             "subscription's digest on a process pool (uses the top-level --days, "
+             "--rank, --sources, --deadline, --no-history and --dry-run)"
+    )
+    coordinate_parser.add_argument(
+        "--subscriptions",
+        type=str,
+        default="subscriptions.json",
+        help="Subscriptions JSON file (default: subscriptions.json)"
+    )
+    coordinate_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count)"
+    )
+    coordinate_parser.add_argument(
+        "--history-dir",
+        type=str,
+        default="history",
+        help="Directory of per-subscription history files (default: history)"
+    )
+    
+    schedule_parser = subparsers.add_parser(
+        "schedule",
+        help="Stay running and deliver each subscription at its own deliver_at time, "
+             "batching nearby times into one fetch (uses the top-level --days, --rank, "
+             "--sources, --deadline, --no-history, --no-enrich and --dry-run)"
+    )
+    schedule_parser.add_argument(
+        "--subscriptions",
+        type=str,
+        default="subscriptions.json",
+        help="Subscriptions JSON file (default: subscriptions.json)"
+    )
+    schedule_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count)"
+    )
+    schedule_parser.add_argument(
+        "--history-dir",
+        type=str,
+        default="history",
+        help="Directory of per-subscription history files (default: history)"
+    )
+    schedule_parser.add_argument(
+        "--window",
+        type=float,
+        default=15.0,
+        help="Minutes within which delivery times share one batch (default: 15)"
+    )
+    schedule_parser.add_argument(
+        "--latency-file",
+        type=str,
+        default="stage_latency.json",
+        help="File of measured stage latencies used to start batches early (default: stage_latency.json)"
+    )
+    schedule_parser.add_argument(
+        "--max-batches",
+        type=int,
+        default=None,
+        help="Exit after this many batches (default: run until interrupted)"
+    )
     return parser.parse_args()
 
 
-def main() -> int:
+def run_search(args: argparse.Namespace) -> int:
     """
-    Main entry point for Paper Notificator.
+    Run the search subcommand against the archived paper index.
     
     Returns:
-        0 on success, 1 on error
+        0 on success
     """
-    # Load environment variables from .env file
-    load_dotenv()
+    from search_index import SearchIndex
     
-    # Parse CLI arguments
-    args = parse_args()
+    # Loading folds in updates journaled by pipeline runs; keep them folded
+    index = SearchIndex()
+    index.save()
+    categories = None
+    if args.search_categories:
+        categories = [c.strip() for c in args.search_categories.split(",")]
     
-    # Validate required environment variables (skip in dry-run mode)
-    webhook_url = os.getenv("SLACK_WEBHOOK_URL")
-    if not webhook_url and not args.dry_run:
-        logger.error("SLACK_WEBHOOK_URL environment variable is required")
-        print("Error: SLACK_WEBHOOK_URL environment variable is not set", file=sys.stderr)
+    results = index.search(
+        " ".join(args.query),
+        limit=args.limit,
+        date_from=args.date_from,
+        date_to=args.date_to,
+        categories=categories,
+        sent_only=args.sent_only
+    )
+    
+    if not results:
+        print("No matching papers.")
+        return 0
+    
+    for r in results:
+        sent = f" [sent {r['sent_at']}]" if r.get("sent_at") else ""
+        cats = ",".join(r.get("categories", []))
+        print(f"{r['score']:7.2f}  {r['arxiv_id']}  {r['published_at']}  {r['title']}{sent}")
+        if cats:
+            print(f"         {cats}")
+    return 0
+
+
+def run_backfill(args: argparse.Namespace) -> int:
+    """
+    Run the backfill subcommand over a date range.
+    
+    Returns:
+        0 on success, 1 if any day failed to fetch
+    """
+    if args.date_from > args.date_to:
+        print("Error: --from must not be after --to", file=sys.stderr)
         return 1
     
+    from huggingface_client import HuggingFaceClient
+    from arxiv_category_client import ArxivCategoryClient
+    from history_manager import HistoryManager
+    from search_index import SearchIndex
+    from backfill import Backfiller
+    
+    backfiller = Backfiller(
+        HuggingFaceClient(),
+        ArxivCategoryClient(),
+        SearchIndex(),
+        history_manager=HistoryManager() if args.mark_sent else None,
+        checkpoint_path=args.checkpoint,
+        workers=args.workers
+    )
+    summary = backfiller.run(args.date_from, args.date_to)
+    
+    print(f"Backfilled {summary['days']} days ({summary['papers']} papers)")
+    if summary["failed_days"]:
+        print(f"Failed days (re-run to retry): {', '.join(summary['failed_days'])}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def fetch_candidates(
+    hf_client: "HuggingFaceClient",
+    candidate_cache: "CandidateCache",
+    deadline: Deadline,
+    timeout_cap: float = DEFAULT_TIMEOUT,
+    extra_sources: "Optional[list[PaperSource]]" = None
+) -> tuple[list[dict], list[dict], bool]:
+    """
+    Fetch the Daily Papers window and merge it into the candidate cache.
+    
+    Extra sources are fetched concurrently with Hugging Face and merged by
+    arXiv ID; categories they report are stored in the candidate cache.
+    Falls back to the cached candidates when the Hugging Face fetch fails
+    or the deadline leaves no budget for it.
+    
+    Returns:
+        (candidates, new or changed candidates, True if the cache was used as-is)
+    """
+    import requests
+    from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+    from paper_sources import PaperMerger, fetch_all
+    
+    merged = None
+    extra_papers: list[dict] = []
+    if deadline.allows(share=0.4):
+        stage = deadline.stage(share=0.4)
+        timeout = min(timeout_cap, stage.timeout())
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            extra_future = executor.submit(fetch_all, extra_sources, timeout) if extra_sources else None
+            try:
+                # Items are merged as they are decoded; the stream is cut off at the stage deadline
+                merged = candidate_cache.merge(
+                    hf_client.iter_raw(timeout=timeout, deadline=stage), hf_client.parse_item
+                )
+            except (requests.RequestException, ValueError, DeadlineExceeded) as e:
+                if not candidate_cache.entries:
+                    raise
+                logger.warning(f"Hugging Face fetch failed: {e}")
+            if extra_future is not None:
+                try:
+                    extra_papers = extra_future.result(timeout=None if stage.seconds is None else stage.remaining())
+                except FutureTimeout:
+                    logger.warning("Extra sources did not finish before the deadline; skipping them")
+        finally:
+            # Do not wait for a source that is still trickling in
+            executor.shutdown(wait=False)
+    
+    if merged is None:
+        papers, changed, stale = candidate_cache.papers(), [], True
+    else:
+        (papers, changed), stale = merged, False
+    
+    if extra_papers:
+        merger = PaperMerger()
+        merger.add(hf_client.name, papers)
+        merger.add("extra", extra_papers)
+        papers = merger.papers()
+        candidate_cache.set_categories({
+            p["arxiv_id"]: p["categories"] for p in extra_papers
+            if p.get("arxiv_id") and p.get("categories")
+        })
+        known = {p.get("arxiv_id") for p in changed}
+        changed = changed + [p for p in extra_papers if p.get("arxiv_id") not in known]
+    
+    if not stale:
+        # Evict categories only after extra sources are merged, so theirs survive
+        candidate_cache.retain_categories(p["arxiv_id"] for p in papers if p.get("arxiv_id"))
+    
+    return papers, changed, stale
+
+
+def build_filter(args: argparse.Namespace) -> "Optional[FilterExpression]":
+    """
+    Compile --filter and the --categories set into one filter expression.
+    
+    Returns:
+        Compiled expression, or None if nothing is filtered
+    
+    Raises:
+        FilterError: If the expression is invalid
+    """
+    from filter_expr import compile_filter
+    
+    target_categories = None
+    if not args.no_category_filter:
+        target_categories = [c.strip() for c in args.categories.split(",") if c.strip()]
+        logger.info(f"Filtering by categories: {target_categories}")
+    return compile_filter(args.filter, target_categories)
+
+
+def build_sources(args: argparse.Namespace, arxiv_client: "ArxivCategoryClient") -> "list[PaperSource]":
+    """
+    Build the candidate sources selected with --sources, besides Hugging Face.
+    
+    Args:
+        args: Parsed arguments
+        arxiv_client: arXiv client shared with category resolution, so the
+            listing goes through the same circuit breaker and state file
+    
+    Returns:
+        List of extra PaperSource instances
+    """
+    from paper_sources import ArxivListingSource
+    
+    names = [n.strip() for n in args.sources.split(",") if n.strip()]
+    unknown = [n for n in names if n not in SOURCE_NAMES]
+    if unknown:
+        raise ValueError(f"Unknown sources: {', '.join(unknown)}")
+    
+    sources = []
+    if "arxiv" in names:
+        categories = [c.strip() for c in args.categories.split(",")]
+        sources.append(ArxivListingSource(categories, client=arxiv_client))
+    return sources
+
+
+def rank_candidates(args: argparse.Namespace, upvote_tracker: "UpvoteTracker", papers: list[dict]) -> list[dict]:
+    """
+    Order candidates by --rank, giving papers found only by extra sources
+    turns with the ranked Hugging Face papers (they have no upvotes).
+    
+    Returns:
+        Ranked candidates
+    """
+    from paper_sources import interleave_sources
+    
+    if args.rank == "trending":
+        papers = upvote_tracker.rank_trending(papers)
+        logger.info("Ranked papers by upvote velocity")
+    return interleave_sources(papers)
+
+
+def resolve_categories(
+    arxiv_client: "ArxivCategoryClient",
+    candidate_cache: "CandidateCache",
+    search_index: "SearchIndex",
+    arxiv_ids: list[str],
+    deadline: Deadline
+) -> tuple[dict[str, list[str]], list[str]]:
+    """
+    Resolve arXiv categories, querying arXiv only for uncached IDs.
+    
+    Returns:
+        (categories by arXiv ID, IDs that remain unresolved)
+    """
+    paper_categories = candidate_cache.get_categories(arxiv_ids)
+    missing_ids = [aid for aid in arxiv_ids if aid not in paper_categories]
+    
+    if missing_ids and deadline.allows(share=0.6):
+        fetched_categories = arxiv_client.get_categories(
+            missing_ids, timeout=deadline.timeout(share=0.6)
+        )
+        candidate_cache.set_categories(fetched_categories)
+        search_index.set_categories(fetched_categories)
+        paper_categories.update(fetched_categories)
+        logger.info(f"Resolved categories for {len(fetched_categories)} uncached papers")
+    elif missing_ids:
+        logger.warning("Skipping arXiv lookup: deadline budget exhausted")
+    
+    return paper_categories, [aid for aid in missing_ids if aid not in paper_categories]
+
+
+def run_prefetch(args: argparse.Namespace) -> int:
+    """
+    Run the prefetch subcommand to warm caches ahead of the notify run.
+    
+    Returns:
+        0 on success, 1 on error
+    """
+    from huggingface_client import HuggingFaceClient
+    from arxiv_category_client import ArxivCategoryClient
+    from history_manager import HistoryManager
+    from search_index import SearchIndex
+    from candidate_cache import CandidateCache
+    from upvote_tracker import UpvoteTracker
+    
+    deadline = Deadline(args.deadline)
     try:
-        # Initialize clients
         hf_client = HuggingFaceClient()
-        arxiv_client = ArxivCategoryClient()
+        arxiv_client = ArxivCategoryClient(state_path="arxiv_state.json")
         history_manager = HistoryManager()
+        search_index = SearchIndex(load=False)
+        candidate_cache = CandidateCache()
+        upvote_tracker = UpvoteTracker()
         
-        # Cleanup old history entries
-        history_manager.cleanup(days=30)
+        papers, changed, stale = fetch_candidates(
+            hf_client, candidate_cache, deadline, extra_sources=build_sources(args, arxiv_client)
+        )
+        if stale:
+            print("Error: Hugging Face fetch failed; snapshot not refreshed", file=sys.stderr)
+            return 1
+        papers = hf_client.select(papers, top_n=None, days=args.days)
+        search_index.add(changed)
+        papers = rank_candidates(args, upvote_tracker, papers)
         
-        # Fetch more papers than needed to account for filtering
-        fetch_count = args.top_n * 3  # Fetch extra to account for filtering
-        logger.info(f"Fetching papers from past {args.days} days...")
-        papers = hf_client.fetch_papers(top_n=fetch_count, days=args.days)
-        logger.info(f"Fetched {len(papers)} papers from Hugging Face")
+        # Resolve categories for the candidates most likely to make the digest
+        sent_ids = set() if args.no_history else history_manager.get_sent_ids()
+        likely = [p for p in papers if p.get("arxiv_id") and p["arxiv_id"] not in sent_ids]
+        likely_ids = [p["arxiv_id"] for p in likely[:args.top_n * 3]]
+        _, unresolved = resolve_categories(arxiv_client, candidate_cache, search_index, likely_ids, deadline)
         
-        # Filter by history (exclude already sent papers)
-        if not args.no_history:
-            sent_ids = history_manager.get_sent_ids()
-            original_count = len(papers)
-            papers = [p for p in papers if p.get("arxiv_id") not in sent_ids]
-            logger.info(f"After history filter: {len(papers)} papers (excluded {original_count - len(papers)} duplicates)")
+        candidate_cache.save()
+        arxiv_client.save()
+        search_index.save()
+        print(
+            f"Prefetched {len(papers)} papers; categories for "
+            f"{len(likely_ids) - len(unresolved)}/{len(likely_ids)} likely candidates"
+        )
+        return 0
+    
+    except Exception as e:
+        logger.error(f"Error: {e}")
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+
+def gather_candidates(args: argparse.Namespace, deadline: Deadline) -> tuple[list[dict], dict[str, list[str]]]:
+    """
+    Fetch the window and resolve categories once for all subscriptions.
+    
+    Returns:
+        (ranked candidates, dict mapping arXiv ID to categories)
+    """
+    from huggingface_client import HuggingFaceClient
+    from arxiv_category_client import ArxivCategoryClient
+    from search_index import SearchIndex
+    from candidate_cache import CandidateCache
+    from upvote_tracker import UpvoteTracker
+    
+    hf_client = HuggingFaceClient()
+    arxiv_client = ArxivCategoryClient(state_path="arxiv_state.json")
+    search_index = SearchIndex(load=False)
+    candidate_cache = CandidateCache()
+    upvote_tracker = UpvoteTracker()
+    
+    snapshot_age = candidate_cache.age()
+    revalidate = snapshot_age is not None and snapshot_age <= args.max_prefetch_age
+    papers, changed, stale = fetch_candidates(
+        hf_client, candidate_cache, deadline,
+        timeout_cap=REVALIDATE_TIMEOUT if revalidate else DEFAULT_TIMEOUT,
+        extra_sources=build_sources(args, arxiv_client)
+    )
+    if stale:
+        logger.warning("Degraded run (stale candidates)")
+    papers = hf_client.select(papers, top_n=None, days=args.days)
+    if not args.dry_run:
+        upvote_tracker.record(papers)
+    search_index.add(changed)
+    papers = rank_candidates(args, upvote_tracker, papers)
+    
+    arxiv_ids = [p["arxiv_id"] for p in papers if p.get("arxiv_id")]
+    paper_categories, unresolved = resolve_categories(
+        arxiv_client, candidate_cache, search_index, arxiv_ids, deadline
+    )
+    if unresolved:
+        logger.warning(f"Degraded run (uncategorized fallback for {len(unresolved)} papers)")
+    
+    candidate_cache.save()
+    arxiv_client.save()
+    search_index.save()
+    return papers, paper_categories
+
+
+def enrich_results(coordinator: "Coordinator", results: list[dict], deadline: Deadline) -> list[dict]:
+    """
+    Add per-paper details to every subscription's digest in one pass.
+    
+    Returns:
+        Enriched results (unchanged when the deadline is nearly spent)
+    """
+    from paper_enricher import PaperEnricher
+    
+    if not deadline.allows(share=0.5):
+        logger.warning("Deadline nearly exhausted; sending digests without paper details")
+        return results
+    stage = deadline.stage(share=0.5)
+    enricher = PaperEnricher()
+    results = coordinator.enrich(results, enricher, timeout=stage.timeout(cap=10.0), deadline=stage)
+    enricher.save()
+    return results
+
+
+def print_results(results: list[dict]) -> None:
+    """Print every subscription's digest (dry run)."""
+    for result in results:
+        print(f"\n=== DRY RUN - {result['name']} ({len(result['papers'])} papers) ===\n")
+        print(result["digest"] or "No new papers matching criteria.")
+
+
+def run_coordinate(args: argparse.Namespace) -> int:
+    """
+    Run the coordinate subcommand for many subscriptions.
+    
+    Returns:
+        0 if every digest was delivered, 1 on error or failed deliveries
+    """
+    from subscriptions import load_subscriptions
+    from coordinator import Coordinator
+    
+    deadline = Deadline(args.deadline)
+    try:
+        subscriptions = load_subscriptions(args.subscriptions)
+        papers, paper_categories = gather_candidates(args, deadline)
+        coordinator = Coordinator(
+            subscriptions,
+            history_dir=None if args.no_history else args.history_dir,
+            workers=args.workers
+        )
+        results = coordinator.run(papers, paper_categories)
+        if not args.no_enrich:
+            results = enrich_results(coordinator, results, deadline)
         
-        # Filter by arXiv categories
-        if not args.no_category_filter:
-            target_categories = [c.strip() for c in args.categories.split(",")]
-            logger.info(f"Filtering by categories: {target_categories}")
+        if args.dry_run:
+            print_results(results)
+            return 0
+        
+        summary = coordinator.deliver(results, timeout=max(deadline.timeout(), MIN_POST_TIMEOUT))
+        print(
+            f"Delivered {len(summary['delivered'])}, empty {len(summary['empty'])}, "
+            f"failed {len(summary['failed'])} of {len(results)} subscriptions"
+        )
+        return 1 if summary["failed"] else 0
+    
+    except Exception as e:
+        logger.error(f"Error: {e}")
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+
+def run_schedule(args: argparse.Namespace) -> int:
+    """
+    Run the schedule subcommand: deliver subscriptions at their own times.
+    
+    Each batch of subscriptions due within --window minutes shares one fetch,
+    category lookup and enrichment pass, so upstream calls grow with the
+    number of delivery windows rather than the number of subscriptions.
+    
+    Returns:
+        0 if every batch was delivered, 1 on error or failed deliveries
+    """
+    from subscriptions import load_subscriptions
+    from coordinator import Coordinator
+    from scheduler import LatencyModel, Scheduler
+    
+    try:
+        subscriptions = load_subscriptions(args.subscriptions)
+    except (OSError, ValueError) as e:
+        logger.error(f"Error: {e}")
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    
+    latency = LatencyModel(args.latency_file)
+    history_dir = None if args.no_history else args.history_dir
+    
+    def prepare(batch: list[dict]) -> tuple["Coordinator", list[dict]]:
+        deadline = Deadline(args.deadline)
+        coordinator = Coordinator(batch, history_dir=history_dir, workers=args.workers)
+        with latency.measure("gather"):
+            papers, paper_categories = gather_candidates(args, deadline)
+        with latency.measure("process"):
+            results = coordinator.run(papers, paper_categories)
+        if not args.no_enrich:
+            with latency.measure("enrich"):
+                results = enrich_results(coordinator, results, deadline)
+        return coordinator, results
+    
+    def deliver(batch: list[dict], prepared: tuple["Coordinator", list[dict]]) -> dict:
+        coordinator, results = prepared
+        if args.dry_run:
+            print_results(results)
+            return {"delivered": [], "empty": [], "failed": []}
+        with latency.measure("deliver"):
+            summary = coordinator.deliver(results, timeout=max(Deadline(args.deadline).timeout(), MIN_POST_TIMEOUT))
+        logger.info(
+            f"Delivered {len(summary['delivered'])}, empty {len(summary['empty'])}, "
+            f"failed {len(summary['failed'])} of {len(results)} subscriptions"
+        )
+        return summary
+    
+    scheduler = Scheduler(subscriptions, prepare, deliver, window_minutes=args.window, latency=latency)
+    try:
+        failures = scheduler.run(max_batches=args.max_batches)
+    except KeyboardInterrupt:
+        logger.info("Scheduler stopped")
+        return 0
+    return 1 if failures else 0
+
+
+def run_notify(
+    args: argparse.Namespace,
+    webhook_url: Optional[str],
+    profiler: "Optional[Union[StageProfiler, NullProfiler]]" = None
+) -> int:
+    """
+    Fetch, filter and post the digest (the default command).
+    
+    Args:
+        args: Parsed CLI arguments
+        webhook_url: Slack webhook URL (unused in dry-run mode)
+        profiler: Per-stage profiler (default: disabled)
+    
+    Returns:
+        0 on success, 1 on error
+    """
+    from huggingface_client import HuggingFaceClient
+    from slack_client import SlackClient
+    from arxiv_category_client import ArxivCategoryClient
+    from history_manager import HistoryManager
+    from upvote_tracker import UpvoteTracker
+    from relevance_scorer import RelevanceScorer, load_profiles
+    from near_duplicate_detector import NearDuplicateDetector
+    from search_index import SearchIndex
+    from candidate_cache import CandidateCache
+    from ndjson_writer import NdjsonWriter, NullWriter
+    from profiling import NullProfiler
+    from arxiv_id_codec import PackedIdSet
+    
+    profiler = profiler or NullProfiler()
+    deadline = Deadline(args.deadline)
+    degraded: list[str] = []
+    stream = NdjsonWriter() if args.output == "ndjson" else NullWriter()
+    
+    try:
+        with profiler.stage("setup"):
+            # Initialize clients
+            hf_client = HuggingFaceClient()
+            arxiv_client = ArxivCategoryClient(state_path="arxiv_state.json")
+            history_manager = HistoryManager()
+            search_index = SearchIndex(load=False)
+            candidate_cache = CandidateCache()
+            upvote_tracker = UpvoteTracker()
+            use_near_dup = not args.no_history and not args.no_near_dup
+            near_dup_detector = None
+            if use_near_dup:
+                near_dup_detector = NearDuplicateDetector(
+                    os.path.join(os.path.dirname(history_manager.filepath), "lsh_index.json")
+                )
             
-            # Get arXiv IDs from papers
-            arxiv_ids = [p.get("arxiv_id") for p in papers if p.get("arxiv_id")]
+            # Cleanup old history entries and upvote snapshots
+            history_manager.cleanup(days=30)
+            upvote_tracker.prune(days=30)
+            if near_dup_detector:
+                near_dup_detector.cleanup(days=30)
             
-            if arxiv_ids:
-                # Fetch categories for all papers
-                paper_categories = arxiv_client.get_categories(arxiv_ids)
-                
-                # Filter papers by matching categories
-                filtered_papers = []
-                for paper in papers:
-                    arxiv_id = paper.get("arxiv_id")
-                    if not arxiv_id:
-                        continue  # Skip papers without arXiv ID
-                    
-                    categories = paper_categories.get(arxiv_id, [])
-                    if not categories:
-                        # If no category info available, include the paper (fallback)
-                        filtered_papers.append(paper)
-                    elif arxiv_client.matches_categories(categories, target_categories):
-                        filtered_papers.append(paper)
+            # Compile --filter and --categories into one predicate
+            predicate = build_filter(args)
+        
+        with profiler.stage("fetch"):
+            # Fetch more papers than needed to account for filtering
+            fetch_count = args.top_n * 3  # Fetch extra to account for filtering
+            logger.info(f"Fetching papers from past {args.days} days...")
+            snapshot_age = candidate_cache.age()
+            revalidate = snapshot_age is not None and snapshot_age <= args.max_prefetch_age
+            papers, changed, stale = fetch_candidates(
+                hf_client, candidate_cache, deadline,
+                timeout_cap=REVALIDATE_TIMEOUT if revalidate else DEFAULT_TIMEOUT,
+                extra_sources=build_sources(args, arxiv_client)
+            )
+            if stale:
+                degraded.append("stale candidates")
+            papers = hf_client.select(papers, top_n=None, days=args.days)
+            logger.info(f"Fetched {len(papers)} papers from Hugging Face")
+            
+            # Record upvote snapshots (not for dry runs) and archive new or changed papers
+            if not args.dry_run:
+                upvote_tracker.record(papers)
+            search_index.add(changed)
+            papers = rank_candidates(args, upvote_tracker, papers)
+            stream.emit("fetch", papers)
+        
+        with profiler.stage("filter"):
+            # Single pass over the window: history check plus the checks that need
+            # no arXiv data, then keep the best candidates for the costlier stages
+            sent_index = PackedIdSet() if args.no_history else history_manager.sent_index()
+            already_sent = sent_index.contains_many([p.get("arxiv_id") for p in papers])
+            original_count = len(papers)
+            papers = [
+                p for p, sent in zip(papers, already_sent)
+                if not sent and (predicate is None or predicate.prefilter(p))
+            ][:fetch_count]
+            logger.info(f"After history and prefilter: {len(papers)} of {original_count} papers")
+            stream.emit("history", papers)
+        
+        with profiler.stage("near_dup"):
+            # Filter near-duplicates of recently sent papers
+            if near_dup_detector:
+                original_count = len(papers)
+                papers = near_dup_detector.filter(papers)
+                logger.info(f"After near-duplicate filter: {len(papers)} papers (excluded {original_count - len(papers)})")
+                stream.emit("near_dup", papers)
+        
+        with profiler.stage("category"):
+            # Resolve categories only for survivors, then finish evaluating the filter
+            if predicate is not None and predicate.needs_categories:
+                arxiv_ids = [p.get("arxiv_id") for p in papers if p.get("arxiv_id")]
+                paper_categories: dict[str, list[str]] = {}
+                if arxiv_ids:
+                    # Fetch categories only for papers not in the candidate cache
+                    paper_categories, missing_ids = resolve_categories(
+                        arxiv_client, candidate_cache, search_index, arxiv_ids, deadline
+                    )
+                    if missing_ids:
+                        degraded.append("uncategorized fallback")
+                    stream.set_categories(paper_categories)
                 
-                papers = filtered_papers
+                # Papers without category info pass category checks (fallback)
+                papers = [
+                    p for p in papers
+                    if p.get("arxiv_id") and predicate.matches(p, paper_categories.get(p["arxiv_id"]))
+                ]
                 logger.info(f"After category filter: {len(papers)} papers")
+                stream.emit("category", papers)
+        
+        with profiler.stage("relevance"):
+            # Filter by relevance to keyword profiles
+            if args.profiles:
+                profiles = load_profiles(args.profiles)
+                scorer = RelevanceScorer()
+                papers = scorer.filter(papers, profiles, min_score=args.min_relevance)
+                scorer.save()
+                logger.info(f"After relevance filter: {len(papers)} papers")
+                stream.emit("relevance", papers)
         
         # Take top N papers
         papers = papers[:args.top_n]
         logger.info(f"Final: {len(papers)} papers to notify")
+        stream.emit("selected", papers)
+        
+        if degraded:
+            logger.warning(f"Degraded run ({', '.join(degraded)}): {len(papers)} papers in digest")
         
         if not papers:
             logger.info("No new papers matching criteria. Nothing to send.")
+            candidate_cache.save()
+            arxiv_client.save()
+            search_index.save()
             return 0
         
-        # Create Slack client and format digest
-        slack_client = SlackClient(webhook_url or "")
-        digest = slack_client.create_digest(papers)
+        if not args.no_enrich:
+            with profiler.stage("enrich"):
+                # Per-paper details for the final selection only, fetched concurrently
+                if deadline.allows(share=0.5):
+                    from paper_enricher import PaperEnricher
+                    stage = deadline.stage(share=0.5)
+                    enricher = PaperEnricher()
+                    papers = enricher.enrich(papers, timeout=stage.timeout(cap=10.0), deadline=stage)
+                    enricher.save()
+                    stream.emit("enrich", papers)
+                else:
+                    logger.warning("Deadline nearly exhausted; sending digest without paper details")
         
-        if args.dry_run:
-            # Dry run: print to stdout
-            print("\n=== DRY RUN - Slack Message ===\n")
-            print(digest)
-            print("\n=== END DRY RUN ===\n")
-            print(f"\nPapers that would be added to history:")
-            for p in papers:
-                print(f"  - {p.get('arxiv_id')}: {p.get('title')[:50]}...")
-        else:
-            # Post to Slack
-            logger.info("Posting digest to Slack...")
-            slack_client.post_message(digest)
-            logger.info("Successfully posted to Slack!")
+        clusters = None
+        if args.cluster:
+            with profiler.stage("cluster"):
+                from topic_clusterer import TopicClusterer
+                clusters = TopicClusterer().cluster(papers)
+                stream.emit("cluster", [p for group in clusters for p in group["papers"]])
+        
+        with profiler.stage("deliver"):
+            # Create Slack client and format digest
+            slack_client = SlackClient(webhook_url or "")
+            digest = slack_client.create_digest(papers, clusters=clusters)
             
-            # Update history with sent papers
-            if not args.no_history:
-                sent_arxiv_ids = [p.get("arxiv_id") for p in papers if p.get("arxiv_id")]
-                history_manager.add(sent_arxiv_ids)
-                history_manager.save()
-                logger.info(f"Updated history with {len(sent_arxiv_ids)} papers")
+            if args.dry_run and args.output == "ndjson":
+                # Records were already streamed; keep stdout machine-readable
+                pass
+            elif args.dry_run:
+                # Dry run: print to stdout
+                print("\n=== DRY RUN - Slack Message ===\n")
+                print(digest)
+                print("\n=== END DRY RUN ===\n")
+                print(f"\nPapers that would be added to history:")
+                for p in papers:
+                    print(f"  - {p.get('arxiv_id')}: {p.get('title')[:50]}...")
+            else:
+                # Post to Slack
+                logger.info("Posting digest to Slack...")
+                slack_client.post_message(digest, timeout=max(deadline.timeout(), MIN_POST_TIMEOUT))
+                logger.info("Successfully posted to Slack!")
+                stream.emit("sent", papers)
+                
+                # Update history with sent papers
+                if not args.no_history:
+                    sent_arxiv_ids = [p.get("arxiv_id") for p in papers if p.get("arxiv_id")]
+                    search_index.mark_sent(sent_arxiv_ids)
+                    history_manager.add(sent_arxiv_ids)
+                    history_manager.save()
+                    logger.info(f"Updated history with {len(sent_arxiv_ids)} papers")
+                    if near_dup_detector:
+                        near_dup_detector.add(papers)
+                        near_dup_detector.save()
         
+        with profiler.stage("persist"):
+            candidate_cache.save()
+            arxiv_client.save()
+            search_index.save()
         return 0
         
     except Exception as e:
@@ -182,5 +996,53 @@ def main() -> int:
         return 1
 
 
+def main() -> int:
+    """
+    Main entry point for Paper Notificator.
+    
+    Returns:
+        0 on success, 1 on error
+    """
+    # Parse CLI arguments
+    args = parse_args()
+    
+    # Load environment variables from .env file
+    from dotenv import load_dotenv
+    load_dotenv()
+    
+    # Profiling may also be enabled from the environment (or .env)
+    from profiling import create_profiler
+    try:
+        profiler = create_profiler(args.profile_run, args.profile_dir)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    
+    if args.command == "search":
+        with profiler.stage("search"):
+            return run_search(args)
+    if args.command == "backfill":
+        with profiler.stage("backfill"):
+            return run_backfill(args)
+    if args.command == "prefetch":
+        with profiler.stage("prefetch"):
+            return run_prefetch(args)
+    if args.command == "coordinate":
+        with profiler.stage("coordinate"):
+            return run_coordinate(args)
+    if args.command == "schedule":
+        with profiler.stage("schedule"):
+            return run_schedule(args)
+    
+    # Validate required environment variables (skip in dry-run mode)
+    webhook_url = os.getenv("SLACK_WEBHOOK_URL")
+    if not webhook_url and not args.dry_run:
+        logger.error("SLACK_WEBHOOK_URL environment variable is required")
+        print("Error: SLACK_WEBHOOK_URL environment variable is not set", file=sys.stderr)
+        return 1
+    
+    return run_notify(args, webhook_url, profiler)
+
+
 if __name__ == "__main__":
     sys.exit(main())
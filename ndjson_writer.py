@@ -0,0 +1,64 @@
+"""
+NDJSON Writer
+
+Streams the papers surviving each pipeline stage as newline-delimited JSON.
+"""
+
+import json
+import sys
+from typing import Optional, TextIO
+
+
+class NdjsonWriter:
+    """Writes one JSON record per paper per stage and flushes after each stage."""
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        """
+        Initialize NdjsonWriter.
+
+        Args:
+            stream: Output stream (default: sys.stdout)
+        """
+        self.stream = stream or sys.stdout
+        self.categories: dict[str, list[str]] = {}
+
+    def set_categories(self, paper_categories: dict[str, list[str]]) -> None:
+        """
+        Remember resolved categories so later records include them.
+
+        Args:
+            paper_categories: Dict mapping arXiv ID to categories
+        """
+        self.categories.update(paper_categories)
+
+    def emit(self, stage: str, papers: list[dict]) -> None:
+        """
+        Write one record per paper for a stage.
+
+        Each record holds the stage name, its position in the stage output,
+        every paper field (scores included), and the resolved categories.
+
+        Args:
+            stage: Stage name (e.g., "fetch", "category", "selected")
+            papers: Papers surviving the stage, in rank order
+        """
+        lines = []
+        for rank, paper in enumerate(papers, 1):
+            record = {"stage": stage, "rank": rank, **paper}
+            if "categories" not in record:
+                record["categories"] = self.categories.get(paper.get("arxiv_id"), [])
+            lines.append(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+
+        if lines:
+            self.stream.write("\n".join(lines) + "\n")
+            self.stream.flush()
+
+
+class NullWriter:
+    """Drop-in writer used when NDJSON output is disabled."""
+
+    def set_categories(self, paper_categories: dict[str, list[str]]) -> None:
+        """Ignore categories."""
+
+    def emit(self, stage: str, papers: list[dict]) -> None:
+        """Ignore records."""
@@ -0,0 +1,265 @@
+"""
+Near-Duplicate Detector
+
+Detects near-identical papers with MinHash signatures and an LSH band index.
+"""
+
+import json
+import os
+import random
+import logging
+import zlib
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Optional
+
+from text_utils import tokenize, paper_text
+
+logger = logging.getLogger(__name__)
+
+# Mersenne prime used for the universal hash family
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+class NearDuplicateDetector:
+    """MinHash-LSH index of recently sent papers."""
+
+    def __init__(
+        self,
+        filepath: str = "lsh_index.json",
+        num_perm: int = 64,
+        bands: int = 16,
+        threshold: float = 0.7,
+        shingle_size: int = 3,
+        seed: int = 1
+    ):
+        """
+        Initialize NearDuplicateDetector.
+
+        Args:
+            filepath: Path to the persisted signature index
+            num_perm: Number of MinHash permutations (must be divisible by bands)
+            bands: Number of LSH bands
+            threshold: Minimum estimated Jaccard similarity to call a duplicate
+            shingle_size: Number of tokens per shingle
+            seed: Seed for the hash permutations (must stay stable across runs)
+        """
+        if num_perm % bands != 0:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.filepath = filepath
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.seed = seed
+
+        rng = random.Random(seed)
+        self._perms = [
+            (rng.randrange(1, _PRIME), rng.randrange(0, _PRIME))
+            for _ in range(num_perm)
+        ]
+
+        self.entries: dict[str, dict] = {}
+        self.buckets: dict[tuple, list[str]] = defaultdict(list)
+        self.load()
+
+    def load(self) -> int:
+        """
+        Load signatures from the index file and rebuild the LSH buckets.
+
+        Returns:
+            Number of indexed papers
+        """
+        self.entries = {}
+        self.buckets = defaultdict(list)
+
+        if not os.path.exists(self.filepath):
+            logger.info(f"LSH index not found, creating new: {self.filepath}")
+            return 0
+
+        try:
+            with open(self.filepath, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if any(data.get(k) != v for k, v in self._params().items()):
+                logger.warning("LSH index was built with different parameters. Starting with empty index.")
+                return 0
+            for paper_id, entry in data.get("papers", {}).items():
+                self._index(paper_id, entry)
+            logger.info(f"Loaded {len(self.entries)} signatures from LSH index")
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Failed to load LSH index: {e}. Starting with empty index.")
+            self.entries = {}
+            self.buckets = defaultdict(list)
+
+        return len(self.entries)
+
+    def save(self) -> None:
+        """Save signatures to the index file."""
+        data = {**self._params(), "papers": self.entries}
+        with open(self.filepath, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        logger.info(f"Saved {len(self.entries)} signatures to {self.filepath}")
+
+    def _params(self) -> dict:
+        """Parameters the stored signatures and bands depend on."""
+        return {
+            "num_perm": self.num_perm,
+            "bands": self.bands,
+            "seed": self.seed,
+            "shingle_size": self.shingle_size
+        }
+
+    def signature(self, text: str) -> list[int]:
+        """
+        Compute the MinHash signature of a text.
+
+        Args:
+            text: Raw text (title and abstract)
+
+        Returns:
+            List of num_perm minimum hash values
+        """
+        tokens = tokenize(text)
+        n = self.shingle_size
+        if len(tokens) >= n:
+            shingles = {" ".join(tokens[i:i + n]) for i in range(len(tokens) - n + 1)}
+        else:
+            shingles = set(tokens)
+
+        if not shingles:
+            return [_MAX_HASH] * self.num_perm
+
+        hashes = [zlib.crc32(s.encode('utf-8')) for s in shingles]
+        return [
+            min((a * h + b) % _PRIME for h in hashes) & _MAX_HASH
+            for a, b in self._perms
+        ]
+
+    def similarity(self, sig_a: list[int], sig_b: list[int]) -> float:
+        """
+        Estimate Jaccard similarity from two signatures.
+
+        Args:
+            sig_a: First signature
+            sig_b: Second signature
+
+        Returns:
+            Fraction of agreeing positions
+        """
+        return sum(a == b for a, b in zip(sig_a, sig_b)) / self.num_perm
+
+    def find_duplicate(self, paper: dict) -> Optional[tuple[str, float]]:
+        """
+        Find the most similar indexed paper above the threshold.
+
+        Args:
+            paper: Paper with title and abstract
+
+        Returns:
+            (paper ID, similarity) of the best match, or None
+        """
+        return self._best_match(self.signature(paper_text(paper)), self.buckets, self.entries)
+
+    def filter(self, papers: list[dict]) -> list[dict]:
+        """
+        Drop papers that near-duplicate an indexed paper or an earlier paper in the batch.
+
+        Args:
+            papers: Candidate papers in rank order
+
+        Returns:
+            Papers that are not near-duplicates (order preserved)
+        """
+        batch_buckets: dict[tuple, list[str]] = defaultdict(list)
+        batch_entries: dict[str, dict] = {}
+        kept = []
+
+        for i, paper in enumerate(papers):
+            paper_id = paper.get("arxiv_id") or f"batch-{i}"
+            sig = self.signature(paper_text(paper))
+
+            match = self._best_match(sig, self.buckets, self.entries, exclude=paper_id)
+            if match is None:
+                match = self._best_match(sig, batch_buckets, batch_entries, exclude=paper_id)
+            if match is not None:
+                logger.info(f"Dropping {paper_id}: near-duplicate of {match[0]} (similarity {match[1]:.2f})")
+                continue
+
+            batch_entries[paper_id] = {"sig": sig}
+            for key in self._band_keys(sig):
+                batch_buckets[key].append(paper_id)
+            kept.append(paper)
+
+        return kept
+
+    def add(self, papers: list[dict]) -> None:
+        """
+        Index papers as sent today.
+
+        Args:
+            papers: Sent papers with arxiv_id, title and abstract
+        """
+        today = datetime.now().strftime("%Y-%m-%d")
+        for paper in papers:
+            paper_id = paper.get("arxiv_id")
+            if not paper_id or paper_id in self.entries:
+                continue
+            self._index(paper_id, {"sig": self.signature(paper_text(paper)), "sent_at": today})
+
+    def cleanup(self, days: int = 30) -> int:
+        """
+        Remove signatures older than specified days.
+
+        Args:
+            days: Number of days to keep entries
+
+        Returns:
+            Number of entries removed
+        """
+        cutoff_str = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+        entries = self.entries
+        kept = {pid: e for pid, e in entries.items() if e.get("sent_at", "9999-99-99") >= cutoff_str}
+        removed = len(entries) - len(kept)
+
+        if removed > 0:
+            self.entries = {}
+            self.buckets = defaultdict(list)
+            for paper_id, entry in kept.items():
+                self._index(paper_id, entry)
+            logger.info(f"Removed {removed} old entries from LSH index")
+
+        return removed
+
+    def _index(self, paper_id: str, entry: dict) -> None:
+        """Store an entry and register it in every band bucket."""
+        self.entries[paper_id] = entry
+        for key in self._band_keys(entry["sig"]):
+            self.buckets[key].append(paper_id)
+
+    def _band_keys(self, sig: list[int]) -> list[tuple]:
+        """Split a signature into hashable per-band bucket keys."""
+        r = self.rows
+        return [(band, *sig[band * r:(band + 1) * r]) for band in range(self.bands)]
+
+    def _best_match(
+        self,
+        sig: list[int],
+        buckets: dict[tuple, list[str]],
+        entries: dict[str, dict],
+        exclude: Optional[str] = None
+    ) -> Optional[tuple[str, float]]:
+        """Verify LSH candidates against the threshold and return the best one."""
+        candidates = set()
+        for key in self._band_keys(sig):
+            candidates.update(buckets.get(key, ()))
+        candidates.discard(exclude)
+
+        best = None
+        for candidate in candidates:
+            score = self.similarity(sig, entries[candidate]["sig"])
+            if score >= self.threshold and (best is None or score > best[1]):
+                best = (candidate, score)
+        return best
@@ -0,0 +1,177 @@
+"""
+Paper Enricher
+
+Adds authors, code and project links and comment counts to the selected
+papers from Hugging Face's per-paper API, with a persistent cache.
+"""
+
+import json
+import os
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, Optional
+
+from deadline import Deadline
+
+logger = logging.getLogger(__name__)
+
+# Fields added to enriched papers
+DETAIL_FIELDS = ("authors", "github", "project_page", "comments")
+
+
+def parse_details(item: dict) -> dict:
+    """
+    Extract digest fields from a per-paper API response.
+
+    Args:
+        item: JSON object from /api/papers/{id}
+
+    Returns:
+        Dict with authors (visible names), github, project_page and comments
+    """
+    authors = [
+        author.get("name") for author in item.get("authors") or []
+        if isinstance(author, dict) and author.get("name") and not author.get("hidden")
+    ]
+    comments = item.get("numComments")
+    return {
+        "authors": authors,
+        "github": item.get("githubRepo") or None,
+        "project_page": item.get("projectPage") or None,
+        "comments": comments if isinstance(comments, int) else None,
+    }
+
+
+class PaperEnricher:
+    """Fetches per-paper details concurrently and memoizes them by arXiv ID."""
+
+    API_URL = "https://huggingface.co/api/papers/{arxiv_id}"
+
+    def __init__(
+        self,
+        filepath: Optional[str] = "paper_details.json",
+        max_workers: int = 4,
+        max_age_hours: float = 24.0,
+        retention_days: int = 30,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Initialize PaperEnricher.
+
+        Args:
+            filepath: Path to the details cache JSON file (None to disable persistence)
+            max_workers: Maximum concurrent requests
+            max_age_hours: Cached details older than this are refetched (comment
+                counts and links change; authors do not)
+            retention_days: Cache entries unused for this long are dropped on save
+            clock: Wall-clock function
+        """
+        self.filepath = filepath
+        self.max_workers = max_workers
+        self.max_age_seconds = max_age_hours * 3600
+        self.retention_seconds = retention_days * 86400
+        self._clock = clock
+        self.entries: dict[str, dict] = {}
+        self.dirty = False
+        self.load()
+
+    def load(self) -> None:
+        """Load cached details from the JSON file."""
+        if not self.filepath or not os.path.exists(self.filepath):
+            return
+
+        try:
+            with open(self.filepath, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f).get("entries", {})
+            logger.info(f"Loaded details for {len(self.entries)} papers")
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Failed to load paper details cache: {e}. Starting with empty cache.")
+            self.entries = {}
+
+    def save(self) -> None:
+        """Save cached details, dropping expired entries (only if changed)."""
+        if not self.filepath or not self.dirty:
+            return
+
+        cutoff = self._clock() - self.retention_seconds
+        self.entries = {aid: e for aid, e in self.entries.items() if e.get("fetched_at", 0) >= cutoff}
+        with open(self.filepath, 'w', encoding='utf-8') as f:
+            json.dump({"entries": self.entries}, f, ensure_ascii=False)
+        self.dirty = False
+        logger.info(f"Saved details for {len(self.entries)} papers to {self.filepath}")
+
+    def fetch_details(self, arxiv_id: str, timeout: float = 10) -> dict:
+        """
+        Fetch one paper's details.
+
+        Args:
+            arxiv_id: arXiv ID
+            timeout: Request timeout in seconds
+
+        Returns:
+            Parsed details (see parse_details)
+
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        import requests
+
+        response = requests.get(self.API_URL.format(arxiv_id=arxiv_id), timeout=timeout)
+        response.raise_for_status()
+        return parse_details(response.json())
+
+    def enrich(self, papers: list[dict], timeout: float = 10, deadline: Optional[Deadline] = None) -> list[dict]:
+        """
+        Add details to papers, fetching only uncached or stale ones.
+
+        Misses are fetched on a bounded thread pool, so the stage costs about
+        one round-trip rather than one per paper. Papers whose fetch fails
+        or does not finish before the deadline are returned unchanged.
+
+        Args:
+            papers: Selected papers (the final top N)
+            timeout: Per-request timeout in seconds
+            deadline: Stop waiting for fetches when this expires
+
+        Returns:
+            New paper dicts with DETAIL_FIELDS added where available
+        """
+        now = self._clock()
+        missing = []
+        for paper in papers:
+            arxiv_id = paper.get("arxiv_id")
+            entry = self.entries.get(arxiv_id) if arxiv_id else None
+            if arxiv_id and (entry is None or now - entry.get("fetched_at", 0) > self.max_age_seconds):
+                missing.append(arxiv_id)
+        missing = list(dict.fromkeys(missing))
+
+        if missing:
+            fetched = 0
+            executor = ThreadPoolExecutor(max_workers=min(self.max_workers, len(missing)))
+            try:
+                futures = {aid: executor.submit(self.fetch_details, aid, timeout) for aid in missing}
+                budget = None if deadline is None or deadline.seconds is None else deadline.remaining()
+                done, not_done = wait(futures.values(), timeout=budget)
+                if not_done:
+                    logger.warning(f"Deadline reached; {len(not_done)} papers left without details")
+                for arxiv_id, future in futures.items():
+                    if future not in done:
+                        continue
+                    try:
+                        details = future.result()
+                    except Exception as e:
+                        logger.warning(f"Failed to fetch details for {arxiv_id}: {e}")
+                        continue
+                    self.entries[arxiv_id] = {"fetched_at": now, "details": details}
+                    self.dirty = True
+                    fetched += 1
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
+            logger.info(f"Fetched details for {fetched} of {len(missing)} papers ({len(papers) - len(missing)} cached)")
+
+        enriched = []
+        for paper in papers:
+            entry = self.entries.get(paper.get("arxiv_id"))
+            enriched.append({**paper, **entry["details"]} if entry else paper)
+        return enriched
@@ -0,0 +1,222 @@
+"""
+Paper Sources
+
+Plugin interface for candidate sources and a concurrent merge stage.
+"""
+
+import re
+import logging
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import zip_longest
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from arxiv_category_client import ArxivCategoryClient
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_arxiv_id(arxiv_id: Optional[str]) -> Optional[str]:
+    """
+    Normalize an arXiv ID for deduplication.
+
+    Args:
+        arxiv_id: Raw ID (e.g., "arXiv:2501.12345v2", "CS/0601001")
+
+    Returns:
+        Lowercase ID without prefix or version suffix, or None
+    """
+    if not arxiv_id:
+        return None
+    normalized = arxiv_id.strip().lower()
+    if normalized.startswith("arxiv:"):
+        normalized = normalized[len("arxiv:"):]
+    return re.sub(r'v\d+$', '', normalized) or None
+
+
+class PaperSource(ABC):
+    """A source of candidate papers."""
+
+    name = "source"
+
+    @abstractmethod
+    def fetch(self, timeout: float = 30) -> list[dict]:
+        """
+        Fetch current candidate papers.
+
+        Args:
+            timeout: Request timeout in seconds
+
+        Returns:
+            List of paper dicts (title, link, upvotes, abstract, published_at, arxiv_id)
+
+        Raises:
+            requests.RequestException: If the source cannot be reached
+        """
+
+
+class ArxivListingSource(PaperSource):
+    """Newest submissions in a set of arXiv categories."""
+
+    name = "arxiv"
+
+    def __init__(
+        self,
+        categories: list[str],
+        max_results: int = 100,
+        client: Optional["ArxivCategoryClient"] = None
+    ):
+        """
+        Initialize ArxivListingSource.
+
+        Args:
+            categories: arXiv categories to list (e.g., ["cs.AI", "cs.CL"])
+            max_results: Maximum number of submissions to fetch
+            client: arXiv client whose circuit breaker and latency state the
+                listing shares (default: one persisting to arxiv_state.json)
+        """
+        from arxiv_category_client import ArxivCategoryClient
+
+        self.categories = categories
+        self.max_results = max_results
+        self.client = client or ArxivCategoryClient(state_path="arxiv_state.json")
+
+    def fetch(self, timeout: float = 30) -> list[dict]:
+        """
+        Fetch the newest submissions via the arXiv API.
+
+        Args:
+            timeout: Request timeout in seconds
+
+        Returns:
+            List of papers with categories and zero upvotes, newest first
+        """
+        return [
+            {
+                "title": entry["title"] or "Untitled",
+                "link": f"https://arxiv.org/abs/{entry['arxiv_id']}",
+                "upvotes": 0,
+                "abstract": entry["abstract"],
+                "published_at": entry["published_at"],
+                "arxiv_id": entry["arxiv_id"],
+                "categories": entry["categories"]
+            }
+            for entry in self.client.list_recent(self.categories, self.max_results, timeout)
+        ]
+
+
+class PaperMerger:
+    """Incrementally merges papers from several sources, deduplicating by arXiv ID."""
+
+    def __init__(self):
+        """Initialize an empty merge state."""
+        self._by_id: dict[str, dict] = {}
+        self._order: list[dict] = []
+
+    def add(self, source_name: str, papers: list[dict]) -> None:
+        """
+        Merge one source's papers.
+
+        The first source to report a paper provides its title, abstract and
+        link. Upvotes take the maximum, and categories and sources are unioned.
+        Papers that were already merged keep their own "sources" list.
+
+        Args:
+            source_name: Name of the reporting source
+            papers: Papers from that source
+        """
+        for paper in papers:
+            paper_sources = paper.get("sources") or [source_name]
+            key = normalize_arxiv_id(paper.get("arxiv_id"))
+            merged = self._by_id.get(key) if key else None
+            if merged is None:
+                merged = {**paper, "sources": list(paper_sources)}
+                if key:
+                    self._by_id[key] = merged
+                self._order.append(merged)
+                continue
+
+            merged["sources"] = merged["sources"] + [s for s in paper_sources if s not in merged["sources"]]
+            merged["upvotes"] = max(merged.get("upvotes", 0), paper.get("upvotes", 0))
+            for field in ("title", "abstract", "published_at"):
+                if not merged.get(field) and paper.get(field):
+                    merged[field] = paper[field]
+            if paper.get("categories"):
+                categories = list(merged.get("categories", []))
+                categories += [c for c in paper["categories"] if c not in categories]
+                merged["categories"] = categories
+
+    def papers(self) -> list[dict]:
+        """
+        Merged papers in first-seen order.
+
+        Returns:
+            List of merged papers
+        """
+        return list(self._order)
+
+
+def interleave_sources(papers: list[dict], primary: str = "huggingface") -> list[dict]:
+    """
+    Alternate ranked papers with papers reported only by other sources.
+
+    Papers from other sources carry no upvotes, so ranking the merged list
+    by upvotes alone would put all of them behind every primary paper and
+    the top-N cut would never reach them. Primary papers (and papers
+    without a "sources" list) keep their ranked order; the others are
+    ordered newest first.
+
+    Args:
+        papers: Ranked papers
+        primary: Name of the source whose ranking is kept
+
+    Returns:
+        Papers taking turns from the two groups
+    """
+    ranked = [p for p in papers if primary in p.get("sources", [primary])]
+    if len(ranked) == len(papers):
+        return papers
+    others = sorted(
+        (p for p in papers if primary not in p.get("sources", [primary])),
+        key=lambda p: p.get("published_at") or "",
+        reverse=True
+    )
+
+    interleaved = []
+    for pair in zip_longest(ranked, others):
+        interleaved.extend(p for p in pair if p is not None)
+    return interleaved
+
+
+def fetch_all(sources: list[PaperSource], timeout: float = 30) -> list[dict]:
+    """
+    Fetch every source concurrently and merge results as they arrive.
+
+    A failing source is logged and skipped, so total latency is bounded by
+    the slowest source rather than the sum.
+
+    Args:
+        sources: Sources to fetch
+        timeout: Per-source request timeout in seconds
+
+    Returns:
+        Merged, deduplicated papers
+    """
+    merger = PaperMerger()
+    if not sources:
+        return merger.papers()
+
+    with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+        futures = {executor.submit(source.fetch, timeout): source for source in sources}
+        for future in as_completed(futures):
+            source = futures[future]
+            try:
+                papers = future.result()
+            except Exception as e:
+                logger.error(f"Source {source.name} failed: {e}")
+                continue
+            logger.info(f"Source {source.name} returned {len(papers)} papers")
+            merger.add(source.name, papers)
+
+    return merger.papers()
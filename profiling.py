@@ -0,0 +1,211 @@
+"""
+Stage Profiling
+
+Optional per-stage CPU (cProfile) or memory (tracemalloc) profiles for
+production runs, enabled with --profile-run or the NOTIFICATOR_PROFILE variable.
+"""
+
+import os
+import logging
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from typing import Iterator, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+PROFILE_MODES = ("cpu", "mem")
+
+# Environment equivalents of --profile-run and --profile-dir
+PROFILE_ENV = "NOTIFICATOR_PROFILE"
+PROFILE_DIR_ENV = "NOTIFICATOR_PROFILE_DIR"
+
+# Frames kept per allocation traceback in memory mode
+TRACEBACK_FRAMES = 10
+
+# Depth limit when unfolding the call graph into collapsed stacks
+MAX_STACK_DEPTH = 64
+
+
+def _label(func: tuple) -> str:
+    """Format a pstats function key (file, line, name) as a stack frame."""
+    filename, line, name = func
+    if filename == "~":
+        return name
+    return f"{os.path.basename(filename)}:{line}({name})"
+
+
+def collapse_stats(stats: dict) -> list[str]:
+    """
+    Unfold pstats call-graph data into collapsed stacks for flame graphs.
+
+    cProfile records caller/callee edges rather than full stacks, so each
+    function's own time is split across its callers in proportion to the
+    cumulative time of each edge. The result is an approximation that is
+    exact for call trees.
+
+    Args:
+        stats: pstats.Stats.stats mapping func -> (cc, nc, tt, ct, callers)
+
+    Returns:
+        Lines of "frame;frame;frame microseconds", heaviest first
+    """
+    callees: dict[tuple, dict[tuple, float]] = {}
+    for func, (_, _, _, _, callers) in stats.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, {})[func] = edge[3]
+
+    totals: dict[str, float] = {}
+
+    def walk(func: tuple, path: tuple, weight: float) -> None:
+        _, _, own_time, cumulative, _ = stats[func]
+        stack = path + (_label(func),)
+        key = ";".join(stack)
+        totals[key] = totals.get(key, 0.0) + own_time * weight
+        if len(stack) >= MAX_STACK_DEPTH or cumulative <= 0:
+            return
+        for callee, edge_time in callees.get(func, {}).items():
+            if callee not in stats or _label(callee) in path:
+                continue
+            callee_cumulative = stats[callee][3]
+            if callee_cumulative > 0:
+                walk(callee, stack, weight * edge_time / callee_cumulative)
+
+    roots = [func for func, entry in stats.items() if not entry[4]]
+    for root in roots:
+        walk(root, (), 1.0)
+
+    micros = sorted(((round(seconds * 1e6), key) for key, seconds in totals.items()), reverse=True)
+    return [f"{key} {us}" for us, key in micros if us > 0]
+
+
+class StageProfiler:
+    """Profiles named pipeline stages and writes one report set per stage."""
+
+    def __init__(self, mode: str, output_dir: str = "profiles", top: int = 25):
+        """
+        Initialize StageProfiler.
+
+        Args:
+            mode: "cpu" for cProfile or "mem" for tracemalloc
+            output_dir: Directory for the report files
+            top: Number of allocation sites listed per memory report
+
+        Raises:
+            ValueError: If mode is not a known profile mode
+        """
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode: {mode!r} (expected one of {', '.join(PROFILE_MODES)})")
+        self.mode = mode
+        self.output_dir = output_dir
+        self.top = top
+        self.run_id = datetime.now().strftime("%Y%m%dT%H%M%S")
+        self.written: list[str] = []
+
+    def stage(self, name: str):
+        """
+        Context manager that profiles one stage.
+
+        Args:
+            name: Stage name used in the report file names
+
+        Returns:
+            Context manager wrapping the stage
+        """
+        if self.mode == "cpu":
+            return self._cpu_stage(name)
+        return self._mem_stage(name)
+
+    def _path(self, name: str, suffix: str) -> str:
+        os.makedirs(self.output_dir, exist_ok=True)
+        path = os.path.join(self.output_dir, f"{self.run_id}-{name}.{suffix}")
+        self.written.append(path)
+        return path
+
+    @contextmanager
+    def _cpu_stage(self, name: str) -> Iterator[None]:
+        import cProfile
+        import pstats
+
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            try:
+                profile.dump_stats(self._path(name, "pstats"))
+                stats = pstats.Stats(profile)
+                with open(self._path(name, "collapsed"), "w", encoding="utf-8") as f:
+                    f.writelines(line + "\n" for line in collapse_stats(stats.stats))
+                logger.info(f"CPU profile for stage {name}: {stats.total_tt * 1000:.1f} ms")
+            except IOError as e:
+                logger.warning(f"Failed to write CPU profile for stage {name}: {e}")
+
+    @contextmanager
+    def _mem_stage(self, name: str) -> Iterator[None]:
+        import tracemalloc
+
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start(TRACEBACK_FRAMES)
+        tracemalloc.reset_peak()
+        before = tracemalloc.take_snapshot()
+        try:
+            yield
+        finally:
+            after = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            if started:
+                tracemalloc.stop()
+            ignore = [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+            ]
+            diffs = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), "traceback")
+            diffs = [d for d in diffs if d.size_diff > 0][:self.top]
+            try:
+                with open(self._path(name, "allocations.txt"), "w", encoding="utf-8") as f:
+                    f.write(f"Stage: {name}\n")
+                    f.write(f"Peak traced memory: {peak / 1024:.1f} KiB\n")
+                    f.write(f"Traced memory at end: {current / 1024:.1f} KiB\n\n")
+                    for rank, diff in enumerate(diffs, 1):
+                        f.write(f"#{rank}: +{diff.size_diff / 1024:.1f} KiB in {diff.count_diff:+d} blocks\n")
+                        for line in diff.traceback.format(most_recent_first=True):
+                            f.write(f"    {line}\n")
+                logger.info(f"Memory profile for stage {name}: peak {peak / 1024:.1f} KiB")
+            except IOError as e:
+                logger.warning(f"Failed to write memory profile for stage {name}: {e}")
+
+
+class NullProfiler:
+    """Drop-in profiler used when profiling is disabled."""
+
+    _NULL_STAGE = nullcontext()
+
+    def stage(self, name: str) -> nullcontext:
+        """Return a shared no-op context manager."""
+        return self._NULL_STAGE
+
+
+def create_profiler(
+    mode: Optional[str] = None,
+    output_dir: Optional[str] = None
+) -> Union[StageProfiler, NullProfiler]:
+    """
+    Create a profiler from CLI values, falling back to the environment.
+
+    Args:
+        mode: "cpu", "mem", or None to read NOTIFICATOR_PROFILE
+        output_dir: Report directory, or None to read NOTIFICATOR_PROFILE_DIR
+
+    Returns:
+        StageProfiler if a mode is set, otherwise NullProfiler
+
+    Raises:
+        ValueError: If the mode is not a known profile mode
+    """
+    mode = mode or os.getenv(PROFILE_ENV) or None
+    if not mode:
+        return NullProfiler()
+    output_dir = output_dir or os.getenv(PROFILE_DIR_ENV) or "profiles"
+    return StageProfiler(mode.strip().lower(), output_dir)
@@ -0,0 +1,43 @@
+"""
+Rate Limiter
+
+Enforces a minimum interval between calls to a rate-limited API.
+"""
+
+import threading
+import time
+from typing import Callable
+
+
+class RateLimiter:
+    """Thread-safe limiter that spaces calls at least min_interval seconds apart."""
+
+    def __init__(
+        self,
+        min_interval: float = 3.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Initialize RateLimiter.
+
+        Args:
+            min_interval: Minimum seconds between two calls
+            clock: Monotonic clock function
+            sleep: Sleep function
+        """
+        self.min_interval = min_interval
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._next_allowed = 0.0
+
+    def wait(self) -> None:
+        """Block until the next call is allowed and reserve its slot."""
+        with self._lock:
+            now = self._clock()
+            delay = self._next_allowed - now
+            if delay > 0:
+                self._sleep(delay)
+                now += delay
+            self._next_allowed = now + self.min_interval
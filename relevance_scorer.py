@@ -0,0 +1,333 @@
+"""
+Relevance Scorer
+
+Scores papers against keyword / seed-abstract profiles with sparse TF-IDF vectors.
+"""
+
+import json
+import math
+import os
+import logging
+from collections import Counter
+from itertools import islice
+from typing import Optional
+
+import numpy as np
+
+from text_utils import tokenize, paper_text
+
+logger = logging.getLogger(__name__)
+
+SparseVector = dict[str, float]
+
+# Document frequencies that decay below this are dropped from the cache
+MIN_DOC_FREQ = 0.5
+
+
+def load_profiles(filepath: str) -> dict[str, dict]:
+    """
+    Load relevance profiles from a JSON file.
+
+    The file maps profile names to keywords and/or seed abstracts:
+    {"profiles": {"agents": {"keywords": ["agent", "tool use"], "seed_abstracts": ["..."]}}}
+
+    Args:
+        filepath: Path to the profiles JSON file
+
+    Returns:
+        Dict mapping profile name to profile definition
+
+    Raises:
+        ValueError: If the file has no usable profiles
+    """
+    with open(filepath, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    profiles = data.get("profiles", data)
+    profiles = {
+        name: profile for name, profile in profiles.items()
+        if isinstance(profile, dict) and (profile.get("keywords") or profile.get("seed_abstracts"))
+    }
+    if not profiles:
+        raise ValueError(f"No profiles with keywords or seed_abstracts in {filepath}")
+    return profiles
+
+
+class TfidfMatrix:
+    """L2-normalized TF-IDF vectors of a batch in CSR form, one row per document."""
+
+    def __init__(self, terms: list[str], data: np.ndarray, indices: np.ndarray, indptr: np.ndarray):
+        """
+        Initialize TfidfMatrix.
+
+        Args:
+            terms: Vocabulary; column j holds terms[j]
+            data: Non-zero weights, row by row
+            indices: Column of each weight
+            indptr: Row i spans data[indptr[i]:indptr[i + 1]]
+        """
+        self.terms = terms
+        self.vocabulary = {term: j for j, term in enumerate(terms)}
+        self.data = data
+        self.indices = indices
+        self.indptr = indptr
+        self.row_ids = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """(documents, terms)"""
+        return len(self.indptr) - 1, len(self.terms)
+
+    def dot(self, dense: np.ndarray) -> np.ndarray:
+        """
+        Multiply by a dense terms x k matrix.
+
+        Args:
+            dense: Array of shape (terms, k)
+
+        Returns:
+            Array of shape (documents, k)
+        """
+        result = np.zeros((self.shape[0], dense.shape[1]))
+        np.add.at(result, self.row_ids, self.data[:, None] * dense[self.indices])
+        return result
+
+    def row(self, i: int) -> np.ndarray:
+        """
+        One document as a dense vector.
+
+        Args:
+            i: Row index
+
+        Returns:
+            Array of shape (terms,)
+        """
+        vector = np.zeros(self.shape[1])
+        start, end = self.indptr[i], self.indptr[i + 1]
+        vector[self.indices[start:end]] = self.data[start:end]
+        return vector
+
+    def sum_rows(self, labels: np.ndarray, k: int) -> np.ndarray:
+        """
+        Sum the rows sharing each label.
+
+        Args:
+            labels: Label in [0, k) per row
+            k: Number of labels
+
+        Returns:
+            Array of shape (k, terms)
+        """
+        result = np.zeros((k, self.shape[1]))
+        np.add.at(result, (labels[self.row_ids], self.indices), self.data)
+        return result
+
+
+class RelevanceScorer:
+    """Ranks papers against profiles using TF-IDF cosine similarity."""
+
+    def __init__(self, cache_path: Optional[str] = "idf_cache.json", max_seen: int = 50000):
+        """
+        Initialize RelevanceScorer.
+
+        Args:
+            cache_path: Path to the persisted document-frequency cache (None to disable)
+            max_seen: Maximum number of counted paper IDs kept in the cache
+        """
+        self.cache_path = cache_path
+        self.max_seen = max_seen
+        self.doc_freq: Counter = Counter()
+        self.num_docs = 0
+        self.seen_ids: dict[str, None] = {}
+        self.load()
+
+    def load(self) -> None:
+        """Load document frequencies from the cache file."""
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return
+
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.doc_freq = Counter(data.get("doc_freq", {}))
+            self.num_docs = data.get("num_docs", 0)
+            self.seen_ids = dict.fromkeys(data.get("seen_ids", []))
+            self._trim()
+            logger.info(f"Loaded IDF cache with {len(self.doc_freq)} terms over {self.num_docs} documents")
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Failed to load IDF cache: {e}. Starting with empty vocabulary.")
+
+    def save(self) -> None:
+        """Save document frequencies to the cache file."""
+        if not self.cache_path:
+            return
+
+        data = {
+            "num_docs": self.num_docs,
+            "doc_freq": dict(self.doc_freq),
+            "seen_ids": list(self.seen_ids),
+        }
+        with open(self.cache_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+
+    def update(self, papers: list[dict]) -> int:
+        """
+        Add unseen papers to the document-frequency statistics.
+
+        Args:
+            papers: Papers with arxiv_id, title and abstract
+
+        Returns:
+            Number of newly counted papers
+        """
+        added = 0
+        for paper in papers:
+            key = paper.get("arxiv_id") or paper.get("title")
+            if not key or key in self.seen_ids:
+                continue
+            self.seen_ids[key] = None
+            self.doc_freq.update(set(tokenize(paper_text(paper))))
+            self.num_docs += 1
+            added += 1
+        self._trim()
+        return added
+
+    def _trim(self) -> None:
+        """
+        Forget the oldest papers beyond max_seen.
+
+        Their terms are unknown, so document frequencies decay in proportion
+        instead, keeping num_docs equal to the number of remembered papers.
+        A forgotten paper that shows up again is then counted only once.
+        """
+        excess = len(self.seen_ids) - self.max_seen
+        if excess > 0:
+            for key in list(islice(self.seen_ids, excess)):
+                del self.seen_ids[key]
+        if self.num_docs > len(self.seen_ids):
+            keep = len(self.seen_ids) / self.num_docs
+            self.doc_freq = Counter({
+                term: round(freq * keep, 3) for term, freq in self.doc_freq.items()
+                if freq * keep >= MIN_DOC_FREQ
+            })
+            self.num_docs = len(self.seen_ids)
+
+    def idf(self, term: str) -> float:
+        """
+        Smoothed inverse document frequency of a term.
+
+        Args:
+            term: Token
+
+        Returns:
+            IDF weight
+        """
+        return math.log((1 + self.num_docs) / (1 + self.doc_freq.get(term, 0))) + 1.0
+
+    def vectorize(self, text: str) -> SparseVector:
+        """
+        Build an L2-normalized TF-IDF vector for a text.
+
+        Args:
+            text: Raw text
+
+        Returns:
+            Sparse vector mapping term to weight
+        """
+        counts = Counter(tokenize(text))
+        vector = {term: (1 + math.log(tf)) * self.idf(term) for term, tf in counts.items()}
+        norm = math.sqrt(sum(w * w for w in vector.values()))
+        if norm == 0:
+            return {}
+        return {term: w / norm for term, w in vector.items()}
+
+    def profile_vectors(self, profiles: dict[str, dict]) -> dict[str, SparseVector]:
+        """
+        Vectorize each profile from its keywords and seed abstracts.
+
+        Args:
+            profiles: Profile definitions from load_profiles
+
+        Returns:
+            Dict mapping profile name to sparse vector
+        """
+        vectors = {}
+        for name, profile in profiles.items():
+            parts = list(profile.get("keywords", [])) + list(profile.get("seed_abstracts", []))
+            vectors[name] = self.vectorize("\n".join(parts))
+        return vectors
+
+    def matrix(self, texts: list[str]) -> TfidfMatrix:
+        """
+        Build the TF-IDF matrix of a batch in one pass.
+
+        Args:
+            texts: Raw texts, one per row
+
+        Returns:
+            TfidfMatrix with L2-normalized rows (all zero for texts without tokens)
+        """
+        vocabulary: dict[str, int] = {}
+        indices: list[int] = []
+        counts: list[int] = []
+        indptr = [0]
+        for text in texts:
+            for term, tf in Counter(tokenize(text)).items():
+                indices.append(vocabulary.setdefault(term, len(vocabulary)))
+                counts.append(tf)
+            indptr.append(len(indices))
+
+        terms = list(vocabulary)
+        idf = np.array([self.idf(term) for term in terms])
+        column = np.array(indices, dtype=np.int64)
+        data = (1 + np.log(np.array(counts, dtype=float))) * idf[column]
+        matrix = TfidfMatrix(terms, data, column, np.array(indptr, dtype=np.int64))
+        norms = np.sqrt(np.bincount(matrix.row_ids, weights=data * data, minlength=matrix.shape[0]))
+        matrix.data = data / norms[matrix.row_ids]
+        return matrix
+
+    def score(self, papers: list[dict], profiles: dict[str, dict]) -> list[dict[str, float]]:
+        """
+        Compute cosine similarity of every paper against every profile.
+
+        Papers form one sparse TF-IDF matrix and the profiles one dense
+        terms x profiles matrix, so all scores come from a single product.
+
+        Args:
+            papers: Papers with title and abstract
+            profiles: Profile definitions from load_profiles
+
+        Returns:
+            One dict per paper mapping profile name to score
+        """
+        names = list(profiles)
+        matrix = self.matrix([paper_text(paper) for paper in papers])
+        weights = np.zeros((matrix.shape[1], len(names)))
+        for j, vector in enumerate(self.profile_vectors(profiles).values()):
+            for term, weight in vector.items():
+                i = matrix.vocabulary.get(term)
+                if i is not None:
+                    weights[i, j] = weight
+
+        scores = matrix.dot(weights)
+        return [dict(zip(names, row.tolist())) for row in scores]
+
+    def filter(self, papers: list[dict], profiles: dict[str, dict], min_score: float = 0.1) -> list[dict]:
+        """
+        Keep papers whose best profile score reaches the threshold.
+
+        Args:
+            papers: Candidate papers
+            profiles: Profile definitions from load_profiles
+            min_score: Minimum cosine similarity to keep a paper
+
+        Returns:
+            Papers (order preserved) with "relevance" and "profile" fields added
+        """
+        self.update(papers)
+        kept = []
+        for paper, scores in zip(papers, self.score(papers, profiles)):
+            best = max(scores, key=scores.get)
+            if scores[best] >= min_score:
+                kept.append({**paper, "relevance": round(scores[best], 4), "profile": best})
+        return kept
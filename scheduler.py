@@ -0,0 +1,256 @@
+"""
+Delivery Scheduler
+
+Keeps subscriptions in a priority queue keyed by their next local delivery
+time. Subscriptions due within the same window form one batch that shares a
+single fetch and enrichment pass, and each batch starts early enough to meet
+its delivery time based on measured stage latencies.
+"""
+
+import heapq
+import json
+import os
+import logging
+import time
+from contextlib import contextmanager
+from datetime import datetime, time as time_of_day, timedelta
+from typing import Any, Callable, Iterator, Optional
+from zoneinfo import ZoneInfo
+
+from subscriptions import parse_time_of_day
+
+logger = logging.getLogger(__name__)
+
+# Estimates (seconds) used for stages that have never been measured
+DEFAULT_STAGE_SECONDS = {"gather": 30.0, "process": 5.0, "enrich": 10.0, "deliver": 5.0}
+
+# Batches start this many times the estimated pipeline latency ahead of time
+SAFETY_MARGIN = 1.5
+
+
+def next_delivery(subscription: dict, after: float) -> float:
+    """
+    Next delivery time of a subscription.
+
+    Args:
+        subscription: Subscription dict with deliver_at ("HH:MM") and timezone
+        after: UNIX timestamp; the result is strictly later
+
+    Returns:
+        UNIX timestamp of the next local delivery time
+    """
+    hour, minute = parse_time_of_day(subscription["deliver_at"])
+    zone = ZoneInfo(subscription["timezone"])
+    day = datetime.fromtimestamp(after, zone).date()
+    while True:
+        due = datetime.combine(day, time_of_day(hour, minute), tzinfo=zone).timestamp()
+        if due > after:
+            return due
+        day += timedelta(days=1)
+
+
+class LatencyModel:
+    """Exponential moving averages of stage latencies, persisted between runs."""
+
+    def __init__(
+        self,
+        filepath: Optional[str] = "stage_latency.json",
+        alpha: float = 0.3,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize LatencyModel.
+
+        Args:
+            filepath: Path to the latency JSON file (None to disable persistence)
+            alpha: Weight of the newest measurement
+            clock: Monotonic clock function
+        """
+        self.filepath = filepath
+        self.alpha = alpha
+        self._clock = clock
+        self.estimates: dict[str, float] = {}
+        self.load()
+
+    def load(self) -> None:
+        """Load estimates from the JSON file."""
+        if not self.filepath or not os.path.exists(self.filepath):
+            return
+
+        try:
+            with open(self.filepath, 'r', encoding='utf-8') as f:
+                self.estimates = {k: float(v) for k, v in json.load(f).get("stages", {}).items()}
+        except (json.JSONDecodeError, IOError, ValueError, TypeError, AttributeError) as e:
+            logger.warning(f"Failed to load stage latencies: {e}. Using defaults.")
+            self.estimates = {}
+
+    def save(self) -> None:
+        """Save estimates to the JSON file."""
+        if not self.filepath:
+            return
+
+        with open(self.filepath, 'w', encoding='utf-8') as f:
+            json.dump({"stages": self.estimates}, f, indent=2)
+
+    def observe(self, stage: str, seconds: float) -> None:
+        """
+        Fold one measurement into a stage's average.
+
+        Args:
+            stage: Stage name
+            seconds: Measured latency
+        """
+        previous = self.estimates.get(stage)
+        if previous is None:
+            self.estimates[stage] = seconds
+        else:
+            self.estimates[stage] = self.alpha * seconds + (1 - self.alpha) * previous
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        """
+        Time a block and record it under a stage (failures count too).
+
+        Args:
+            stage: Stage name
+        """
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self.observe(stage, self._clock() - start)
+
+    def estimate(self, stage: str) -> float:
+        """
+        Expected latency of a stage.
+
+        Args:
+            stage: Stage name
+
+        Returns:
+            Moving average in seconds (a default before the first measurement)
+        """
+        return self.estimates.get(stage, DEFAULT_STAGE_SECONDS.get(stage, 0.0))
+
+    def lead_time(self) -> float:
+        """
+        How long before a delivery time its batch should start.
+
+        Returns:
+            Seconds, including the safety margin
+        """
+        stages = set(DEFAULT_STAGE_SECONDS) | set(self.estimates)
+        return SAFETY_MARGIN * sum(self.estimate(stage) for stage in stages)
+
+
+class Scheduler:
+    """Runs batches of subscriptions in order of their next delivery time."""
+
+    def __init__(
+        self,
+        subscriptions: list[dict],
+        prepare: Callable[[list[dict]], Any],
+        deliver: Callable[[list[dict], Any], dict],
+        window_minutes: float = 15.0,
+        latency: Optional[LatencyModel] = None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Initialize Scheduler.
+
+        Args:
+            subscriptions: Subscriptions from load_subscriptions
+            prepare: Called once per batch to fetch and build its digests
+            deliver: Called with the batch and prepare's result at delivery
+                time; returns a summary like Coordinator.deliver
+            window_minutes: Subscriptions due within this long of the earliest
+                one share its batch (and are delivered at its time)
+            latency: Stage latency model (default: not persisted)
+            clock: Wall-clock function
+            sleep: Sleep function
+        """
+        self.prepare = prepare
+        self.deliver = deliver
+        self.window = window_minutes * 60
+        self.latency = latency or LatencyModel(filepath=None)
+        self._clock = clock
+        self._sleep = sleep
+        self._sequence = 0
+        self.queue: list[tuple[float, int, dict]] = []
+        now = clock()
+        for subscription in subscriptions:
+            self._push(next_delivery(subscription, now), subscription)
+
+    def _push(self, due: float, subscription: dict) -> None:
+        heapq.heappush(self.queue, (due, self._sequence, subscription))
+        self._sequence += 1
+
+    def _wait_until(self, timestamp: float) -> None:
+        delay = timestamp - self._clock()
+        if delay > 0:
+            self._sleep(delay)
+
+    def next_batch(self) -> tuple[float, list[dict]]:
+        """
+        Pop the subscriptions due in the next window.
+
+        Returns:
+            (delivery time of the batch, subscriptions in due order)
+        """
+        due, _, subscription = heapq.heappop(self.queue)
+        batch = [subscription]
+        while self.queue and self.queue[0][0] <= due + self.window:
+            batch.append(heapq.heappop(self.queue)[2])
+        return due, batch
+
+    def run_batch(self, due: float, batch: list[dict]) -> bool:
+        """
+        Prepare a batch ahead of its delivery time, deliver it, and requeue it.
+
+        Args:
+            due: Delivery time of the batch
+            batch: Subscriptions in the batch
+
+        Returns:
+            True if every digest was delivered
+        """
+        names = ", ".join(s["name"] for s in batch)
+        self._wait_until(due - self.latency.lead_time())
+        ok = False
+        try:
+            logger.info(f"Preparing batch for {datetime.fromtimestamp(due).isoformat()}: {names}")
+            prepared = self.prepare(batch)
+            self._wait_until(due - self.latency.estimate("deliver"))
+            summary = self.deliver(batch, prepared)
+            ok = not summary.get("failed")
+        except Exception as e:
+            logger.error(f"Batch {names} failed: {e}")
+        finally:
+            for subscription in batch:
+                self._push(next_delivery(subscription, due), subscription)
+            self.latency.save()
+
+        late = self._clock() - due
+        if late > 0:
+            logger.warning(f"Batch {names} finished {late:.1f}s after its delivery time")
+        return ok
+
+    def run(self, max_batches: Optional[int] = None) -> int:
+        """
+        Run batches in delivery order.
+
+        Args:
+            max_batches: Stop after this many batches (None to run forever)
+
+        Returns:
+            Number of batches with failed deliveries
+        """
+        failures = 0
+        count = 0
+        while self.queue and (max_batches is None or count < max_batches):
+            due, batch = self.next_batch()
+            if not self.run_batch(due, batch):
+                failures += 1
+            count += 1
+        return failures
@@ -0,0 +1,316 @@
+"""
+Search Index
+
+Persistent inverted index over titles and abstracts of fetched papers with BM25 ranking.
+"""
+
+import json
+import math
+import os
+import hashlib
+import logging
+from collections import Counter
+from datetime import datetime
+from typing import Optional
+
+from text_utils import tokenize, paper_text
+
+logger = logging.getLogger(__name__)
+
+# Journals larger than this are folded into the index by the writer itself
+COMPACT_JOURNAL_BYTES = 4 * 1024 * 1024
+
+
+class SearchIndex:
+    """Inverted index of archived papers supporting BM25 queries."""
+
+    def __init__(
+        self,
+        filepath: str = "search_index.json",
+        k1: float = 1.5,
+        b: float = 0.75,
+        load: bool = True
+    ):
+        """
+        Initialize SearchIndex.
+
+        Pipeline runs only feed the index, so they open it with load=False:
+        updates are then appended to a small journal next to the index file
+        instead of loading and rewriting the whole index. The journal is
+        folded in the next time the index is loaded (e.g., by search).
+
+        Args:
+            filepath: Path to the index JSON file
+            k1: BM25 term-frequency saturation
+            b: BM25 length normalization
+            load: Load the index (False to only journal updates)
+        """
+        self.filepath = filepath
+        self.journal_path = os.path.splitext(filepath)[0] + ".journal"
+        self.k1 = k1
+        self.b = b
+        self.loaded = load
+        self.docs: dict[str, dict] = {}
+        self.postings: dict[str, dict[str, int]] = {}
+        self.total_length = 0
+        self.pending: list[dict] = []
+        self.dirty = False
+        if load:
+            self.load()
+
+    def load(self) -> int:
+        """
+        Load the index from its JSON file and replay the journal.
+
+        Returns:
+            Number of indexed papers
+        """
+        self.docs = {}
+        self.postings = {}
+        self.total_length = 0
+
+        if os.path.exists(self.filepath):
+            try:
+                with open(self.filepath, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self.docs = data.get("docs", {})
+                self.postings = data.get("postings", {})
+                self.total_length = sum(d.get("length", 0) for d in self.docs.values())
+                logger.info(f"Loaded search index with {len(self.docs)} papers")
+            except (json.JSONDecodeError, IOError) as e:
+                logger.warning(f"Failed to load search index: {e}. Starting with empty index.")
+                self.docs = {}
+                self.postings = {}
+                self.total_length = 0
+        else:
+            logger.info(f"Search index not found, creating new: {self.filepath}")
+
+        self._replay_journal()
+        return len(self.docs)
+
+    def _replay_journal(self) -> None:
+        """Apply updates journaled by runs that did not load the index."""
+        if not os.path.exists(self.journal_path):
+            return
+
+        replayed = 0
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    self._apply(record)
+                    replayed += 1
+        except IOError as e:
+            logger.warning(f"Failed to read search index journal: {e}")
+            return
+
+        # Saving folds the journal into the index file
+        self.dirty = True
+        logger.info(f"Replayed {replayed} search index journal entries")
+
+    def save(self) -> None:
+        """Save the index (or append journaled updates) if it changed."""
+        if not self.dirty:
+            return
+
+        if not self.loaded:
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                f.writelines(json.dumps(r, ensure_ascii=False) + "\n" for r in self.pending)
+            logger.info(f"Journaled {len(self.pending)} search index updates to {self.journal_path}")
+            self.pending = []
+            self.dirty = False
+            if os.path.getsize(self.journal_path) > COMPACT_JOURNAL_BYTES:
+                self.compact()
+            return
+
+        data = {"docs": self.docs, "postings": self.postings}
+        with open(self.filepath, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        self.dirty = False
+        logger.info(f"Saved search index with {len(self.docs)} papers to {self.filepath}")
+
+    def compact(self) -> None:
+        """Load the index, fold the journal into it and save it."""
+        self.loaded = True
+        self.load()
+        self.save()
+
+    def _journal(self, record: dict) -> None:
+        """Queue an update for the journal (index not loaded)."""
+        self.pending.append(record)
+        self.dirty = True
+
+    def _apply(self, record: dict) -> None:
+        """Apply one journal record to the loaded index."""
+        op = record.get("op")
+        if op == "add":
+            self.add(record.get("papers", []))
+        elif op == "categories":
+            self.set_categories(record.get("categories", {}))
+        elif op == "sent":
+            self.mark_sent(record.get("ids", []), record.get("date"))
+
+    def add(self, papers: list[dict]) -> int:
+        """
+        Index new papers and re-index papers whose text changed.
+
+        Args:
+            papers: Papers with arxiv_id, title, abstract and published_at
+
+        Returns:
+            Number of papers (re-)indexed (journaled when the index is not loaded)
+        """
+        if not self.loaded:
+            fields = ("arxiv_id", "title", "abstract", "published_at")
+            journaled = [{k: p.get(k) for k in fields} for p in papers if p.get("arxiv_id")]
+            if journaled:
+                self._journal({"op": "add", "papers": journaled})
+            return len(journaled)
+
+        indexed = 0
+        for paper in papers:
+            doc_id = paper.get("arxiv_id")
+            if not doc_id:
+                continue
+
+            text = paper_text(paper)
+            digest = hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+            existing = self.docs.get(doc_id)
+            if existing and existing.get("hash") == digest:
+                continue
+            if existing:
+                self._remove_postings(doc_id)
+
+            terms = Counter(tokenize(text))
+            for term, tf in terms.items():
+                self.postings.setdefault(term, {})[doc_id] = tf
+
+            length = sum(terms.values())
+            self.total_length += length
+            self.docs[doc_id] = {
+                "title": paper.get("title", ""),
+                "published_at": (paper.get("published_at") or "")[:10],
+                "categories": (existing or {}).get("categories", []),
+                "sent_at": (existing or {}).get("sent_at"),
+                "length": length,
+                "hash": digest,
+                "terms": list(terms),
+            }
+            indexed += 1
+
+        if indexed:
+            self.dirty = True
+        return indexed
+
+    def set_categories(self, paper_categories: dict[str, list[str]]) -> None:
+        """
+        Attach arXiv categories to indexed papers.
+
+        Args:
+            paper_categories: Dict mapping arXiv ID to categories
+        """
+        if not self.loaded:
+            if paper_categories:
+                self._journal({"op": "categories", "categories": paper_categories})
+            return
+
+        for doc_id, categories in paper_categories.items():
+            doc = self.docs.get(doc_id)
+            if doc is not None and categories and doc.get("categories") != categories:
+                doc["categories"] = list(categories)
+                self.dirty = True
+
+    def mark_sent(self, paper_ids: list[str], date: Optional[str] = None) -> None:
+        """
+        Record that papers were posted to Slack.
+
+        Args:
+            paper_ids: Sent arXiv IDs
+            date: Date sent (YYYY-MM-DD, default: today)
+        """
+        date = date or datetime.now().strftime("%Y-%m-%d")
+        if not self.loaded:
+            if paper_ids:
+                self._journal({"op": "sent", "ids": list(paper_ids), "date": date})
+            return
+
+        for doc_id in paper_ids:
+            doc = self.docs.get(doc_id)
+            if doc is not None and not doc.get("sent_at"):
+                doc["sent_at"] = date
+                self.dirty = True
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        categories: Optional[list[str]] = None,
+        sent_only: bool = False
+    ) -> list[dict]:
+        """
+        Rank indexed papers against a query with BM25.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of results
+            date_from: Earliest publication date (YYYY-MM-DD, inclusive)
+            date_to: Latest publication date (YYYY-MM-DD, inclusive)
+            categories: Keep papers in any of these categories
+            sent_only: Keep only papers that were posted to Slack
+
+        Returns:
+            Result dicts (doc fields plus "arxiv_id" and "score"), best first
+        """
+        terms = set(tokenize(query))
+        if not terms or not self.docs:
+            return []
+
+        category_set = set(categories) if categories else None
+        num_docs = len(self.docs)
+        avg_length = self.total_length / num_docs if num_docs else 1.0
+
+        scores: dict[str, float] = {}
+        for term in terms:
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (num_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, tf in postings.items():
+                length = self.docs[doc_id]["length"]
+                norm = tf + self.k1 * (1 - self.b + self.b * length / avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1) / norm
+
+        results = []
+        for doc_id, score in sorted(scores.items(), key=lambda item: item[1], reverse=True):
+            doc = self.docs[doc_id]
+            published = doc.get("published_at", "")
+            if date_from and published < date_from:
+                continue
+            if date_to and published > date_to:
+                continue
+            if category_set is not None and not category_set.intersection(doc.get("categories", [])):
+                continue
+            if sent_only and not doc.get("sent_at"):
+                continue
+            fields = {k: v for k, v in doc.items() if k != "terms"}
+            results.append({**fields, "arxiv_id": doc_id, "score": round(score, 4)})
+            if len(results) >= limit:
+                break
+
+        return results
+
+    def _remove_postings(self, doc_id: str) -> None:
+        """Remove a document from the postings lists of its own terms."""
+        doc = self.docs[doc_id]
+        self.total_length -= doc.get("length", 0)
+        for term in doc.get("terms", []):
+            postings = self.postings.get(term)
+            if postings is not None and postings.pop(doc_id, None) is not None and not postings:
+                del self.postings[term]
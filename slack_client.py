@@ -6,9 +6,15 @@ Posts messages to Slack via Incoming Webhook.
 
 import requests
 import logging
+from typing import Optional
+
+import json_codec
 
 logger = logging.getLogger(__name__)
 
+# Authors listed per digest entry before "et al."
+MAX_AUTHORS = 3
+
 
 class SlackClient:
     """Client for posting messages to Slack via Webhook."""
@@ -22,12 +28,13 @@ class SlackClient:
         """
         self.webhook_url = webhook_url
     
-    def post_message(self, text: str) -> None:
+    def post_message(self, text: str, timeout: float = 30) -> None:
         """
         Post a message to Slack via Webhook.
         
         Args:
             text: The message text to post
+            timeout: Request timeout in seconds (default: 30)
             
         Raises:
             requests.RequestException: If webhook request fails
@@ -36,8 +43,9 @@ class SlackClient:
         
         response = requests.post(
             self.webhook_url,
-            json=payload,
-            timeout=30
+            data=json_codec.dumps(payload),
+            headers={"Content-Type": "application/json"},
+            timeout=timeout
         )
         
         if response.status_code != 200:
@@ -46,12 +54,14 @@ class SlackClient:
         
         logger.info("Message posted to Slack successfully")
     
-    def create_digest(self, papers: list[dict]) -> str:
+    def create_digest(self, papers: list[dict], clusters: Optional[list[dict]] = None) -> str:
         """
         Create a formatted digest message from a list of papers.
         
         Args:
             papers: List of paper dictionaries with title, link, upvotes, abstract
+            clusters: Optional topic groups ({"label", "papers"}) from TopicClusterer;
+                papers are then listed under labeled topic headings
             
         Returns:
             Formatted string for Slack message
@@ -61,21 +71,59 @@ class SlackClient:
         
         lines = ["📚 *Weekly Top Papers from Hugging Face*\n"]
         
-        for i, paper in enumerate(papers, 1):
-            title = paper.get("title", "Untitled")
-            link = paper.get("link", "")
-            upvotes = paper.get("upvotes", 0)
-            abstract = paper.get("abstract", "")
-            
-            # Truncate abstract if too long
-            if len(abstract) > 200:
-                abstract = abstract[:197] + "..."
-            
-            lines.append(f"*{i}. {title}*")
-            lines.append(f"   🔗 {link}")
-            lines.append(f"   👍 {upvotes} upvotes")
-            if abstract:
-                lines.append(f"   > {abstract}")
-            lines.append("")
+        if not clusters:
+            for i, paper in enumerate(papers, 1):
+                lines.extend(self._format_paper(i, paper))
+            return "\n".join(lines)
+        
+        # Numbering continues across topics so entries stay easy to reference
+        i = 0
+        for group in clusters:
+            lines.append(f"🏷️ *{group['label']}*\n")
+            for paper in group["papers"]:
+                i += 1
+                lines.extend(self._format_paper(i, paper))
         
         return "\n".join(lines)
+    
+    def _format_paper(self, index: int, paper: dict) -> list[str]:
+        """
+        Format one digest entry.
+        
+        Args:
+            index: Position in the digest (1-based)
+            paper: Paper dictionary
+            
+        Returns:
+            Lines of the entry, ending with a blank line
+        """
+        title = paper.get("title", "Untitled")
+        link = paper.get("link", "")
+        upvotes = paper.get("upvotes", 0)
+        abstract = paper.get("abstract", "")
+        
+        # Truncate abstract if too long
+        if len(abstract) > 200:
+            abstract = abstract[:197] + "..."
+        
+        lines = [f"*{index}. {title}*"]
+        authors = paper.get("authors")
+        if authors:
+            shown = ", ".join(authors[:MAX_AUTHORS])
+            lines.append(f"   ✍️ {shown}{' et al.' if len(authors) > MAX_AUTHORS else ''}")
+        
+        links = [f"🔗 {link}"]
+        if paper.get("github"):
+            links.append(f"💻 {paper['github']}")
+        if paper.get("project_page"):
+            links.append(f"🌐 {paper['project_page']}")
+        lines.append("   " + "  ".join(links))
+        
+        counts = f"   👍 {upvotes} upvotes"
+        if paper.get("comments"):
+            counts += f"  💬 {paper['comments']} comments"
+        lines.append(counts)
+        if abstract:
+            lines.append(f"   > {abstract}")
+        lines.append("")
+        return lines
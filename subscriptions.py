@@ -0,0 +1,103 @@
+"""
+Subscriptions
+
+Loads per-team digest subscriptions for coordinator runs.
+"""
+
+import json
+import re
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from filter_expr import compile_filter
+
+_NAME_PATTERN = re.compile(r'^[A-Za-z0-9_.-]+$')
+
+_TIME_PATTERN = re.compile(r'^([01]?\d|2[0-3]):([0-5]\d)$')
+
+# Environment variable holding the webhook when a subscription names none
+DEFAULT_WEBHOOK_ENV = "SLACK_WEBHOOK_URL"
+
+# Local delivery time and zone when a subscription names none
+DEFAULT_DELIVER_AT = "09:00"
+DEFAULT_TIMEZONE = "UTC"
+
+
+def parse_time_of_day(value: str) -> tuple[int, int]:
+    """
+    Parse a 24-hour "HH:MM" time.
+
+    Args:
+        value: Time string such as "09:30"
+
+    Returns:
+        (hour, minute)
+
+    Raises:
+        ValueError: If the string is not a valid time
+    """
+    match = _TIME_PATTERN.match(str(value))
+    if not match:
+        raise ValueError(f"Invalid delivery time {value!r} (use HH:MM)")
+    return int(match.group(1)), int(match.group(2))
+
+
+def load_subscriptions(filepath: str) -> list[dict]:
+    """
+    Load and validate subscriptions from a JSON file.
+
+    The file lists one entry per team:
+    {"subscriptions": [{"name": "agents-team", "categories": ["cs.AI", "cs.MA"],
+                        "filter": "upvotes >= 5", "top_n": 5,
+                        "webhook_env": "SLACK_WEBHOOK_AGENTS",
+                        "deliver_at": "09:00", "timezone": "Asia/Tokyo"}]}
+
+    Webhook URLs are read from the named environment variable so the file
+    can be committed. Every field except name is optional.
+
+    Args:
+        filepath: Path to the subscriptions JSON file
+
+    Returns:
+        List of normalized subscription dicts
+
+    Raises:
+        ValueError: If the file has no subscriptions or an entry is invalid
+    """
+    with open(filepath, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    entries = data.get("subscriptions", []) if isinstance(data, dict) else data
+    subscriptions = []
+    seen = set()
+    for entry in entries:
+        name = entry.get("name", "") if isinstance(entry, dict) else ""
+        if not _NAME_PATTERN.match(name):
+            raise ValueError(f"Invalid subscription name {name!r} in {filepath} (use letters, digits, _ . -)")
+        if name in seen:
+            raise ValueError(f"Duplicate subscription name {name!r} in {filepath}")
+        seen.add(name)
+
+        categories = entry.get("categories") or []
+        if isinstance(categories, str):
+            categories = [c.strip() for c in categories.split(",") if c.strip()]
+        subscription = {
+            "name": name,
+            "categories": list(categories),
+            "filter": entry.get("filter") or None,
+            "top_n": int(entry.get("top_n", 5)),
+            "webhook_env": entry.get("webhook_env") or DEFAULT_WEBHOOK_ENV,
+            "deliver_at": entry.get("deliver_at") or DEFAULT_DELIVER_AT,
+            "timezone": entry.get("timezone") or DEFAULT_TIMEZONE,
+        }
+        try:
+            parse_time_of_day(subscription["deliver_at"])
+            ZoneInfo(subscription["timezone"])
+        except (ValueError, ZoneInfoNotFoundError) as e:
+            raise ValueError(f"Subscription {name!r} in {filepath}: {e}") from e
+        # Fail on bad expressions at load time rather than inside a worker
+        compile_filter(subscription["filter"], subscription["categories"])
+        subscriptions.append(subscription)
+
+    if not subscriptions:
+        raise ValueError(f"No subscriptions in {filepath}")
+    return subscriptions
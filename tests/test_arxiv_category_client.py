@@ -82,3 +82,91 @@ def test_extract_id_from_url(client):
     """Test ID extraction from arXiv URL."""
     assert client._extract_id_from_url("http://arxiv.org/abs/2501.12345v1") == "2501.12345"
     assert client._extract_id_from_url("http://arxiv.org/abs/2501.67890") == "2501.67890"
+
+
+def test_get_categories_skipped_when_circuit_open(client):
+    """Test that an open circuit skips the API call."""
+    with patch('arxiv_category_client.requests.get') as mock_get:
+        import requests
+        mock_get.side_effect = requests.RequestException("API Error")
+        
+        for _ in range(client.circuit_breaker.failure_threshold):
+            client.get_categories(["2501.12345"])
+        mock_get.reset_mock()
+        
+        assert client.get_categories(["2501.12345"]) == {}
+        mock_get.assert_not_called()
+
+
+def test_hedged_request_returns_faster_response(mock_arxiv_response):
+    """Test that a slow first attempt is hedged and the hedge wins."""
+    import threading
+    release = threading.Event()
+    fast_response = MagicMock()
+    fast_response.text = mock_arxiv_response
+    calls = []
+    
+    def slow_then_fast(*args, **kwargs):
+        calls.append(kwargs["timeout"])
+        if len(calls) == 1:
+            release.wait(5)
+            return MagicMock()
+        return fast_response
+    
+    client = ArxivCategoryClient()
+    client.MIN_HEDGE_DELAY = 0.05
+    client.latencies = [0.01] * 10
+    with patch('arxiv_category_client.requests.get', side_effect=slow_then_fast):
+        result = client.get_categories(["2501.12345"], timeout=5)
+    release.set()
+    
+    assert len(calls) == 2
+    assert "2501.12345" in result
+
+
+def test_error_response_does_not_win_hedge(mock_arxiv_response):
+    """Test that a fast 503 counts as a failed attempt and is not timed."""
+    import time
+    import requests
+    slow_response = MagicMock()
+    slow_response.text = mock_arxiv_response
+    unavailable = MagicMock()
+    unavailable.raise_for_status.side_effect = requests.HTTPError("503 Service Unavailable")
+    calls = []
+    
+    def slow_then_unavailable(*args, **kwargs):
+        calls.append(kwargs["timeout"])
+        if len(calls) == 1:
+            time.sleep(0.3)
+            return slow_response
+        return unavailable
+    
+    client = ArxivCategoryClient()
+    client.MIN_HEDGE_DELAY = 0.05
+    client.latencies = [0.01] * 10
+    with patch('arxiv_category_client.requests.get', side_effect=slow_then_unavailable):
+        result = client.get_categories(["2501.12345"], timeout=5)
+    
+    assert len(calls) == 2
+    assert "2501.12345" in result
+    assert len(client.latencies) == 11
+    assert client.latencies[-1] >= 0.25
+
+
+def test_state_persisted(tmp_path, mock_arxiv_response):
+    """Test that latencies and circuit state are saved to the state file."""
+    import json
+    state_path = tmp_path / "arxiv_state.json"
+    client = ArxivCategoryClient(state_path=str(state_path))
+    with patch('arxiv_category_client.requests.get') as mock_get:
+        mock_response = MagicMock()
+        mock_response.text = mock_arxiv_response
+        mock_get.return_value = mock_response
+        client.get_categories(["2501.12345"])
+    assert not state_path.exists()
+    client.save()
+    
+    data = json.loads(state_path.read_text())
+    assert len(data["latencies"]) == 1
+    assert data["circuit"]["failures"] == 0
+    assert ArxivCategoryClient(state_path=str(state_path)).latencies == data["latencies"]
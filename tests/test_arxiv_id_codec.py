@@ -0,0 +1,51 @@
+"""Tests for the arXiv ID codec and PackedIdSet."""
+
+import numpy as np
+import pytest
+
+from arxiv_id_codec import PackedIdSet, decode_arxiv_id, encode_arxiv_id
+
+
+@pytest.mark.parametrize("arxiv_id", ["2501.12345", "1501.00001", "0704.0001", "1412.9999", "9912.99999"])
+def test_round_trip(arxiv_id):
+    """Test that canonical new-style IDs pack and unpack exactly."""
+    code = encode_arxiv_id(arxiv_id)
+    assert isinstance(code, int)
+    assert decode_arxiv_id(code) == arxiv_id
+
+
+@pytest.mark.parametrize("arxiv_id", [None, "", "cs/0601001", "2501.12345v2", "2501.1234", "1412.00001", "2513.12345"])
+def test_non_canonical_ids_are_not_packed(arxiv_id):
+    """Test that old-style, versioned and era-mismatched IDs fall back to strings."""
+    assert encode_arxiv_id(arxiv_id) is None
+
+
+def test_packed_order_matches_id_order():
+    """Test that packed codes sort like publication order."""
+    ids = ["0704.0001", "1412.9999", "1501.00001", "2501.00002", "2501.12345"]
+    codes = [encode_arxiv_id(i) for i in ids]
+    assert codes == sorted(codes)
+
+
+def test_packed_id_set_membership():
+    """Test membership for packed, old-style, missing and None IDs."""
+    ids = PackedIdSet(["2501.12345", "cs/0601001", "0704.0001", "2501.12345"])
+    assert len(ids) == 3
+    assert "2501.12345" in ids
+    assert "cs/0601001" in ids
+    assert "2501.12346" not in ids
+    assert None not in ids
+    assert ids.contains_many(["0704.0001", "hep-th/9901001", None, "2501.12345"]) == [True, False, False, True]
+    assert sorted(ids) == ["0704.0001", "2501.12345", "cs/0601001"]
+
+
+def test_add_many_keeps_codes_sorted():
+    """Test that merged batches keep the array sorted and unique."""
+    ids = PackedIdSet(f"2501.{i:05d}" for i in range(0, 2000, 2))
+    ids.add_many(["2501.00003", "2501.00004"])
+    ids.add_many(f"2502.{i:05d}" for i in range(500))
+    assert ids.codes.dtype == np.int64
+    assert ids.codes.tolist() == sorted(set(ids.codes.tolist()))
+    assert len(ids) == 1000 + 1 + 500
+    assert "2501.00003" in ids
+    assert "2502.00499" in ids
@@ -0,0 +1,130 @@
+"""Tests for Backfiller."""
+
+import pytest
+import os
+import tempfile
+import threading
+from datetime import date
+from unittest.mock import MagicMock
+
+from backfill import Backfiller, date_range
+from history_manager import HistoryManager
+from rate_limiter import RateLimiter
+from search_index import SearchIndex
+
+
+@pytest.fixture
+def tmpdir_path():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+def make_paper(day: str, n: int) -> dict:
+    return {
+        "arxiv_id": f"{day[2:4]}{day[5:7]}.{day[8:10]}{n:03d}",
+        "title": f"Paper {n} from {day}",
+        "abstract": "Agents and tools.",
+        "published_at": f"{day}T00:00:00.000Z",
+        "upvotes": n,
+    }
+
+
+@pytest.fixture
+def hf_client():
+    client = MagicMock()
+    client.fetch_papers_for_date.side_effect = lambda day: [make_paper(day, 1), make_paper(day, 2)]
+    return client
+
+
+@pytest.fixture
+def arxiv_client():
+    client = MagicMock()
+    client.get_categories.side_effect = lambda ids: {aid: ["cs.AI"] for aid in ids}
+    return client
+
+
+def make_backfiller(tmpdir, hf_client, arxiv_client, **kwargs):
+    return Backfiller(
+        hf_client,
+        arxiv_client,
+        SearchIndex(os.path.join(tmpdir, "search_index.json")),
+        checkpoint_path=os.path.join(tmpdir, "checkpoint.json"),
+        rate_limiter=RateLimiter(min_interval=0),
+        **kwargs
+    )
+
+
+def test_date_range():
+    """Test inclusive day listing."""
+    assert date_range(date(2025, 1, 30), date(2025, 2, 1)) == ["2025-01-30", "2025-01-31", "2025-02-01"]
+
+
+def test_run_indexes_all_days(tmpdir_path, hf_client, arxiv_client):
+    """Test that every day is fetched, categorized and archived."""
+    backfiller = make_backfiller(tmpdir_path, hf_client, arxiv_client, category_batch_size=3)
+    summary = backfiller.run(date(2025, 1, 1), date(2025, 1, 3))
+
+    assert summary == {"days": 3, "papers": 6, "failed_days": []}
+    index = SearchIndex(os.path.join(tmpdir_path, "search_index.json"))
+    assert len(index.docs) == 6
+    assert all(doc["categories"] == ["cs.AI"] for doc in index.docs.values())
+
+
+def test_resume_skips_completed_days(tmpdir_path, hf_client, arxiv_client):
+    """Test that a second run only fetches days missing from the checkpoint."""
+    make_backfiller(tmpdir_path, hf_client, arxiv_client).run(date(2025, 1, 1), date(2025, 1, 2))
+    hf_client.fetch_papers_for_date.reset_mock()
+
+    backfiller = make_backfiller(tmpdir_path, hf_client, arxiv_client)
+    summary = backfiller.run(date(2025, 1, 1), date(2025, 1, 3))
+
+    assert summary["days"] == 1
+    hf_client.fetch_papers_for_date.assert_called_once_with("2025-01-03")
+
+
+def test_failed_days_not_checkpointed(tmpdir_path, hf_client, arxiv_client):
+    """Test that failed days are reported and retried on the next run."""
+    def fetch(day):
+        if day == "2025-01-02":
+            raise Exception("API Error")
+        return [make_paper(day, 1)]
+    hf_client.fetch_papers_for_date.side_effect = fetch
+
+    backfiller = make_backfiller(tmpdir_path, hf_client, arxiv_client)
+    summary = backfiller.run(date(2025, 1, 1), date(2025, 1, 3))
+
+    assert summary["failed_days"] == ["2025-01-02"]
+    assert "2025-01-02" not in backfiller.completed
+
+
+def test_mark_sent_updates_history(tmpdir_path, hf_client, arxiv_client):
+    """Test that --mark-sent adds backfilled papers to history."""
+    history = HistoryManager(os.path.join(tmpdir_path, "history.json"))
+    backfiller = make_backfiller(tmpdir_path, hf_client, arxiv_client, history_manager=history)
+    backfiller.run(date(2025, 1, 1), date(2025, 1, 1))
+
+    assert history.get_sent_ids() == {"2501.01001", "2501.01002"}
+
+
+def test_interrupt_cancels_queued_days(tmpdir_path, hf_client, arxiv_client):
+    """Test that Ctrl-C stops fetching queued days and keeps the checkpoint."""
+    release = threading.Event()
+
+    def fetch(day):
+        if day == "2025-01-03":
+            raise KeyboardInterrupt
+        if day > "2025-01-03":
+            release.wait(timeout=5)
+        return [make_paper(day, 1)]
+    hf_client.fetch_papers_for_date.side_effect = fetch
+
+    backfiller = make_backfiller(tmpdir_path, hf_client, arxiv_client, workers=1, category_batch_size=1)
+    try:
+        with pytest.raises(KeyboardInterrupt):
+            backfiller.run(date(2025, 1, 1), date(2025, 1, 31))
+    finally:
+        release.set()
+
+    assert hf_client.fetch_papers_for_date.call_count <= 4
+    resumed = make_backfiller(tmpdir_path, hf_client, arxiv_client)
+    assert resumed.completed == {"2025-01-01", "2025-01-02"}
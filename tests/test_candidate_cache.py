@@ -0,0 +1,100 @@
+"""Tests for CandidateCache."""
+
+import pytest
+import os
+import tempfile
+from unittest.mock import MagicMock
+
+from candidate_cache import CandidateCache
+from huggingface_client import HuggingFaceClient
+
+
+@pytest.fixture
+def cache_path():
+    """Create a temporary candidate cache path."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield os.path.join(tmpdir, "candidate_cache.json")
+
+
+def make_item(paper_id: str, upvotes: int, published: str) -> dict:
+    return {
+        "publishedAt": published,
+        "paper": {"id": paper_id, "title": f"Paper {paper_id}", "summary": "Abstract.", "upvotes": upvotes},
+    }
+
+
+@pytest.fixture
+def items():
+    return [
+        make_item("2501.00001", 10, "2026-01-05T00:00:00.000Z"),
+        make_item("2501.00002", 5, "2026-01-06T00:00:00.000Z"),
+    ]
+
+
+@pytest.fixture
+def parse_item():
+    return MagicMock(side_effect=HuggingFaceClient().parse_item)
+
+
+def test_first_merge_parses_everything(cache_path, items, parse_item):
+    """Test that an empty cache parses all items and sets the watermark."""
+    cache = CandidateCache(cache_path)
+    candidates, changed = cache.merge(items, parse_item)
+
+    assert len(candidates) == 2
+    assert len(changed) == 2
+    assert cache.watermark == "2026-01-06T00:00:00.000Z"
+
+
+def test_unchanged_items_reuse_cache(cache_path, items, parse_item):
+    """Test that a saved cache only re-parses new or changed items."""
+    cache = CandidateCache(cache_path)
+    cache.merge(items, parse_item)
+    cache.save()
+
+    parse_item.reset_mock()
+    items[0]["paper"]["upvotes"] = 12
+    items.append(make_item("2501.00003", 1, "2026-01-07T00:00:00.000Z"))
+
+    reloaded = CandidateCache(cache_path)
+    candidates, changed = reloaded.merge(items, parse_item)
+
+    assert len(candidates) == 3
+    assert [p["arxiv_id"] for p in changed] == ["2501.00001", "2501.00003"]
+    assert changed[0]["upvotes"] == 12
+    assert parse_item.call_count == 2
+
+
+def test_categories_cached_and_evicted(cache_path, items, parse_item):
+    """Test that categories persist for live papers and are evicted once retained ids exclude them."""
+    cache = CandidateCache(cache_path)
+    cache.merge(items, parse_item)
+    cache.set_categories({"2501.00001": ["cs.AI"], "2501.00002": ["cs.CV"]})
+
+    assert cache.get_categories(["2501.00001", "2501.99999"]) == {"2501.00001": ["cs.AI"]}
+
+    cache.merge(items[:1], parse_item)
+    cache.retain_categories(["2501.00001"])
+    assert cache.get_categories(["2501.00002"]) == {}
+
+
+def test_content_hash_tracks_upvotes(items):
+    """Test that the content hash ignores the publish date but tracks upvotes."""
+    before = CandidateCache.content_hash(items[0])
+    items[0]["publishedAt"] = "2026-01-09T00:00:00.000Z"
+    assert CandidateCache.content_hash(items[0]) == before
+    items[0]["paper"]["upvotes"] += 1
+    assert CandidateCache.content_hash(items[0]) != before
+
+
+def test_age_tracks_last_fetch(cache_path, items, parse_item):
+    """Test that the snapshot age is unset until merged and survives a reload."""
+    cache = CandidateCache(cache_path)
+    assert cache.age() is None
+
+    cache.merge(items, parse_item)
+    cache.save()
+
+    reloaded = CandidateCache(cache_path)
+    assert 0 <= reloaded.age() < 60
+    assert [p["arxiv_id"] for p in reloaded.papers()] == ["2501.00001", "2501.00002"]
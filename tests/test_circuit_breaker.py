@@ -0,0 +1,54 @@
+"""Tests for CircuitBreaker."""
+
+from circuit_breaker import CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_opens_after_threshold():
+    """Test that the circuit opens after consecutive failures."""
+    clock = FakeClock()
+    breaker = CircuitBreaker("test", failure_threshold=2, cooldown_seconds=60, clock=clock)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert not breaker.allow()
+
+
+def test_half_open_after_cooldown():
+    """Test that a trial call is allowed after the cool-down."""
+    clock = FakeClock()
+    breaker = CircuitBreaker("test", failure_threshold=1, cooldown_seconds=60, clock=clock)
+    breaker.record_failure()
+    clock.now += 61
+    assert breaker.allow()
+
+    breaker.record_failure()
+    assert not breaker.allow()
+
+
+def test_success_closes_circuit():
+    """Test that a success resets the failure count."""
+    clock = FakeClock()
+    breaker = CircuitBreaker("test", failure_threshold=2, clock=clock)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.allow()
+
+
+def test_state_round_trip():
+    """Test that state survives serialization."""
+    clock = FakeClock()
+    breaker = CircuitBreaker("test", failure_threshold=1, clock=clock)
+    breaker.record_failure()
+
+    restored = CircuitBreaker("test", failure_threshold=1, clock=clock)
+    restored.load_dict(breaker.to_dict())
+    assert not restored.allow()
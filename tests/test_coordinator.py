@@ -0,0 +1,138 @@
+"""Tests for the subscription coordinator."""
+
+import json
+import os
+import tempfile
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from coordinator import Coordinator, process_subscription, read_snapshot, write_snapshot
+
+
+def make_papers(count=6):
+    return [
+        {
+            "arxiv_id": f"2601.0000{i}",
+            "title": f"Paper {i}",
+            "link": f"https://huggingface.co/papers/2601.0000{i}",
+            "upvotes": 100 - i * 10,
+            "abstract": "",
+        }
+        for i in range(count)
+    ]
+
+
+CATEGORIES = {
+    "2601.00000": ["cs.AI"],
+    "2601.00001": ["cs.CV"],
+    "2601.00002": ["cs.AI", "cs.CL"],
+    "2601.00003": ["cs.CV"],
+    "2601.00004": ["cs.AI"],
+}
+
+
+def subscription(name, categories=(), filter_text=None, top_n=5, webhook_env="TEST_HOOK"):
+    return {
+        "name": name, "categories": list(categories), "filter": filter_text,
+        "top_n": top_n, "webhook_env": webhook_env,
+    }
+
+
+@pytest.fixture
+def history_dir():
+    with tempfile.TemporaryDirectory() as d:
+        yield d
+
+
+def test_process_subscription_filters_and_limits(history_dir):
+    """Test categories, filter expression, uncategorized fallback and top_n."""
+    result = process_subscription(
+        subscription("ai", ["cs.AI"], "upvotes >= 60", top_n=2), make_papers(), CATEGORIES, history_dir
+    )
+    assert result["arxiv_ids"] == ["2601.00000", "2601.00002"]
+    assert "*1. Paper 0*" in result["digest"]
+
+    result = process_subscription(subscription("cv", ["cs.CV"]), make_papers(), CATEGORIES, history_dir)
+    # 2601.00005 has no categories and passes (uncategorized fallback)
+    assert result["arxiv_ids"] == ["2601.00001", "2601.00003", "2601.00005"]
+
+
+def test_process_subscription_skips_history(history_dir):
+    """Test that papers in the subscription's own history are skipped."""
+    with open(os.path.join(history_dir, "ai.json"), "w") as f:
+        json.dump({"sent_papers": [{"id": "2601.00000", "sent_at": "2099-01-01"}]}, f)
+
+    result = process_subscription(subscription("ai", ["cs.AI"]), make_papers(), CATEGORIES, history_dir)
+    other = process_subscription(subscription("other", ["cs.AI"]), make_papers(), CATEGORIES, history_dir)
+    assert "2601.00000" not in result["arxiv_ids"]
+    assert "2601.00000" in other["arxiv_ids"]
+
+
+def test_snapshot_round_trip(history_dir):
+    """Test that the snapshot file decodes to the same candidates."""
+    path = os.path.join(history_dir, "snapshot.json")
+    write_snapshot(path, make_papers(), CATEGORIES)
+    papers, categories = read_snapshot(path)
+    assert papers == make_papers()
+    assert categories == CATEGORIES
+
+
+def test_shards_cover_all_subscriptions():
+    """Test that shards are contiguous and cover every subscription once."""
+    subscriptions = [subscription(f"s{i}") for i in range(10)]
+    shards = Coordinator(subscriptions, workers=2).shards()
+    assert len(shards) <= 8
+    assert [s for shard in shards for s in shard] == subscriptions
+
+
+def test_process_pool_matches_in_process(history_dir):
+    """Test that sharded worker processes give the in-process results in order."""
+    subscriptions = [
+        subscription(f"s{i}", [["cs.AI"], ["cs.CV"], []][i % 3], f"upvotes >= {i * 5}", top_n=1 + i % 3)
+        for i in range(9)
+    ]
+    expected = Coordinator(subscriptions, history_dir, workers=1).run(make_papers(), CATEGORIES)
+    results = Coordinator(subscriptions, history_dir, workers=2, snapshot_dir=history_dir).run(
+        make_papers(), CATEGORIES
+    )
+    assert results == expected
+    assert os.listdir(history_dir) == []
+
+
+def test_deliver_posts_and_updates_history(history_dir, monkeypatch):
+    """Test delivery, missing webhooks, empty digests and history updates."""
+    monkeypatch.setenv("TEST_HOOK", "https://hooks.example/test")
+    monkeypatch.delenv("MISSING_HOOK", raising=False)
+    subscriptions = [
+        subscription("ai", ["cs.AI"], top_n=1),
+        subscription("nohook", ["cs.AI"], webhook_env="MISSING_HOOK"),
+        subscription("none", ["q-bio.*"], filter_text="upvotes > 1000"),
+    ]
+    coordinator = Coordinator(subscriptions, history_dir, workers=1)
+    results = coordinator.run(make_papers(), CATEGORIES)
+
+    with patch("slack_client.SlackClient.post_message") as mock_post:
+        summary = coordinator.deliver(results)
+
+    assert summary == {"delivered": ["ai"], "empty": ["none"], "failed": ["nohook"]}
+    assert mock_post.call_count == 1
+    with open(os.path.join(history_dir, "ai.json")) as f:
+        assert [p["id"] for p in json.load(f)["sent_papers"]] == ["2601.00000"]
+    assert not os.path.exists(os.path.join(history_dir, "nohook.json"))
+
+
+def test_enrich_fetches_shared_papers_once(history_dir):
+    """Test that papers selected by several subscriptions are enriched once."""
+    subscriptions = [subscription("ai", ["cs.AI"], top_n=2), subscription("all", top_n=2)]
+    coordinator = Coordinator(subscriptions, history_dir, workers=1)
+    results = coordinator.run(make_papers(), CATEGORIES)
+    enricher = MagicMock()
+    enricher.enrich.side_effect = lambda papers, timeout, deadline: [{**p, "authors": ["Ada"]} for p in papers]
+
+    enriched = coordinator.enrich(results, enricher)
+
+    assert enricher.enrich.call_count == 1
+    assert [p["arxiv_id"] for p in enricher.enrich.call_args[0][0]] == ["2601.00000", "2601.00002", "2601.00001"]
+    assert all(p["authors"] == ["Ada"] for r in enriched for p in r["papers"])
+    assert "Ada" in enriched[0]["digest"]
@@ -0,0 +1,81 @@
+"""Tests for Deadline."""
+
+import pytest
+
+from deadline import Deadline, DeadlineExceeded, parse_duration, DEFAULT_TIMEOUT
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_parse_duration():
+    """Test supported duration formats."""
+    assert parse_duration("20s") == 20.0
+    assert parse_duration("1.5m") == 90.0
+    assert parse_duration("500ms") == pytest.approx(0.5)
+    assert parse_duration("3h") == 10800.0
+    assert parse_duration("12") == 12.0
+
+
+def test_parse_duration_invalid():
+    """Test that malformed durations are rejected."""
+    with pytest.raises(ValueError):
+        parse_duration("soon")
+
+
+def test_no_deadline_uses_default_timeout():
+    """Test that runs without a deadline keep the default request timeout."""
+    deadline = Deadline(None)
+    assert deadline.timeout(share=0.4) == DEFAULT_TIMEOUT
+    assert deadline.allows()
+    assert not deadline.expired()
+
+
+def test_budget_is_split_and_consumed():
+    """Test that stage timeouts shrink as the budget is used."""
+    clock = FakeClock()
+    deadline = Deadline(20, clock=clock)
+    assert deadline.timeout(share=0.5) == 10.0
+
+    clock.now = 15.0
+    assert deadline.remaining() == 5.0
+    assert deadline.timeout(share=0.4) == 2.0
+    assert deadline.allows(share=0.4)
+    assert not deadline.allows(share=0.1)
+
+
+def test_expired_deadline():
+    """Test that an exhausted budget never goes negative."""
+    clock = FakeClock()
+    deadline = Deadline(5, clock=clock)
+    clock.now = 8.0
+    assert deadline.remaining() == 0.0
+    assert deadline.expired()
+    assert not deadline.allows()
+
+
+def test_limit_cuts_off_a_trickling_stream():
+    """Test that limit() raises once a stage's share of the budget is used."""
+    clock = FakeClock()
+    stage = Deadline(20, clock=clock).stage(share=0.5)
+
+    def chunks():
+        for i in range(100):
+            clock.now += 1.0
+            yield i
+
+    received = []
+    with pytest.raises(DeadlineExceeded):
+        for chunk in stage.limit(chunks()):
+            received.append(chunk)
+    assert len(received) == 9
+
+
+def test_limit_without_deadline_passes_everything():
+    """Test that no deadline means no cut-off."""
+    assert list(Deadline().stage(share=0.4).limit(range(5))) == [0, 1, 2, 3, 4]
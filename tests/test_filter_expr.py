@@ -0,0 +1,97 @@
+"""Tests for filter expressions."""
+
+import pytest
+
+from filter_expr import FilterExpression, FilterError
+
+
+@pytest.fixture
+def paper():
+    return {
+        "arxiv_id": "2501.12345",
+        "title": "A Survey of Tool-Using Agents",
+        "abstract": "We review large language model agents.",
+        "upvotes": 42,
+        "published_at": "2026-01-05T10:00:00.000Z",
+    }
+
+
+def test_numeric_and_date_comparisons(paper):
+    """Test upvote thresholds and date ranges."""
+    assert FilterExpression("upvotes >= 42").matches(paper, None)
+    assert not FilterExpression("upvotes > 42").matches(paper, None)
+    assert FilterExpression("published >= 2026-01-01 and published < 2026-02-01").matches(paper, None)
+    assert not FilterExpression("published < 2026-01-05").matches(paper, None)
+
+
+def test_text_keywords_and_regex(paper):
+    """Test contains, regex and negation on text fields."""
+    assert FilterExpression('title contains "agents"').matches(paper, None)
+    assert FilterExpression(r'abstract ~ "language\s+model"').matches(paper, None)
+    assert not FilterExpression('not title ~ "^a survey"').matches(paper, None)
+    assert FilterExpression('text contains "review"').matches(paper, None)
+
+
+def test_regex_escapes_are_kept(paper):
+    """Test that backslash escapes reach the regex and only quotes are unescaped."""
+    assert FilterExpression(r'title ~ "\bAgents\b"').matches(paper, None)
+    assert not FilterExpression(r'title ~ "\bAgent\b"').matches(paper, None)
+    assert FilterExpression(r'title ~ "\d{4}$"').matches({**paper, "title": "Agents 2026"}, None)
+    assert FilterExpression(r'title contains "\"x\""').matches({**paper, "title": 'The "x" factor'}, None)
+
+
+def test_category_boolean_logic(paper):
+    """Test category in/==/!= with globs and boolean operators."""
+    expr = FilterExpression("(category in (cs.AI, cs.MA) or category == stat.*) and category != cs.CV")
+    assert expr.matches(paper, ["cs.AI"])
+    assert expr.matches(paper, ["stat.ML"])
+    assert not expr.matches(paper, ["cs.AI", "cs.CV"])
+    assert not expr.matches(paper, ["cs.CL"])
+
+
+def test_prefilter_defers_category_checks(paper):
+    """Test that unknown categories only reject on cheap checks."""
+    expr = FilterExpression("upvotes >= 10 and category in (cs.AI)")
+    assert expr.needs_categories
+    assert expr.prefilter(paper)
+    assert not expr.prefilter({**paper, "upvotes": 3})
+
+    either = FilterExpression("upvotes >= 100 or category == cs.AI")
+    assert either.prefilter(paper)
+    assert either.matches(paper, None)
+
+
+def test_cheap_checks_short_circuit(paper):
+    """Test that cheap operands run before category checks."""
+    expr = FilterExpression("category == cs.AI and upvotes > 100")
+    calls = []
+
+    class Categories(list):
+        def __iter__(self):
+            calls.append(1)
+            return super().__iter__()
+
+    assert not expr.matches(paper, Categories(["cs.AI"]))
+    assert calls == []
+
+
+def test_keywords_are_case_insensitive(paper):
+    """Test that and/or/not/in/contains ignore case."""
+    assert FilterExpression('upvotes > 1 AND NOT title CONTAINS "diffusion"').matches(paper, None)
+
+
+@pytest.mark.parametrize("source", [
+    "",
+    "stars > 3",
+    "upvotes >=",
+    "upvotes > many",
+    "published > yesterday",
+    "title ~ \"(\"",
+    "category > cs.AI",
+    "(upvotes > 1",
+    "upvotes > 1 upvotes",
+])
+def test_invalid_expressions(source):
+    """Test that malformed expressions raise FilterError."""
+    with pytest.raises(FilterError):
+        FilterExpression(source)
@@ -5,8 +5,11 @@ import json
 import os
 import tempfile
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
+import json_codec
 from history_manager import HistoryManager
+from json_codec import JsonCodec, available_backends
 
 
 @pytest.fixture
@@ -108,6 +111,7 @@ def test_cleanup_old_entries(temp_history_file):
     assert removed == 1
     assert manager.is_sent("old_paper") is False
     assert manager.is_sent("recent_paper") is True
+    assert manager.sent_papers == [{"id": "recent_paper", "sent_at": recent_date}]
 
 
 def test_get_sent_ids(temp_history_file):
@@ -125,3 +129,70 @@ def test_get_sent_ids(temp_history_file):
     ids = manager.get_sent_ids()
     
     assert ids == {"2501.12345", "2501.67890"}
+
+
+def test_sent_index_tracks_add_and_cleanup(temp_history_file):
+    """Test that the packed membership index follows add() and cleanup()."""
+    old_date = (datetime.now() - timedelta(days=35)).strftime("%Y-%m-%d")
+    with open(temp_history_file, 'w') as f:
+        json.dump({"sent_papers": [{"id": "2501.00001", "sent_at": old_date}]}, f)
+    
+    manager = HistoryManager(temp_history_file)
+    assert "2501.00001" in manager.sent_index()
+    
+    manager.add(["2501.12345", "cs/0601001"])
+    assert manager.sent_index().contains_many(["2501.12345", "cs/0601001", "2501.99999"]) == [True, True, False]
+    
+    manager.cleanup(days=30)
+    assert "2501.00001" not in manager.sent_index()
+    assert manager.is_sent("2501.12345") is True
+    assert [p["id"] for p in manager.sent_papers] == ["2501.12345", "cs/0601001"]
+
+
+def test_save_round_trips_packed_and_unpacked_records(temp_history_file):
+    """Test that packed and dict records survive a save in their original order."""
+    records = [
+        {"id": "cs/0601001", "sent_at": "2026-01-04"},
+        {"id": "2501.12345", "sent_at": "2026-01-05"},
+        {"id": "2501.67890"},
+        {"id": "2501.00001", "sent_at": "2026-01-06"},
+    ]
+    with open(temp_history_file, 'w') as f:
+        json.dump({"sent_papers": records}, f)
+    
+    manager = HistoryManager(temp_history_file)
+    manager.save()
+    
+    with open(temp_history_file, 'r') as f:
+        assert json.load(f)["sent_papers"] == records
+    assert manager.load() == records
+    assert manager.get_sent_ids() == {"2501.12345", "cs/0601001", "2501.67890", "2501.00001"}
+
+
+def test_add_updates_index_in_one_batch(temp_history_file):
+    """Test that add() inserts all new IDs with a single index update."""
+    manager = HistoryManager(temp_history_file)
+    manager.add(["2501.00001"])
+    index = manager.sent_index()
+    
+    with patch.object(index, "add_many", wraps=index.add_many) as add_many:
+        manager.add(["2501.00002", "2501.00001", "2501.00003", "2501.00002"])
+    
+    add_many.assert_called_once_with(["2501.00002", "2501.00003"])
+    assert len(manager.sent_papers) == 3
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_null_fields_do_not_reset_history(temp_history_file, backend):
+    """Test that a record with null fields loads and is kept on save with every backend."""
+    records = [{"id": "2501.12345", "sent_at": None}, {"id": "2501.67890", "sent_at": "2026-01-05"}]
+    with open(temp_history_file, 'w') as f:
+        json.dump({"sent_papers": records}, f)
+    
+    with patch.object(json_codec, "_default", JsonCodec(backend)):
+        manager = HistoryManager(temp_history_file)
+        manager.save()
+    
+    assert manager.is_sent("2501.12345") is True
+    with open(temp_history_file, 'r') as f:
+        assert sorted(json.load(f)["sent_papers"], key=lambda p: p["id"]) == records
@@ -1,12 +1,20 @@
 """Tests for HuggingFaceClient."""
 
+import json
 import pytest
 from unittest.mock import MagicMock, patch
 from datetime import datetime, timedelta
 
+from deadline import Deadline, DeadlineExceeded
 from huggingface_client import HuggingFaceClient, Paper
 
 
+def stream_chunks(items, size=16):
+    """Serialize items and split the body into small byte chunks."""
+    body = json.dumps(items).encode()
+    return iter([body[i:i + size] for i in range(0, len(body), size)])
+
+
 @pytest.fixture
 def client():
     return HuggingFaceClient()
@@ -51,7 +59,7 @@ def test_fetch_papers_returns_top_n(client, mock_api_response):
     """Test that fetch_papers returns top N papers sorted by upvotes."""
     with patch('huggingface_client.requests.get') as mock_get:
         mock_response = MagicMock()
-        mock_response.json.return_value = mock_api_response
+        mock_response.iter_content.return_value = stream_chunks(mock_api_response)
         mock_response.raise_for_status = MagicMock()
         mock_get.return_value = mock_response
         
@@ -68,7 +76,7 @@ def test_fetch_papers_filters_by_date(client, mock_api_response):
     """Test that papers older than days threshold are filtered out."""
     with patch('huggingface_client.requests.get') as mock_get:
         mock_response = MagicMock()
-        mock_response.json.return_value = mock_api_response
+        mock_response.iter_content.return_value = stream_chunks(mock_api_response)
         mock_response.raise_for_status = MagicMock()
         mock_get.return_value = mock_response
         
@@ -93,7 +101,7 @@ def test_paper_structure(client, mock_api_response):
     """Test that returned papers have correct structure."""
     with patch('huggingface_client.requests.get') as mock_get:
         mock_response = MagicMock()
-        mock_response.json.return_value = mock_api_response
+        mock_response.iter_content.return_value = stream_chunks(mock_api_response)
         mock_response.raise_for_status = MagicMock()
         mock_get.return_value = mock_response
         
@@ -107,3 +115,63 @@ def test_paper_structure(client, mock_api_response):
         assert "abstract" in paper
         assert "published_at" in paper
         assert paper["link"].startswith("https://huggingface.co/papers/")
+
+
+def test_fetch_papers_for_date(client, mock_api_response):
+    """Test fetching a single day passes the date and keeps every paper."""
+    with patch('huggingface_client.requests.get') as mock_get:
+        mock_response = MagicMock()
+        mock_response.iter_content.return_value = stream_chunks(mock_api_response)
+        mock_response.raise_for_status = MagicMock()
+        mock_get.return_value = mock_response
+        
+        papers = client.fetch_papers_for_date("2025-01-10")
+        
+        assert mock_get.call_args[1]["params"] == {"date": "2025-01-10"}
+        assert len(papers) == 3
+
+
+def test_fetch_streams_response(client, mock_api_response):
+    """Test that the body is read with stream=True and the response is closed."""
+    with patch('huggingface_client.requests.get') as mock_get:
+        mock_response = MagicMock()
+        mock_response.iter_content.return_value = stream_chunks(mock_api_response, size=7)
+        mock_get.return_value = mock_response
+        
+        papers = client.fetch_papers(top_n=5, days=30)
+        
+        assert mock_get.call_args[1]["stream"] is True
+        assert mock_response.close.called
+        assert [p["upvotes"] for p in papers] == [200, 100, 50]
+
+
+def test_truncated_response_raises(client, mock_api_response):
+    """Test that a body cut off mid-stream is an error, not a short list."""
+    with patch('huggingface_client.requests.get') as mock_get:
+        mock_response = MagicMock()
+        body = json.dumps(mock_api_response).encode()
+        mock_response.iter_content.return_value = iter([body[:len(body) // 2]])
+        mock_get.return_value = mock_response
+        
+        with pytest.raises(ValueError):
+            client.fetch_raw()
+
+
+def test_stream_aborts_at_deadline(client, mock_api_response):
+    """Test that a slow body is cut off at the deadline and the response closed."""
+    now = [0.0]
+    deadline = Deadline(5, clock=lambda: now[0])
+
+    def trickle():
+        for chunk in stream_chunks(mock_api_response, size=4):
+            now[0] += 1.0
+            yield chunk
+
+    with patch('huggingface_client.requests.get') as mock_get:
+        mock_response = MagicMock()
+        mock_response.iter_content.return_value = trickle()
+        mock_get.return_value = mock_response
+        
+        with pytest.raises(DeadlineExceeded):
+            list(client.iter_raw(deadline=deadline))
+        assert mock_response.close.called
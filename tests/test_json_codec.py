@@ -0,0 +1,41 @@
+"""Tests for the JSON codec layer."""
+
+import json
+
+import pytest
+
+from json_codec import JsonCodec, available_backends
+
+DATA = {
+    "sent_papers": [{"id": "2501.12345", "sent_at": "2026-01-05"}, {"id": "cs/0601001", "sent_at": "2026-01-04"}],
+    "text": "Ünïcode ✓ and \"quotes\"\n",
+    "empty": [],
+    "nested": {"upvotes": 12, "score": 0.5, "flag": True, "none": None},
+}
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_output_matches_stdlib(backend):
+    """Test that every backend writes the bytes the stdlib json module would."""
+    codec = JsonCodec(backend)
+    assert codec.dumps(DATA, indent=True) == json.dumps(DATA, indent=2, ensure_ascii=False).encode()
+    assert codec.dumps(DATA) == json.dumps(DATA, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_round_trip_and_errors(backend):
+    """Test decoding bytes and text, and ValueError on invalid documents."""
+    codec = JsonCodec(backend)
+    assert codec.loads(codec.dumps(DATA)) == DATA
+    assert codec.loads(json.dumps(DATA)) == DATA
+    with pytest.raises(ValueError):
+        codec.loads(b'{"sent_papers": [')
+
+
+def test_stdlib_backend_always_available():
+    """Test the fallback backend and rejection of unknown backends."""
+    assert available_backends()[-1] == "json"
+    assert JsonCodec("json").loads(b"[1]") == [1]
+    with pytest.raises(ValueError):
+        JsonCodec("yaml")
+
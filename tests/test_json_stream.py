@@ -0,0 +1,49 @@
+"""Tests for streaming JSON decoding."""
+
+import json
+
+import pytest
+
+from json_stream import iter_json_array
+
+
+def chunked(text, size):
+    data = text.encode()
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 3, 64, 100000])
+def test_decodes_across_chunk_boundaries(size):
+    """Test that elements, numbers and multi-byte characters split across chunks decode."""
+    items = [{"id": i, "title": "Ünïcode ✓ " * i, "score": 12345.5, "tags": [None, True]} for i in range(20)]
+    items += [987654321, "tail"]
+    body = json.dumps(items, ensure_ascii=False, indent=1)
+    assert list(iter_json_array(chunked(body, size))) == items
+
+
+def test_yields_before_stream_ends():
+    """Test that the first element is available before later chunks are read."""
+    read = []
+
+    def chunks():
+        for chunk in ['[{"a": 1}', ', {"a": 2}', ']']:
+            read.append(chunk)
+            yield chunk
+
+    stream = iter_json_array(chunks())
+    assert next(stream) == {"a": 1}
+    assert len(read) == 1
+    assert list(stream) == [{"a": 2}]
+
+
+def test_empty_array_and_text_chunks():
+    """Test empty arrays and str chunks with surrounding whitespace."""
+    assert list(iter_json_array([b"[]"])) == []
+    assert list(iter_json_array([" [ 1 ,", " 2 ] \n"])) == [1, 2]
+
+
+@pytest.mark.parametrize("body", ["", "{}", "[1,", "[1 2]", "[1,]", "[1]x"])
+def test_malformed_input_raises(body):
+    """Test that malformed or truncated arrays raise ValueError."""
+    with pytest.raises(ValueError):
+        list(iter_json_array([body.encode()]))
@@ -0,0 +1,46 @@
+"""Tests for NdjsonWriter."""
+
+import io
+import json
+
+from ndjson_writer import NdjsonWriter, NullWriter
+
+
+def test_emit_writes_one_record_per_paper():
+    """Test that each paper becomes a JSON line tagged with stage and rank."""
+    stream = io.StringIO()
+    writer = NdjsonWriter(stream)
+    writer.emit("fetch", [{"arxiv_id": "1", "upvotes": 5}, {"arxiv_id": "2", "upvotes": 3}])
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [r["arxiv_id"] for r in records] == ["1", "2"]
+    assert records[0]["stage"] == "fetch"
+    assert records[1]["rank"] == 2
+    assert records[0]["upvotes"] == 5
+
+
+def test_emit_includes_resolved_categories():
+    """Test that categories resolved earlier are attached to later records."""
+    stream = io.StringIO()
+    writer = NdjsonWriter(stream)
+    writer.set_categories({"1": ["cs.AI"]})
+    writer.emit("category", [{"arxiv_id": "1"}, {"arxiv_id": "2", "categories": ["cs.CL"]}])
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert records[0]["categories"] == ["cs.AI"]
+    assert records[1]["categories"] == ["cs.CL"]
+
+
+def test_emit_empty_stage_writes_nothing():
+    """Test that an empty stage produces no output."""
+    stream = io.StringIO()
+    NdjsonWriter(stream).emit("selected", [])
+    assert stream.getvalue() == ""
+
+
+def test_null_writer_is_silent(capsys):
+    """Test that the disabled writer ignores everything."""
+    writer = NullWriter()
+    writer.set_categories({"1": ["cs.AI"]})
+    writer.emit("fetch", [{"arxiv_id": "1"}])
+    assert capsys.readouterr().out == ""
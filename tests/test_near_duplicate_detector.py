@@ -0,0 +1,115 @@
+"""Tests for NearDuplicateDetector."""
+
+import pytest
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+from near_duplicate_detector import NearDuplicateDetector
+
+
+ABSTRACT = (
+    "We introduce a framework in which large language model agents learn to call "
+    "external tools, plan multi-step workflows and recover from execution errors "
+    "on a new benchmark of realistic software engineering tasks."
+)
+
+
+@pytest.fixture
+def index_path():
+    """Create a temporary LSH index path."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield os.path.join(tmpdir, "lsh_index.json")
+
+
+@pytest.fixture
+def sent_paper():
+    return {"arxiv_id": "2501.00001", "title": "Tool-Using Agents", "abstract": ABSTRACT}
+
+
+def test_detects_resubmission(index_path, sent_paper):
+    """Test that a lightly edited resubmission is detected."""
+    detector = NearDuplicateDetector(index_path)
+    detector.add([sent_paper])
+
+    variant = {
+        "arxiv_id": "2502.00002",
+        "title": "Tool-Using Agents (Extended)",
+        "abstract": ABSTRACT + " Code is available.",
+    }
+    match = detector.find_duplicate(variant)
+    assert match is not None
+    assert match[0] == "2501.00001"
+
+
+def test_unrelated_paper_not_flagged(index_path, sent_paper):
+    """Test that an unrelated paper is kept."""
+    detector = NearDuplicateDetector(index_path)
+    detector.add([sent_paper])
+
+    other = {
+        "arxiv_id": "2502.00003",
+        "title": "Diffusion Samplers",
+        "abstract": "A fast ODE sampler for high resolution image diffusion models.",
+    }
+    assert detector.find_duplicate(other) is None
+    assert detector.filter([other]) == [other]
+
+
+def test_filter_dedups_within_batch(index_path):
+    """Test that near-identical papers in the same batch keep only the first."""
+    detector = NearDuplicateDetector(index_path)
+    first = {"arxiv_id": "a", "title": "Agents", "abstract": ABSTRACT}
+    second = {"arxiv_id": "b", "title": "Agents", "abstract": ABSTRACT}
+
+    assert detector.filter([first, second]) == [first]
+
+
+def test_save_and_load(index_path, sent_paper):
+    """Test that signatures persist and buckets are rebuilt."""
+    detector = NearDuplicateDetector(index_path)
+    detector.add([sent_paper])
+    detector.save()
+
+    reloaded = NearDuplicateDetector(index_path)
+    assert "2501.00001" in reloaded.entries
+    assert reloaded.find_duplicate({"title": "Tool-Using Agents", "abstract": ABSTRACT}) is not None
+
+
+@pytest.mark.parametrize("params", [
+    {"num_perm": 32, "bands": 8},
+    {"bands": 8},
+    {"seed": 2},
+    {"shingle_size": 2},
+])
+def test_changed_parameters_reset_index(index_path, sent_paper, params):
+    """Test that signatures built with other parameters are discarded."""
+    detector = NearDuplicateDetector(index_path)
+    detector.add([sent_paper])
+    detector.save()
+
+    reloaded = NearDuplicateDetector(index_path, **params)
+    assert reloaded.entries == {}
+    assert reloaded.find_duplicate(sent_paper) is None
+
+
+def test_cleanup_old_entries(index_path, sent_paper):
+    """Test cleanup removes old signatures from the index."""
+    detector = NearDuplicateDetector(index_path)
+    old_date = (datetime.now() - timedelta(days=35)).strftime("%Y-%m-%d")
+    with open(index_path, 'w') as f:
+        json.dump({
+            **detector._params(),
+            "papers": {"old": {"sig": detector.signature(ABSTRACT), "sent_at": old_date}}
+        }, f)
+
+    detector.load()
+    assert detector.cleanup(days=30) == 1
+    assert detector.find_duplicate({"title": "", "abstract": ABSTRACT}) is None
+
+
+def test_invalid_band_configuration(index_path):
+    """Test that num_perm must be divisible by bands."""
+    with pytest.raises(ValueError):
+        NearDuplicateDetector(index_path, num_perm=10, bands=3)
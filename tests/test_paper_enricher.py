@@ -0,0 +1,168 @@
+"""Tests for PaperEnricher."""
+
+import pytest
+import os
+import tempfile
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from deadline import Deadline
+from paper_enricher import PaperEnricher, parse_details
+
+
+@pytest.fixture
+def details_path():
+    """Create a temporary details cache path."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield os.path.join(tmpdir, "paper_details.json")
+
+
+@pytest.fixture
+def papers():
+    return [
+        {"arxiv_id": "2501.00001", "title": "Paper A", "upvotes": 10},
+        {"arxiv_id": "2501.00002", "title": "Paper B", "upvotes": 5},
+    ]
+
+
+def api_response(arxiv_id: str) -> MagicMock:
+    response = MagicMock()
+    response.json.return_value = {
+        "id": arxiv_id,
+        "authors": [{"name": "Ada"}, {"name": "Hidden", "hidden": True}, {"name": "Bob"}],
+        "githubRepo": f"https://github.com/example/{arxiv_id}",
+        "numComments": 3,
+    }
+    return response
+
+
+def fake_get(url, timeout=None):
+    return api_response(url.rsplit("/", 1)[-1])
+
+
+def test_parse_details_skips_hidden_authors():
+    """Test that hidden authors and missing fields are dropped."""
+    details = parse_details(api_response("2501.00001").json())
+
+    assert details["authors"] == ["Ada", "Bob"]
+    assert details["github"] == "https://github.com/example/2501.00001"
+    assert details["project_page"] is None
+    assert details["comments"] == 3
+
+
+def test_enrich_adds_details(details_path, papers):
+    """Test that every selected paper gains details without mutating the input."""
+    enricher = PaperEnricher(details_path)
+    with patch("requests.get", side_effect=fake_get) as mock_get:
+        enriched = enricher.enrich(papers)
+
+    assert mock_get.call_count == 2
+    assert [p["authors"] for p in enriched] == [["Ada", "Bob"], ["Ada", "Bob"]]
+    assert enriched[1]["github"].endswith("2501.00002")
+    assert "authors" not in papers[0]
+
+
+def test_cached_details_skip_requests(details_path, papers):
+    """Test that a saved cache serves fresh entries without network calls."""
+    enricher = PaperEnricher(details_path)
+    with patch("requests.get", side_effect=fake_get):
+        enricher.enrich(papers)
+    enricher.save()
+
+    reloaded = PaperEnricher(details_path)
+    with patch("requests.get") as mock_get:
+        enriched = reloaded.enrich(papers)
+
+    mock_get.assert_not_called()
+    assert enriched[0]["comments"] == 3
+
+
+def test_stale_details_are_refetched(details_path, papers):
+    """Test that entries older than max_age_hours are fetched again."""
+    now = [1000000.0]
+    enricher = PaperEnricher(details_path, max_age_hours=1, clock=lambda: now[0])
+    with patch("requests.get", side_effect=fake_get):
+        enricher.enrich(papers[:1])
+
+    now[0] += 2 * 3600
+    with patch("requests.get", side_effect=fake_get) as mock_get:
+        enricher.enrich(papers)
+
+    assert mock_get.call_count == 2
+
+
+def test_failed_fetch_leaves_paper_unchanged(details_path, papers):
+    """Test that a failing request does not drop or break the paper."""
+    def flaky_get(url, timeout=None):
+        if url.endswith("2501.00002"):
+            raise requests.ConnectionError("boom")
+        return fake_get(url, timeout)
+
+    enricher = PaperEnricher(details_path)
+    with patch("requests.get", side_effect=flaky_get):
+        enriched = enricher.enrich(papers)
+
+    assert enriched[0]["authors"] == ["Ada", "Bob"]
+    assert enriched[1] == papers[1]
+    assert "2501.00002" not in enricher.entries
+
+
+def test_fetches_run_concurrently_within_bound(details_path):
+    """Test that misses are fetched in parallel but never above max_workers."""
+    papers = [{"arxiv_id": f"2501.{i:05d}"} for i in range(8)]
+    lock = threading.Lock()
+    active = [0]
+    peak = [0]
+
+    def slow_get(url, timeout=None):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+        return fake_get(url, timeout)
+
+    enricher = PaperEnricher(details_path, max_workers=3)
+    with patch("requests.get", side_effect=slow_get):
+        enriched = enricher.enrich(papers)
+
+    assert len(enriched) == 8
+    assert 1 < peak[0] <= 3
+
+
+def test_save_drops_expired_entries(details_path, papers):
+    """Test that entries past retention_days are pruned on save."""
+    now = [1000000.0]
+    enricher = PaperEnricher(details_path, retention_days=1, clock=lambda: now[0])
+    with patch("requests.get", side_effect=fake_get):
+        enricher.enrich(papers[:1])
+    now[0] += 2 * 86400
+    with patch("requests.get", side_effect=fake_get):
+        enricher.enrich(papers[1:])
+    enricher.save()
+
+    assert list(PaperEnricher(details_path).entries) == ["2501.00002"]
+
+
+def test_deadline_stops_waiting_for_slow_fetches(details_path, papers):
+    """Test that papers still fetching at the deadline are sent without details."""
+    release = threading.Event()
+
+    def slow_get(url, timeout=None):
+        if url.endswith("2501.00002"):
+            release.wait(timeout=5)
+        return fake_get(url, timeout)
+
+    enricher = PaperEnricher(details_path)
+    try:
+        with patch("requests.get", side_effect=slow_get):
+            enriched = enricher.enrich(papers, deadline=Deadline(0.2))
+    finally:
+        release.set()
+
+    assert enriched[0]["authors"] == ["Ada", "Bob"]
+    assert enriched[1] == papers[1]
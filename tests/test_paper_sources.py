@@ -0,0 +1,151 @@
+"""Tests for paper sources and the merge stage."""
+
+import pytest
+import os
+import tempfile
+import time
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from arxiv_category_client import ArxivCategoryClient
+from circuit_breaker import CircuitBreaker
+from huggingface_client import HuggingFaceClient
+from paper_sources import (
+    ArxivListingSource, PaperMerger, PaperSource, fetch_all, interleave_sources, normalize_arxiv_id
+)
+
+
+class StaticSource(PaperSource):
+    def __init__(self, name, papers, delay=0.0, error=None):
+        self.name = name
+        self.papers = papers
+        self.delay = delay
+        self.error = error
+
+    def fetch(self, timeout=30):
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.papers
+
+
+@pytest.fixture
+def state_path():
+    """Create a temporary arXiv state path."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield os.path.join(tmpdir, "arxiv_state.json")
+
+
+@pytest.fixture
+def listing_response():
+    return '''<?xml version="1.0" encoding="UTF-8"?>
+    <feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">
+        <entry>
+            <id>http://arxiv.org/abs/2501.12345v2</id>
+            <title>Agents
+                That Plan</title>
+            <summary>An abstract.</summary>
+            <published>2025-01-20T18:00:00Z</published>
+            <arxiv:primary_category term="cs.AI"/>
+            <category term="cs.AI"/>
+        </entry>
+    </feed>'''
+
+
+def test_normalize_arxiv_id():
+    """Test prefix, version and case normalization."""
+    assert normalize_arxiv_id("arXiv:2501.12345v2") == "2501.12345"
+    assert normalize_arxiv_id("CS/0601001v1") == "cs/0601001"
+    assert normalize_arxiv_id(None) is None
+
+
+def test_huggingface_client_is_a_source():
+    """Test that HuggingFaceClient implements the source interface."""
+    assert isinstance(HuggingFaceClient(), PaperSource)
+    assert HuggingFaceClient.name == "huggingface"
+
+
+def test_arxiv_listing_source(listing_response):
+    """Test parsing the arXiv listing into papers."""
+    with patch('requests.get') as mock_get:
+        mock_response = MagicMock()
+        mock_response.text = listing_response
+        mock_get.return_value = mock_response
+
+        papers = ArxivListingSource(["cs.AI", "cs.CL"], client=ArxivCategoryClient(hedge=False)).fetch()
+
+    assert mock_get.call_args[1]["params"]["search_query"] == "cat:cs.AI OR cat:cs.CL"
+    assert papers == [{
+        "title": "Agents That Plan",
+        "link": "https://arxiv.org/abs/2501.12345",
+        "upvotes": 0,
+        "abstract": "An abstract.",
+        "published_at": "2025-01-20T18:00:00Z",
+        "arxiv_id": "2501.12345",
+        "categories": ["cs.AI"],
+    }]
+
+
+def test_arxiv_listing_uses_circuit_breaker(state_path):
+    """Test that listing failures open the shared breaker and persist it."""
+    client = ArxivCategoryClient(
+        state_path=state_path, hedge=False, circuit_breaker=CircuitBreaker("arXiv", failure_threshold=1)
+    )
+    source = ArxivListingSource(["cs.AI"], client=client)
+
+    with patch('requests.get', side_effect=requests.ConnectionError("down")):
+        with pytest.raises(requests.ConnectionError):
+            source.fetch()
+    with patch('requests.get') as mock_get:
+        assert source.fetch() == []
+
+    mock_get.assert_not_called()
+    client.save()
+    assert ArxivCategoryClient(state_path=state_path).circuit_breaker.failures == 1
+
+
+def test_interleave_sources_lets_source_only_papers_in():
+    """Test that papers without upvotes alternate with ranked Hugging Face papers."""
+    papers = [
+        {"arxiv_id": "1", "upvotes": 30, "sources": ["huggingface"]},
+        {"arxiv_id": "2", "upvotes": 20, "sources": ["huggingface", "arxiv"]},
+        {"arxiv_id": "3", "upvotes": 10, "sources": ["huggingface"]},
+        {"arxiv_id": "4", "upvotes": 0, "sources": ["arxiv"], "published_at": "2025-01-19T00:00:00Z"},
+        {"arxiv_id": "5", "upvotes": 0, "sources": ["arxiv"], "published_at": "2025-01-20T00:00:00Z"},
+    ]
+
+    assert [p["arxiv_id"] for p in interleave_sources(papers)] == ["1", "5", "2", "4", "3"]
+    assert interleave_sources(papers[:3]) == papers[:3]
+
+
+def test_merger_combines_signals():
+    """Test that duplicates merge upvotes, categories and sources."""
+    merger = PaperMerger()
+    merger.add("huggingface", [{"arxiv_id": "2501.00001", "title": "HF Title", "upvotes": 12}])
+    merger.add("arxiv", [
+        {"arxiv_id": "2501.00001v2", "title": "arXiv Title", "upvotes": 0, "categories": ["cs.AI"]},
+        {"arxiv_id": "2501.00002", "title": "Only arXiv", "upvotes": 0},
+    ])
+
+    papers = merger.papers()
+    assert len(papers) == 2
+    assert papers[0]["title"] == "HF Title"
+    assert papers[0]["upvotes"] == 12
+    assert papers[0]["categories"] == ["cs.AI"]
+    assert papers[0]["sources"] == ["huggingface", "arxiv"]
+
+
+def test_fetch_all_runs_concurrently_and_skips_failures():
+    """Test that sources overlap in time and a failing source is skipped."""
+    sources = [
+        StaticSource("a", [{"arxiv_id": "1"}], delay=0.2),
+        StaticSource("b", [{"arxiv_id": "2"}], delay=0.2),
+        StaticSource("c", [], error=Exception("down")),
+    ]
+    start = time.monotonic()
+    papers = fetch_all(sources)
+    elapsed = time.monotonic() - start
+
+    assert {p["arxiv_id"] for p in papers} == {"1", "2"}
+    assert elapsed < 0.35
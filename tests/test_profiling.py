@@ -0,0 +1,104 @@
+"""Tests for stage profiling."""
+
+import os
+import pstats
+import tempfile
+
+import pytest
+
+from profiling import StageProfiler, NullProfiler, collapse_stats, create_profiler
+
+
+def busy(n):
+    return sum(i * i for i in range(n))
+
+
+@pytest.fixture
+def temp_dir():
+    with tempfile.TemporaryDirectory() as d:
+        yield d
+
+
+def test_cpu_stage_writes_pstats_and_collapsed(temp_dir):
+    """Test that a CPU stage produces a loadable pstats file and collapsed stacks."""
+    profiler = StageProfiler("cpu", temp_dir)
+    with profiler.stage("fetch"):
+        busy(20000)
+
+    pstats_path = [p for p in profiler.written if p.endswith("-fetch.pstats")][0]
+    stats = pstats.Stats(pstats_path)
+    assert any(func[2] == "busy" for func in stats.stats)
+
+    collapsed_path = [p for p in profiler.written if p.endswith("-fetch.collapsed")][0]
+    with open(collapsed_path) as f:
+        lines = f.read().splitlines()
+    assert any("(busy)" in line for line in lines)
+    assert all(int(line.rsplit(" ", 1)[1]) > 0 for line in lines)
+
+
+def test_mem_stage_writes_allocation_report(temp_dir):
+    """Test that a memory stage reports the stage's top allocations."""
+    profiler = StageProfiler("mem", temp_dir)
+    with profiler.stage("filter"):
+        kept = [bytearray(1024) for _ in range(200)]
+
+    [report] = profiler.written
+    assert report.endswith("-filter.allocations.txt")
+    with open(report) as f:
+        text = f.read()
+    assert "Peak traced memory" in text
+    assert "test_profiling.py" in text
+    assert len(kept) == 200
+
+
+def test_stage_reports_written_when_stage_raises(temp_dir):
+    """Test that a failing stage still leaves its profile behind."""
+    profiler = StageProfiler("cpu", temp_dir)
+    with pytest.raises(RuntimeError):
+        with profiler.stage("deliver"):
+            raise RuntimeError("boom")
+    assert all(os.path.exists(p) for p in profiler.written)
+    assert len(profiler.written) == 2
+
+
+def test_collapse_splits_time_across_callers():
+    """Test that shared callees are attributed to each caller by edge time."""
+    root = ("~", 0, "root")
+    a = ("m.py", 1, "a")
+    b = ("m.py", 2, "b")
+    leaf = ("m.py", 3, "leaf")
+    stats = {
+        root: (1, 1, 0.0, 0.004, {}),
+        a: (1, 1, 0.0, 0.001, {root: (1, 1, 0.0, 0.001)}),
+        b: (1, 1, 0.0, 0.003, {root: (1, 1, 0.0, 0.003)}),
+        leaf: (2, 2, 0.004, 0.004, {a: (1, 1, 0.001, 0.001), b: (1, 1, 0.003, 0.003)}),
+    }
+    assert collapse_stats(stats) == [
+        "root;m.py:2(b);m.py:3(leaf) 3000",
+        "root;m.py:1(a);m.py:3(leaf) 1000",
+    ]
+
+
+def test_profiler_from_environment(temp_dir, monkeypatch):
+    """Test the env-var equivalents and the disabled default."""
+    monkeypatch.delenv("NOTIFICATOR_PROFILE", raising=False)
+    assert isinstance(create_profiler(), NullProfiler)
+
+    monkeypatch.setenv("NOTIFICATOR_PROFILE", "MEM")
+    monkeypatch.setenv("NOTIFICATOR_PROFILE_DIR", temp_dir)
+    profiler = create_profiler()
+    assert profiler.mode == "mem"
+    assert profiler.output_dir == temp_dir
+    assert create_profiler("cpu").mode == "cpu"
+
+    monkeypatch.setenv("NOTIFICATOR_PROFILE", "gpu")
+    with pytest.raises(ValueError):
+        create_profiler()
+
+
+def test_null_profiler_is_a_no_op():
+    """Test that the disabled profiler reuses one no-op context."""
+    profiler = NullProfiler()
+    assert profiler.stage("fetch") is profiler.stage("filter")
+    with profiler.stage("fetch"):
+        pass
@@ -0,0 +1,35 @@
+"""Tests for RateLimiter."""
+
+from rate_limiter import RateLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_first_call_does_not_wait():
+    """Test that the first call proceeds immediately."""
+    clock = FakeClock()
+    limiter = RateLimiter(min_interval=3.0, clock=clock, sleep=clock.sleep)
+    limiter.wait()
+    assert clock.sleeps == []
+
+
+def test_calls_are_spaced():
+    """Test that consecutive calls are spaced by min_interval."""
+    clock = FakeClock()
+    limiter = RateLimiter(min_interval=3.0, clock=clock, sleep=clock.sleep)
+    limiter.wait()
+    clock.now += 1.0
+    limiter.wait()
+    limiter.wait()
+    assert clock.sleeps == [2.0, 3.0]
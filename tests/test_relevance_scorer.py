@@ -0,0 +1,128 @@
+"""Tests for RelevanceScorer."""
+
+import pytest
+import json
+import os
+import tempfile
+
+from relevance_scorer import RelevanceScorer, load_profiles
+
+
+@pytest.fixture
+def cache_path():
+    """Create a temporary IDF cache path."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield os.path.join(tmpdir, "idf_cache.json")
+
+
+@pytest.fixture
+def papers():
+    return [
+        {
+            "arxiv_id": "2501.00001",
+            "title": "Tool Use for LLM Agents",
+            "abstract": "We study language model agents that call external tools and APIs."
+        },
+        {
+            "arxiv_id": "2501.00002",
+            "title": "Diffusion Models for Image Synthesis",
+            "abstract": "A new sampler for high resolution image diffusion."
+        },
+        {
+            "arxiv_id": "2501.00003",
+            "title": "Multi-Agent Planning",
+            "abstract": "Cooperative agents plan jointly with a shared memory."
+        },
+    ]
+
+
+@pytest.fixture
+def profiles():
+    return {
+        "agents": {"keywords": ["agents", "tool use", "tools"]},
+        "vision": {"keywords": ["image", "diffusion"]},
+    }
+
+
+def test_score_matches_profiles(cache_path, papers, profiles):
+    """Test that each paper scores highest against its topical profile."""
+    scorer = RelevanceScorer(cache_path)
+    scorer.update(papers)
+    scores = scorer.score(papers, profiles)
+
+    assert scores[0]["agents"] > scores[0]["vision"]
+    assert scores[1]["vision"] > scores[1]["agents"]
+    assert scores[1]["agents"] == 0.0
+
+
+def test_filter_drops_irrelevant(cache_path, papers):
+    """Test that filter keeps only papers above the threshold."""
+    scorer = RelevanceScorer(cache_path)
+    kept = scorer.filter(papers, {"agents": {"keywords": ["agents", "tools"]}}, min_score=0.1)
+
+    ids = [p["arxiv_id"] for p in kept]
+    assert ids == ["2501.00001", "2501.00003"]
+    assert kept[0]["profile"] == "agents"
+    assert 0 < kept[0]["relevance"] <= 1
+
+
+def test_vectorize_is_normalized(cache_path):
+    """Test that vectors have unit length."""
+    scorer = RelevanceScorer(cache_path)
+    vector = scorer.vectorize("agents use tools and agents plan")
+    assert sum(w * w for w in vector.values()) == pytest.approx(1.0)
+    assert scorer.vectorize("") == {}
+
+
+def test_matrix_matches_vectorize(cache_path, papers):
+    """Test that the CSR batch matrix holds the same vectors as vectorize()."""
+    scorer = RelevanceScorer(cache_path)
+    scorer.update(papers)
+    texts = [p["title"] + "\n" + p["abstract"] for p in papers] + [""]
+    matrix = scorer.matrix(texts)
+
+    assert matrix.shape == (4, len(matrix.terms))
+    for i, text in enumerate(texts):
+        row = matrix.row(i)
+        expected = scorer.vectorize(text)
+        assert {matrix.terms[j]: row[j] for j in row.nonzero()[0]} == pytest.approx(expected)
+
+
+def test_seen_limit_decays_document_frequencies(cache_path, papers):
+    """Test that forgetting old papers also shrinks num_docs and doc_freq."""
+    scorer = RelevanceScorer(cache_path, max_seen=2)
+    scorer.update(papers)
+    scorer.save()
+
+    reloaded = RelevanceScorer(cache_path, max_seen=2)
+    assert list(reloaded.seen_ids) == ["2501.00002", "2501.00003"]
+    assert reloaded.num_docs == 2
+    assert reloaded.doc_freq["agents"] == pytest.approx(2 * 2 / 3, abs=1e-3)
+
+    # A forgotten paper is counted again, but the totals stay bounded
+    assert reloaded.update(papers[:1]) == 1
+    assert reloaded.num_docs == 2
+
+
+def test_cache_persists_document_frequencies(cache_path, papers):
+    """Test that saved statistics are reused and papers are counted once."""
+    scorer = RelevanceScorer(cache_path)
+    scorer.update(papers)
+    scorer.save()
+
+    reloaded = RelevanceScorer(cache_path)
+    assert reloaded.num_docs == 3
+    assert reloaded.update(papers) == 0
+    assert reloaded.doc_freq["agents"] == 2
+
+
+def test_load_profiles(cache_path):
+    """Test loading profiles and rejecting empty ones."""
+    with open(cache_path, 'w') as f:
+        json.dump({"profiles": {"agents": {"keywords": ["agent"]}, "empty": {}}}, f)
+    assert list(load_profiles(cache_path)) == ["agents"]
+
+    with open(cache_path, 'w') as f:
+        json.dump({"profiles": {"empty": {}}}, f)
+    with pytest.raises(ValueError):
+        load_profiles(cache_path)
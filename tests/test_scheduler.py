@@ -0,0 +1,154 @@
+"""Tests for the delivery scheduler."""
+
+import os
+import tempfile
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from scheduler import LatencyModel, Scheduler, next_delivery, SAFETY_MARGIN
+
+
+def subscription(name, deliver_at, timezone="UTC"):
+    return {"name": name, "deliver_at": deliver_at, "timezone": timezone}
+
+
+def timestamp(text, timezone="UTC"):
+    return datetime.fromisoformat(text).replace(tzinfo=ZoneInfo(timezone)).timestamp()
+
+
+class FakeClock:
+    """Wall clock advanced only by sleep()."""
+
+    def __init__(self, now):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def latency_path():
+    with tempfile.TemporaryDirectory() as d:
+        yield os.path.join(d, "stage_latency.json")
+
+
+def test_next_delivery_uses_local_time():
+    """Test today/tomorrow rollover and time zone conversion."""
+    now = timestamp("2026-03-01T10:00:00")
+
+    assert next_delivery(subscription("a", "11:30"), now) == timestamp("2026-03-01T11:30:00")
+    assert next_delivery(subscription("a", "09:00"), now) == timestamp("2026-03-02T09:00:00")
+    # 09:00 in Tokyo is 00:00 UTC, already past
+    tokyo = subscription("t", "09:00", "Asia/Tokyo")
+    assert next_delivery(tokyo, now) == timestamp("2026-03-02T09:00:00", "Asia/Tokyo")
+
+
+def test_next_delivery_follows_daylight_saving():
+    """Test that a local time keeps its wall-clock time across a DST change."""
+    sub = subscription("ny", "09:00", "America/New_York")
+    first = next_delivery(sub, timestamp("2026-03-07T08:00:00", "America/New_York"))
+    second = next_delivery(sub, first)
+
+    assert second - first == 23 * 3600
+
+
+def test_batches_group_nearby_delivery_times():
+    """Test that subscriptions within the window share one batch, in due order."""
+    clock = FakeClock(timestamp("2026-03-01T00:00:00"))
+    subscriptions = [
+        subscription("late", "17:00"),
+        subscription("b", "09:10"),
+        subscription("a", "09:00"),
+        subscription("tokyo", "18:05", "Asia/Tokyo"),
+    ]
+    scheduler = Scheduler(subscriptions, None, None, window_minutes=15, clock=clock, sleep=clock.sleep)
+
+    due, batch = scheduler.next_batch()
+    assert due == timestamp("2026-03-01T09:00:00")
+    assert [s["name"] for s in batch] == ["a", "tokyo", "b"]
+    assert [s["name"] for s in scheduler.next_batch()[1]] == ["late"]
+
+
+def test_upstream_calls_scale_with_windows():
+    """Test that many subscriptions in two windows cost two prepares per day."""
+    clock = FakeClock(timestamp("2026-03-01T00:00:00"))
+    subscriptions = [subscription(f"eu{i}", "08:00") for i in range(10)]
+    subscriptions += [subscription(f"us{i}", "14:00") for i in range(10)]
+    prepared = []
+    delivered = []
+
+    def prepare(batch):
+        prepared.append(clock.now)
+        return [s["name"] for s in batch]
+
+    def deliver(batch, names):
+        delivered.append((clock.now, names))
+        return {"delivered": names, "empty": [], "failed": []}
+
+    scheduler = Scheduler(subscriptions, prepare, deliver, clock=clock, sleep=clock.sleep)
+    failures = scheduler.run(max_batches=4)
+
+    assert failures == 0
+    assert len(prepared) == 4
+    assert [len(names) for _, names in delivered] == [10, 10, 10, 10]
+    assert len(scheduler.queue) == 20
+
+
+def test_batches_start_early_by_measured_latency(latency_path):
+    """Test that work starts lead_time() ahead and delivery lands on time."""
+    clock = FakeClock(timestamp("2026-03-01T00:00:00"))
+    latency = LatencyModel(latency_path)
+    for stage, seconds in {"gather": 40.0, "process": 10.0, "enrich": 6.0, "deliver": 4.0}.items():
+        latency.observe(stage, seconds)
+    due = timestamp("2026-03-01T09:00:00")
+    starts = []
+
+    def prepare(batch):
+        starts.append(clock.now)
+        clock.now += 20
+
+    def deliver(batch, prepared):
+        starts.append(clock.now)
+        clock.now += 4
+        return {"failed": []}
+
+    scheduler = Scheduler([subscription("a", "09:00")], prepare, deliver, latency=latency, clock=clock, sleep=clock.sleep)
+    scheduler.run(max_batches=1)
+
+    assert starts == [due - SAFETY_MARGIN * 60.0, due - 4.0]
+    assert LatencyModel(latency_path).estimate("gather") == 40.0
+
+
+def test_failed_batch_is_requeued():
+    """Test that errors and failed deliveries are counted and the batch runs again tomorrow."""
+    clock = FakeClock(timestamp("2026-03-01T00:00:00"))
+
+    def prepare(batch):
+        raise RuntimeError("upstream down")
+
+    scheduler = Scheduler([subscription("a", "09:00")], prepare, None, clock=clock, sleep=clock.sleep)
+
+    assert scheduler.run(max_batches=1) == 1
+    assert scheduler.queue[0][0] == timestamp("2026-03-02T09:00:00")
+
+
+def test_latency_model_moving_average(latency_path):
+    """Test EMA updates, defaults and recovery from a corrupt file."""
+    latency = LatencyModel(latency_path, alpha=0.5)
+    default = latency.estimate("gather")
+    latency.observe("gather", 10.0)
+    latency.observe("gather", 20.0)
+
+    assert default > 0
+    assert latency.estimate("gather") == 15.0
+
+    with open(latency_path, "w") as f:
+        f.write("{not json")
+    assert LatencyModel(latency_path).estimates == {}
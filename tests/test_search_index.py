@@ -0,0 +1,126 @@
+"""Tests for SearchIndex."""
+
+import pytest
+import os
+import tempfile
+
+from search_index import SearchIndex
+
+
+@pytest.fixture
+def index_path():
+    """Create a temporary search index path."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield os.path.join(tmpdir, "search_index.json")
+
+
+@pytest.fixture
+def papers():
+    return [
+        {
+            "arxiv_id": "2501.00001",
+            "title": "Tool Use in Language Agents",
+            "abstract": "Agents call tools. Tool use improves agents.",
+            "published_at": "2025-01-10T00:00:00.000Z",
+        },
+        {
+            "arxiv_id": "2502.00002",
+            "title": "Image Diffusion",
+            "abstract": "A diffusion sampler for images.",
+            "published_at": "2025-02-10T00:00:00.000Z",
+        },
+        {
+            "arxiv_id": "2503.00003",
+            "title": "Agents Survey",
+            "abstract": "A survey of autonomous agents.",
+            "published_at": "2025-03-10T00:00:00.000Z",
+        },
+    ]
+
+
+def test_search_ranks_by_bm25(index_path, papers):
+    """Test that the paper with more query term occurrences ranks first."""
+    index = SearchIndex(index_path)
+    index.add(papers)
+
+    results = index.search("tool agents")
+    assert [r["arxiv_id"] for r in results] == ["2501.00001", "2503.00003"]
+    assert results[0]["score"] > results[1]["score"]
+
+
+def test_search_date_and_category_filters(index_path, papers):
+    """Test date range and category filters."""
+    index = SearchIndex(index_path)
+    index.add(papers)
+    index.set_categories({"2501.00001": ["cs.CL"], "2503.00003": ["cs.AI"]})
+
+    assert [r["arxiv_id"] for r in index.search("agents", date_from="2025-02-01")] == ["2503.00003"]
+    assert [r["arxiv_id"] for r in index.search("agents", date_to="2025-02-01")] == ["2501.00001"]
+    assert [r["arxiv_id"] for r in index.search("agents", categories=["cs.AI"])] == ["2503.00003"]
+
+
+def test_mark_sent_and_sent_only(index_path, papers):
+    """Test that sent papers can be found with sent_only."""
+    index = SearchIndex(index_path)
+    index.add(papers)
+    index.mark_sent(["2503.00003"])
+
+    results = index.search("agents", sent_only=True)
+    assert [r["arxiv_id"] for r in results] == ["2503.00003"]
+    assert results[0]["sent_at"]
+
+
+def test_incremental_add_and_persistence(index_path, papers):
+    """Test that unchanged papers are skipped and changed ones re-indexed."""
+    index = SearchIndex(index_path)
+    assert index.add(papers) == 3
+    index.save()
+
+    reloaded = SearchIndex(index_path)
+    assert reloaded.add(papers) == 0
+
+    changed = {**papers[1], "abstract": "Agents generate images."}
+    assert reloaded.add([changed]) == 1
+    assert "2502.00002" not in reloaded.postings.get("sampler", {})
+    assert "2502.00002" in reloaded.postings["agents"]
+
+
+def test_search_empty_query(index_path, papers):
+    """Test that stopword-only queries return nothing."""
+    index = SearchIndex(index_path)
+    index.add(papers)
+    assert index.search("the of and") == []
+
+
+def test_unloaded_index_journals_updates(index_path, papers):
+    """Test that runs with load=False append to the journal and search folds it in."""
+    writer = SearchIndex(index_path, load=False)
+    writer.add(papers)
+    writer.set_categories({"2503.00003": ["cs.AI"]})
+    writer.mark_sent(["2503.00003"], date="2025-03-11")
+    writer.save()
+
+    assert not os.path.exists(index_path)
+    assert os.path.exists(writer.journal_path)
+
+    index = SearchIndex(index_path)
+    results = index.search("agents", categories=["cs.AI"], sent_only=True)
+    assert [r["arxiv_id"] for r in results] == ["2503.00003"]
+    assert results[0]["sent_at"] == "2025-03-11"
+    assert "terms" not in results[0]
+
+    index.save()
+    assert os.path.exists(index_path)
+    assert not os.path.exists(writer.journal_path)
+
+
+def test_large_journal_is_compacted(index_path, papers, monkeypatch):
+    """Test that the writer folds the journal into the index past the size limit."""
+    monkeypatch.setattr("search_index.COMPACT_JOURNAL_BYTES", 10)
+    writer = SearchIndex(index_path, load=False)
+    writer.add(papers)
+    writer.save()
+
+    assert not os.path.exists(writer.journal_path)
+    assert len(SearchIndex(index_path).docs) == 3
+
@@ -1,5 +1,6 @@
 """Tests for SlackClient."""
 
+import json
 import pytest
 from unittest.mock import MagicMock, patch
 
@@ -23,7 +24,8 @@ def test_post_message_success(client):
         
         mock_post.assert_called_once()
         call_args = mock_post.call_args
-        assert call_args[1]["json"] == {"text": "Hello, Slack!"}
+        assert json.loads(call_args[1]["data"]) == {"text": "Hello, Slack!"}
+        assert call_args[1]["headers"]["Content-Type"] == "application/json"
 
 
 def test_post_message_failure(client):
@@ -88,3 +90,51 @@ def test_create_digest_truncates_long_abstract(client):
     assert "..." in digest
     assert len([line for line in digest.split('\n') if 'A' * 200 in line]) == 0
 
+
+
+def test_post_message_timeout(client):
+    """Test that the request timeout can be set per call."""
+    with patch('slack_client.requests.post') as mock_post:
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_post.return_value = mock_response
+        
+        client.post_message("Hello, Slack!", timeout=4.5)
+        
+        assert mock_post.call_args[1]["timeout"] == 4.5
+
+
+def test_create_digest_grouped_by_topic(client):
+    """Test that clustered papers are listed under topic headings."""
+    papers = [
+        {"title": "Agents A", "link": "a", "upvotes": 9, "abstract": ""},
+        {"title": "Diffusion B", "link": "b", "upvotes": 8, "abstract": ""},
+        {"title": "Agents C", "link": "c", "upvotes": 7, "abstract": ""},
+    ]
+    clusters = [
+        {"label": "agents / tools", "papers": [papers[0], papers[2]]},
+        {"label": "diffusion / image", "papers": [papers[1]]},
+    ]
+    
+    digest = client.create_digest(papers, clusters=clusters)
+    
+    assert digest.index("agents / tools") < digest.index("*1. Agents A*") < digest.index("*2. Agents C*")
+    assert digest.index("diffusion / image") < digest.index("*3. Diffusion B*")
+
+
+def test_create_digest_shows_paper_details(client):
+    """Test that enriched fields are rendered and absent ones are omitted."""
+    papers = [
+        {
+            "title": "Enriched", "link": "a", "upvotes": 9, "abstract": "",
+            "authors": ["Ada", "Bob", "Cy", "Dee"], "github": "https://github.com/x/y", "comments": 4,
+        },
+        {"title": "Plain", "link": "b", "upvotes": 3, "abstract": ""},
+    ]
+    
+    digest = client.create_digest(papers)
+    
+    assert "Ada, Bob, Cy et al." in digest
+    assert "https://github.com/x/y" in digest
+    assert "4 comments" in digest
+    assert digest.count("✍️") == 1
@@ -0,0 +1,10 @@
+"""Tests for CLI startup cost."""
+
+from benchmarks.bench_startup import measure_import_time, HEAVY_MODULES
+
+
+def test_help_does_not_import_heavy_modules():
+    """Test that --help loads no client dependencies."""
+    _, modules = measure_import_time(["--help"])
+    assert not [m for m in HEAVY_MODULES if m in modules]
+
@@ -0,0 +1,54 @@
+"""Tests for subscription loading."""
+
+import json
+import os
+import tempfile
+
+import pytest
+
+from subscriptions import load_subscriptions, DEFAULT_DELIVER_AT, DEFAULT_TIMEZONE, DEFAULT_WEBHOOK_ENV
+
+
+def write_json(data):
+    fd, path = tempfile.mkstemp(suffix=".json")
+    with os.fdopen(fd, "w") as f:
+        json.dump(data, f)
+    return path
+
+
+def test_load_normalizes_defaults():
+    """Test defaults and comma-separated categories."""
+    path = write_json({"subscriptions": [
+        {"name": "agents", "categories": "cs.AI, cs.MA"},
+        {"name": "popular", "filter": "upvotes >= 50", "top_n": 3, "webhook_env": "HOOK_POPULAR"},
+    ]})
+    try:
+        agents, popular = load_subscriptions(path)
+    finally:
+        os.remove(path)
+
+    assert agents == {
+        "name": "agents", "categories": ["cs.AI", "cs.MA"], "filter": None,
+        "top_n": 5, "webhook_env": DEFAULT_WEBHOOK_ENV,
+        "deliver_at": DEFAULT_DELIVER_AT, "timezone": DEFAULT_TIMEZONE,
+    }
+    assert popular["top_n"] == 3
+    assert popular["webhook_env"] == "HOOK_POPULAR"
+
+
+@pytest.mark.parametrize("entries", [
+    [],
+    [{"name": "../escape"}],
+    [{"name": "a"}, {"name": "a"}],
+    [{"name": "a", "filter": "upvotes >>= 3"}],
+    [{"name": "a", "deliver_at": "25:00"}],
+    [{"name": "a", "timezone": "Mars/Olympus_Mons"}],
+])
+def test_invalid_subscriptions_raise(entries):
+    """Test empty files, unsafe or duplicate names, bad filters and bad schedules."""
+    path = write_json({"subscriptions": entries})
+    try:
+        with pytest.raises(ValueError):
+            load_subscriptions(path)
+    finally:
+        os.remove(path)
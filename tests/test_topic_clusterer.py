@@ -0,0 +1,62 @@
+"""Tests for TopicClusterer."""
+
+from topic_clusterer import TopicClusterer
+
+
+def make_paper(title, abstract, upvotes=0):
+    return {"title": title, "abstract": abstract, "upvotes": upvotes}
+
+
+PAPERS = [
+    make_paper("Tool-using LLM agents", "Agents plan tool calls in interactive environments.", 90),
+    make_paper("Video diffusion models", "Diffusion denoising generates long video clips.", 80),
+    make_paper("Multi-agent planning", "Agents coordinate planning with tools and rewards.", 70),
+    make_paper("Latent diffusion sampling", "Faster sampling for latent diffusion image generation.", 60),
+    make_paper("Agent benchmarks", "Benchmarking agents on tool environments.", 50),
+    make_paper("Diffusion distillation", "Distilling diffusion models for image generation.", 40),
+]
+
+
+def test_groups_papers_by_topic():
+    """Test that papers sharing vocabulary land in the same cluster."""
+    groups = TopicClusterer(num_clusters=2).cluster(PAPERS)
+
+    titles = [{p["title"] for p in group["papers"]} for group in groups]
+    assert {"Tool-using LLM agents", "Multi-agent planning", "Agent benchmarks"} in titles
+    assert {"Video diffusion models", "Latent diffusion sampling", "Diffusion distillation"} in titles
+
+
+def test_groups_ordered_by_rank_with_labels():
+    """Test group order, in-group order and labels from centroid terms."""
+    groups = TopicClusterer(num_clusters=2).cluster(PAPERS)
+
+    assert groups[0]["papers"][0]["title"] == "Tool-using LLM agents"
+    assert [p["upvotes"] for p in groups[1]["papers"]] == [80, 60, 40]
+    assert "agents" in groups[0]["label"]
+    assert "diffusion" in groups[1]["label"]
+    assert all(p["topic"] == group["label"] for group in groups for p in group["papers"])
+
+
+def test_deterministic():
+    """Test that repeated runs give identical clusters."""
+    first = TopicClusterer().cluster(PAPERS * 5)
+    second = TopicClusterer().cluster(PAPERS * 5)
+    assert first == second
+
+
+def test_choose_k():
+    """Test the automatic number of clusters and its bounds."""
+    clusterer = TopicClusterer(max_clusters=4)
+    assert clusterer.choose_k(1) == 1
+    assert clusterer.choose_k(8) == 2
+    assert clusterer.choose_k(500) == 4
+    assert TopicClusterer(num_clusters=3).choose_k(2) == 2
+
+
+def test_empty_and_textless_papers():
+    """Test empty input and papers without usable text."""
+    assert TopicClusterer().cluster([]) == []
+    groups = TopicClusterer(num_clusters=1).cluster([make_paper("", ""), make_paper("the", "a")])
+    assert groups[0]["label"] == "Other"
+    assert len(groups[0]["papers"]) == 2
+
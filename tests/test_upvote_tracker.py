@@ -0,0 +1,137 @@
+"""Tests for UpvoteTracker."""
+
+import pytest
+import os
+import random
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+from arxiv_id_codec import decode_arxiv_id
+from upvote_tracker import UpvoteTracker
+
+
+@pytest.fixture
+def snapshot_file():
+    """Create a temporary snapshot file path."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield os.path.join(tmpdir, "upvote_snapshots.bin")
+
+
+@pytest.fixture
+def now():
+    return datetime(2026, 1, 10, 12, 0, tzinfo=timezone.utc)
+
+
+def test_load_creates_empty_if_not_exists():
+    """Test that a missing snapshot file gives empty snapshots."""
+    tracker = UpvoteTracker("/nonexistent/path/upvote_snapshots.bin")
+    assert len(tracker.codes) == 0
+    assert len(tracker.timestamps) == 0
+
+
+def test_record_appends_and_reloads(snapshot_file, now):
+    """Test that recorded snapshots persist across instances."""
+    tracker = UpvoteTracker(snapshot_file)
+    tracker.record([{"arxiv_id": "2501.11111", "upvotes": 3}], now=now)
+    tracker.record([{"arxiv_id": "2501.11111", "upvotes": 9}], now=now + timedelta(hours=1))
+
+    reloaded = UpvoteTracker(snapshot_file)
+    assert [decode_arxiv_id(c) for c in reloaded.codes] == ["2501.11111", "2501.11111"]
+    assert list(reloaded.upvotes) == [3, 9]
+
+
+def test_record_skips_papers_without_id(snapshot_file, now):
+    """Test that papers without a packable arXiv ID are not recorded."""
+    tracker = UpvoteTracker(snapshot_file)
+    recorded = tracker.record([{"arxiv_id": None, "upvotes": 3}, {"arxiv_id": "cs/0601001", "upvotes": 3}], now=now)
+    assert recorded == 0
+
+
+def test_velocities(snapshot_file, now):
+    """Test velocity from consecutive snapshots."""
+    tracker = UpvoteTracker(snapshot_file)
+    tracker.record([{"arxiv_id": "2601.00001", "upvotes": 0}, {"arxiv_id": "2601.00002", "upvotes": 100}], now=now)
+    tracker.record(
+        [{"arxiv_id": "2601.00001", "upvotes": 20}, {"arxiv_id": "2601.00002", "upvotes": 102}],
+        now=now + timedelta(hours=2)
+    )
+
+    velocities = tracker.velocities()
+    assert velocities["2601.00001"] == pytest.approx(10.0)
+    assert velocities["2601.00002"] == pytest.approx(1.0)
+
+
+def test_rank_trending_prefers_fast_risers(snapshot_file, now):
+    """Test that a fast-rising paper outranks an older paper with more upvotes."""
+    tracker = UpvoteTracker(snapshot_file)
+    tracker.record([{"arxiv_id": "2512.00001", "upvotes": 200}, {"arxiv_id": "2601.00002", "upvotes": 5}], now=now)
+    later = now + timedelta(hours=3)
+    papers = [
+        {"arxiv_id": "2512.00001", "upvotes": 203, "published_at": "2026-01-03T00:00:00.000Z"},
+        {"arxiv_id": "2601.00002", "upvotes": 50, "published_at": "2026-01-10T00:00:00.000Z"},
+    ]
+    tracker.record(papers, now=later)
+
+    ranked = tracker.rank_trending(papers, now=later)
+    assert [p["arxiv_id"] for p in ranked] == ["2601.00002", "2512.00001"]
+    assert ranked[0]["velocity"] == pytest.approx(15.0)
+
+
+def test_rank_trending_falls_back_to_age(snapshot_file, now):
+    """Test that papers with one snapshot are scored by upvotes per hour of age."""
+    tracker = UpvoteTracker(snapshot_file)
+    papers = [{"arxiv_id": "2601.00003", "upvotes": 24, "published_at": "2026-01-09T12:00:00.000Z"}]
+
+    ranked = tracker.rank_trending(papers, now=now)
+    assert ranked[0]["velocity"] == pytest.approx(1.0)
+
+
+def test_prune_removes_old_snapshots(snapshot_file, now):
+    """Test that prune drops old snapshots and compacts the file."""
+    tracker = UpvoteTracker(snapshot_file)
+    tracker.record([{"arxiv_id": "2512.00001", "upvotes": 1}], now=now - timedelta(days=40))
+    tracker.record([{"arxiv_id": "2601.00002", "upvotes": 1}], now=now)
+
+    removed = tracker.prune(days=30, now=now)
+    assert removed == 1
+    assert [decode_arxiv_id(c) for c in UpvoteTracker(snapshot_file).codes] == ["2601.00002"]
+
+
+def reference_velocity(points, half_life_hours):
+    """Sequential moving average the vectorized pass must match."""
+    points = sorted(points, key=lambda p: p[0])
+    velocity = None
+    prev_ts, prev_up = points[0]
+    for ts, up in points[1:]:
+        hours = (ts - prev_ts) / 3600
+        if hours <= 0:
+            continue
+        instant = (up - prev_up) / hours
+        if velocity is None:
+            velocity = instant
+        else:
+            alpha = 1 - 0.5 ** (hours / half_life_hours)
+            velocity = alpha * instant + (1 - alpha) * velocity
+        prev_ts, prev_up = ts, up
+    return velocity
+
+
+def test_velocities_match_sequential_average(snapshot_file, now):
+    """Test the vectorized pass against the step-by-step average on irregular data."""
+    rng = random.Random(7)
+    tracker = UpvoteTracker(snapshot_file)
+    points = {f"2501.{i:05d}": [] for i in range(20)}
+    for step in range(15):
+        at = now + timedelta(hours=step * rng.choice([0.5, 1, 3]))
+        batch = rng.sample(sorted(points), 12)
+        papers = [{"arxiv_id": aid, "upvotes": step * 4 + rng.randint(0, 5)} for aid in batch]
+        tracker.record(papers, now=at)
+        for p in papers:
+            points[p["arxiv_id"]].append((at.timestamp(), p["upvotes"]))
+
+    velocities = tracker.velocities()
+    expected = {aid: reference_velocity(pts, 12.0) for aid, pts in points.items() if len(pts) > 1}
+    expected = {aid: v for aid, v in expected.items() if v is not None}
+    assert velocities.keys() == expected.keys()
+    for aid, v in expected.items():
+        assert velocities[aid] == pytest.approx(v)
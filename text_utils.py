@@ -0,0 +1,52 @@
+"""
+Text Utilities
+
+Tokenization shared by the text-based ranking and filtering stages.
+"""
+
+import re
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*")
+
+STOPWORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been
+before being below between both but by can could did do does doing down during each
+few for from further had has have having he her here hers herself him himself his how
+i if in into is it its itself just me more most my myself no nor not now of off on
+once only or other our ours ourselves out over own same she should so some such than
+that the their theirs them themselves then there these they this those through to too
+under until up very was we were what when where which while who whom why will with
+would you your yours yourself yourselves via based show shows propose proposed paper
+approach results however thus well
+""".split())
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split text into lowercase word tokens without stopwords.
+
+    Args:
+        text: Raw title or abstract text
+
+    Returns:
+        List of tokens (length >= 2, stopwords removed)
+    """
+    if not text:
+        return []
+    return [
+        token for token in TOKEN_PATTERN.findall(text.lower())
+        if len(token) > 1 and token not in STOPWORDS
+    ]
+
+
+def paper_text(paper: dict) -> str:
+    """
+    Concatenate the searchable text fields of a paper.
+
+    Args:
+        paper: Paper dictionary with title and abstract
+
+    Returns:
+        Title and abstract joined by a newline
+    """
+    return f"{paper.get('title') or ''}\n{paper.get('abstract') or ''}"
@@ -0,0 +1,163 @@
+"""
+Topic Clusterer
+
+Groups digest papers by topic with spherical k-means over sparse TF-IDF vectors.
+"""
+
+import math
+import logging
+from typing import Optional
+
+import numpy as np
+
+from relevance_scorer import RelevanceScorer, TfidfMatrix
+from text_utils import paper_text
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize the rows of a dense matrix, leaving zero rows as they are."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1.0, norms)
+
+
+class TopicClusterer:
+    """Deterministic spherical k-means over title and abstract TF-IDF vectors."""
+
+    def __init__(
+        self,
+        num_clusters: Optional[int] = None,
+        max_clusters: int = 8,
+        max_iter: int = 20,
+        label_terms: int = 2
+    ):
+        """
+        Initialize TopicClusterer.
+
+        Args:
+            num_clusters: Fixed number of clusters (None to pick from the batch size)
+            max_clusters: Upper bound when picking the number of clusters
+            max_iter: Maximum k-means iterations
+            label_terms: Centroid terms used in each topic label
+        """
+        self.num_clusters = num_clusters
+        self.max_clusters = max_clusters
+        self.max_iter = max_iter
+        self.label_terms = label_terms
+
+    def choose_k(self, count: int) -> int:
+        """
+        Pick the number of clusters for a batch.
+
+        Args:
+            count: Number of papers
+
+        Returns:
+            num_clusters if set, otherwise round(sqrt(count / 2)) within [1, max_clusters]
+        """
+        k = self.num_clusters or round(math.sqrt(count / 2))
+        return max(1, min(k, self.max_clusters, count))
+
+    def vectorize(self, papers: list[dict]) -> TfidfMatrix:
+        """
+        Build the TF-IDF matrix with document frequencies from the batch itself.
+
+        Args:
+            papers: Papers with title and abstract
+
+        Returns:
+            TfidfMatrix with one L2-normalized row per paper
+        """
+        scorer = RelevanceScorer(cache_path=None)
+        scorer.update([{**paper, "arxiv_id": str(i)} for i, paper in enumerate(papers)])
+        return scorer.matrix([paper_text(paper) for paper in papers])
+
+    def _initial_centroids(self, matrix: TfidfMatrix, k: int) -> np.ndarray:
+        """Farthest-first seeding from the first (highest-ranked) paper."""
+        centroids = [matrix.row(0)]
+        best_sim = matrix.dot(centroids[0][:, None])[:, 0]
+        best_sim[0] = np.inf
+        while len(centroids) < k:
+            # argmin picks the lowest index among ties
+            candidate = int(np.argmin(best_sim))
+            centroids.append(matrix.row(candidate))
+            best_sim = np.maximum(best_sim, matrix.dot(centroids[-1][:, None])[:, 0])
+            best_sim[candidate] = np.inf
+        return np.array(centroids)
+
+    def assign(self, matrix: TfidfMatrix, k: int) -> tuple[list[int], np.ndarray]:
+        """
+        Run spherical k-means until assignments stop changing.
+
+        Each iteration is one sparse-dense product against the centroids
+        followed by an argmax per row.
+
+        Args:
+            matrix: TF-IDF matrix with normalized rows
+            k: Number of clusters
+
+        Returns:
+            (cluster index per row, centroids as a k x terms array)
+        """
+        centroids = self._initial_centroids(matrix, k)
+        labels = None
+        for _ in range(self.max_iter):
+            # argmax picks the lowest cluster among ties
+            new_labels = np.argmax(matrix.dot(centroids.T), axis=1)
+            if labels is not None and np.array_equal(new_labels, labels):
+                break
+            labels = new_labels
+            totals = matrix.sum_rows(labels, k)
+            occupied = np.bincount(labels, minlength=k) > 0
+            centroids[occupied] = _normalize_rows(totals[occupied])
+        return labels.tolist(), centroids
+
+    def label(self, centroid: np.ndarray, terms: list[str]) -> str:
+        """
+        Name a topic by its heaviest centroid terms.
+
+        Args:
+            centroid: Cluster centroid over the matrix columns
+            terms: Term of each column
+
+        Returns:
+            Terms joined by " / " (or "Other" for an empty centroid)
+        """
+        count = min(self.label_terms, len(terms))
+        if count == 0:
+            return "Other"
+        # Only terms tied with or above the count-th weight can make the label
+        threshold = max(np.partition(centroid, -count)[-count], np.finfo(float).tiny)
+        weighted = sorted((-centroid[j], terms[j]) for j in np.flatnonzero(centroid >= threshold))
+        return " / ".join(term for _, term in weighted[:self.label_terms]) or "Other"
+
+    def cluster(self, papers: list[dict]) -> list[dict]:
+        """
+        Group papers by topic.
+
+        Clusters are ordered by their best-ranked paper, and papers keep
+        their input order within a cluster.
+
+        Args:
+            papers: Papers in rank order
+
+        Returns:
+            List of {"label": str, "papers": [...]} groups; each paper gains a "topic" field
+        """
+        if not papers:
+            return []
+
+        matrix = self.vectorize(papers)
+        k = self.choose_k(len(papers))
+        labels, centroids = self.assign(matrix, k)
+
+        groups: dict[int, dict] = {}
+        for paper, label in zip(papers, labels):
+            if label not in groups:
+                groups[label] = {"label": self.label(centroids[label], matrix.terms), "papers": []}
+            group = groups[label]
+            group["papers"].append({**paper, "topic": group["label"]})
+
+        logger.info(f"Clustered {len(papers)} papers into {len(groups)} topics")
+        return list(groups.values())
@@ -0,0 +1,252 @@
+"""
+Upvote Tracker
+
+Records upvote snapshots across runs and ranks papers by smoothed upvote velocity.
+"""
+
+import os
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+import numpy as np
+
+from arxiv_id_codec import decode_arxiv_id, encode_arxiv_id
+
+logger = logging.getLogger(__name__)
+
+# On-disk record: packed arXiv ID (see arxiv_id_codec), UNIX seconds, upvotes
+SNAPSHOT_DTYPE = np.dtype([("code", "<i8"), ("ts", "<i8"), ("upvotes", "<i8")])
+
+
+class UpvoteTracker:
+    """Stores (arxiv_id, timestamp, upvotes) snapshots and scores trending papers."""
+
+    def __init__(self, filepath: str = "upvote_snapshots.bin", half_life_hours: float = 12.0):
+        """
+        Initialize UpvoteTracker.
+
+        Only new-style arXiv IDs (every Hugging Face Daily Paper) are tracked;
+        other papers are ranked by their age velocity.
+
+        Args:
+            filepath: Path to the append-only binary snapshot file
+            half_life_hours: Half-life of the exponential velocity smoothing
+        """
+        self.filepath = filepath
+        self.half_life_hours = half_life_hours
+        self.snapshots = np.empty(0, dtype=SNAPSHOT_DTYPE)
+        self.load()
+
+    @property
+    def codes(self) -> np.ndarray:
+        """Packed arXiv ID column."""
+        return self.snapshots["code"]
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Snapshot time column (UNIX seconds)."""
+        return self.snapshots["ts"]
+
+    @property
+    def upvotes(self) -> np.ndarray:
+        """Upvote count column."""
+        return self.snapshots["upvotes"]
+
+    def load(self) -> int:
+        """
+        Load snapshots from the binary file into a structured array.
+
+        Returns:
+            Number of snapshots loaded
+        """
+        self.snapshots = np.empty(0, dtype=SNAPSHOT_DTYPE)
+
+        if not os.path.exists(self.filepath):
+            logger.info(f"Snapshot file not found, creating new: {self.filepath}")
+            return 0
+
+        try:
+            # A partially written trailing record is ignored
+            count = os.path.getsize(self.filepath) // SNAPSHOT_DTYPE.itemsize
+            self.snapshots = np.fromfile(self.filepath, dtype=SNAPSHOT_DTYPE, count=count)
+        except (IOError, ValueError) as e:
+            logger.warning(f"Failed to load snapshot file: {e}. Starting with empty snapshots.")
+            self.snapshots = np.empty(0, dtype=SNAPSHOT_DTYPE)
+
+        logger.info(f"Loaded {len(self.snapshots)} upvote snapshots")
+        return len(self.snapshots)
+
+    def _write(self) -> None:
+        """Rewrite the snapshot file from memory."""
+        directory = os.path.dirname(self.filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.snapshots.tofile(self.filepath)
+
+    def record(self, papers: list[dict], now: Optional[datetime] = None) -> int:
+        """
+        Append one snapshot per paper to the snapshot file.
+
+        Args:
+            papers: Papers with arxiv_id and upvotes
+            now: Snapshot time (default: current UTC time)
+
+        Returns:
+            Number of snapshots recorded
+        """
+        ts = int((now or datetime.now(timezone.utc)).timestamp())
+        rows = []
+        for paper in papers:
+            code = encode_arxiv_id(paper.get("arxiv_id"))
+            if code is not None:
+                rows.append((code, ts, int(paper.get("upvotes", 0) or 0)))
+
+        if rows:
+            new = np.array(rows, dtype=SNAPSHOT_DTYPE)
+            self.snapshots = np.concatenate([self.snapshots, new])
+            directory = os.path.dirname(self.filepath)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.filepath, 'ab') as f:
+                new.tofile(f)
+
+        logger.info(f"Recorded {len(rows)} upvote snapshots")
+        return len(rows)
+
+    def prune(self, days: int = 30, now: Optional[datetime] = None) -> int:
+        """
+        Drop snapshots older than specified days and compact the file.
+
+        Args:
+            days: Number of days of snapshots to keep
+            now: Reference time (default: current UTC time)
+
+        Returns:
+            Number of snapshots removed
+        """
+        cutoff = ((now or datetime.now(timezone.utc)) - timedelta(days=days)).timestamp()
+        keep = self.snapshots["ts"] >= cutoff
+        removed = len(keep) - int(np.count_nonzero(keep))
+        if removed == 0:
+            return 0
+
+        self.snapshots = self.snapshots[keep]
+        self._write()
+
+        logger.info(f"Removed {removed} old upvote snapshots")
+        return removed
+
+    def velocities(self, arxiv_ids: Optional[set[str]] = None) -> dict[str, float]:
+        """
+        Compute smoothed upvote velocity (upvotes per hour) per paper.
+
+        Consecutive snapshots of a paper give instantaneous velocities, which are
+        folded into an exponential moving average whose weight decays with the
+        time gap between snapshots. Every interval decays the average by
+        0.5 ** (hours / half_life), so the average unrolls into a weighted sum
+        of the instantaneous velocities that is computed for all papers at once.
+
+        Args:
+            arxiv_ids: Restrict computation to these IDs (default: all)
+
+        Returns:
+            Dict mapping arXiv ID to velocity; papers with a single snapshot are omitted
+        """
+        snapshots = self.snapshots
+        if arxiv_ids is not None:
+            wanted = np.unique(np.array(
+                [c for c in map(encode_arxiv_id, arxiv_ids) if c is not None], dtype=np.int64
+            ))
+            if len(wanted) == 0:
+                return {}
+            index = np.minimum(np.searchsorted(wanted, snapshots["code"]), len(wanted) - 1)
+            snapshots = snapshots[wanted[index] == snapshots["code"]]
+        if len(snapshots) < 2:
+            return {}
+
+        # Codes fit in 30 bits and timestamps in 32, so one int64 key orders by (paper, time)
+        key = (snapshots["code"] << 32) | snapshots["ts"]
+        order = np.argsort(key, kind="stable")
+        key = key[order]
+        snapshots = snapshots[order]
+        codes = snapshots["code"]
+        ts = snapshots["ts"].astype(np.float64)
+        ups = snapshots["upvotes"].astype(np.float64)
+
+        # Repeated timestamps of a paper give zero-length intervals; keep the first
+        keep = np.ones(len(key), dtype=bool)
+        keep[1:] = key[1:] != key[:-1]
+        codes, ts, ups = codes[keep], ts[keep], ups[keep]
+
+        # Intervals between consecutive snapshots of the same paper
+        same = codes[1:] == codes[:-1]
+        if not same.any():
+            return {}
+        interval_codes = codes[1:][same]
+        end_ts = ts[1:][same]
+        hours = np.diff(ts)[same] / 3600
+        instant = np.diff(ups)[same] / hours
+
+        starts = np.flatnonzero(np.r_[True, interval_codes[1:] != interval_codes[:-1]])
+        counts = np.diff(np.r_[starts, len(interval_codes)])
+        last_ts = np.repeat(end_ts[starts + counts - 1], counts)
+        decay = 0.5 ** ((last_ts - end_ts) / 3600 / self.half_life_hours)
+        alpha = 1 - 0.5 ** (hours / self.half_life_hours)
+        # The first interval of each paper seeds the average
+        alpha[starts] = 1.0
+        velocity = np.add.reduceat(alpha * decay * instant, starts)
+
+        return {
+            decode_arxiv_id(code): v
+            for code, v in zip(interval_codes[starts].tolist(), velocity.tolist())
+        }
+
+    def rank_trending(self, papers: list[dict], now: Optional[datetime] = None) -> list[dict]:
+        """
+        Sort papers by smoothed upvote velocity (descending).
+
+        Papers without enough snapshots fall back to their average velocity
+        since publication, so brand-new papers can compete on their first run.
+
+        Args:
+            papers: Papers with arxiv_id, upvotes and published_at
+            now: Reference time (default: current UTC time)
+
+        Returns:
+            New list of papers with a "velocity" field, sorted by velocity
+        """
+        now = now or datetime.now(timezone.utc)
+        ids = {p.get("arxiv_id") for p in papers if p.get("arxiv_id")}
+        velocities = self.velocities(ids)
+
+        ranked = []
+        for paper in papers:
+            velocity = velocities.get(paper.get("arxiv_id"))
+            if velocity is None:
+                velocity = self._age_velocity(paper, now)
+            ranked.append({**paper, "velocity": round(velocity, 3)})
+
+        ranked.sort(key=lambda p: (p["velocity"], p.get("upvotes", 0)), reverse=True)
+        return ranked
+
+    def _age_velocity(self, paper: dict, now: datetime) -> float:
+        """
+        Estimate velocity as upvotes divided by hours since publication.
+
+        Args:
+            paper: Paper with upvotes and published_at
+            now: Reference time
+
+        Returns:
+            Upvotes per hour (at least one hour of age is assumed)
+        """
+        upvotes = paper.get("upvotes", 0) or 0
+        try:
+            published = datetime.fromisoformat(paper.get("published_at", "").replace("Z", "+00:00"))
+            if published.tzinfo is None:
+                published = published.replace(tzinfo=timezone.utc)
+            hours = (now - published).total_seconds() / 3600
+        except (ValueError, TypeError, AttributeError):
+            return 0.0
+        return upvotes / max(hours, 1.0)